@@ -0,0 +1,243 @@
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from locator_store import LocatorStore
+from replay_store import ReplayStore
+from restaurant_cache import RestaurantCache
+from timeout_store import TimeoutStore
+from structured_logging import set_log_context, clear_log_context
+from swiggy_automation import SwiggyAutomation, parse_item_spec
+
+# Rough resident memory of one Chrome instance driving the Swiggy site
+MEMORY_PER_BROWSER_MB = 600
+
+# How many times a job is re-run after its browser crashed
+DEFAULT_RETRIES = 2
+
+# One saved login session per account lives here
+SESSIONS_DIR = "sessions"
+
+BATCH_REPORT_FILE = "batch_report.json"
+
+# Separates the entries of an 'items' string, e.g. the CSV cell "Masala Dosa:2;Filter Coffee"
+ITEM_SEPARATOR = ";"
+
+
+def parse_items(items):
+    """Job 'items' as (name, quantity) pairs; entries may be 'NAME:QTY' strings or [name, qty] pairs.
+    A single string (a CSV cell) holds the entries separated by ITEM_SEPARATOR."""
+    if isinstance(items, str):
+        items = [item for item in items.split(ITEM_SEPARATOR) if item.strip()]
+    if not items:
+        return None
+    if not isinstance(items, list):
+        raise ValueError(f"'items' must be a list or a '{ITEM_SEPARATOR}'-separated string, not {items!r}")
+    return [parse_item_spec(item) if isinstance(item, str) else (item[0], int(item[1])) for item in items]
+
+
+def load_jobs(path):
+    """Load (account, restaurant, item or items) jobs from a CSV file or a JSON-lines file"""
+    jobs = []
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+    for index, row in enumerate(rows, 1):
+        if not row.get("account") or not row.get("restaurant"):
+            raise ValueError(f"Job {index} in {path} needs at least 'account' and 'restaurant'")
+        jobs.append({
+            "job_id": index,
+            "account": str(row["account"]).strip(),
+            "restaurant": row["restaurant"].strip(),
+            "item": (row.get("item") or "").strip() or None,
+            "items": parse_items(row.get("items")),
+        })
+    return jobs
+
+
+def available_memory_mb():
+    """Available system memory in MB, or None if it cannot be determined"""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def default_concurrency():
+    """Number of browsers the machine can run side by side, bounded by cores and memory"""
+    limit = os.cpu_count() or 1
+    memory = available_memory_mb()
+    if memory is not None:
+        limit = min(limit, memory // MEMORY_PER_BROWSER_MB)
+    return max(1, limit)
+
+
+class DriverPool:
+    """Hands each worker thread its own long-lived browser, replacing it after a crash"""
+
+    def __init__(self, headless=True, locator_store=None, restaurant_cache=None, browser_options=None,
+                 timeout_store=None):
+        self.headless = headless
+        self.locator_store = locator_store
+        self.timeout_store = timeout_store
+        self.restaurant_cache = restaurant_cache
+        self.browser_options = browser_options or {}
+        # Browsers share one recording so their updates don't overwrite each other
+        replay_file = self.browser_options.get("replay_file")
+        self.replay_store = ReplayStore(replay_file) if replay_file else None
+        self.local = threading.local()
+        self.instances = []
+        self.lock = threading.Lock()
+
+    def get(self):
+        """Return the calling worker's browser, starting one if needed"""
+        automation = getattr(self.local, "automation", None)
+        if automation is None:
+            automation = SwiggyAutomation(
+                headless=self.headless,
+                locator_store=self.locator_store,
+                timeout_store=self.timeout_store,
+                restaurant_cache=self.restaurant_cache,
+                session_file=None,
+                # Jobs share the working directory, so no per-run checkpoint file
+                checkpoint_file=None,
+                replay_store=self.replay_store,
+                **self.browser_options
+            )
+            self.local.automation = automation
+            with self.lock:
+                self.instances.append(automation)
+        return automation
+
+    def current(self):
+        """The calling worker's browser, or None if it has none right now"""
+        return getattr(self.local, "automation", None)
+    
+    def discard(self):
+        """Throw away the calling worker's browser so the next get() starts a fresh one"""
+        automation = getattr(self.local, "automation", None)
+        if automation is None:
+            return
+        self.local.automation = None
+        with self.lock:
+            self.instances.remove(automation)
+        automation.quit()
+
+    def close_all(self):
+        """Quit every browser in the pool"""
+        with self.lock:
+            instances, self.instances = self.instances, []
+        for automation in instances:
+            automation.quit()
+
+
+def run_job(pool, job, retries=DEFAULT_RETRIES, sessions_dir=SESSIONS_DIR):
+    """Run one job on the worker's browser, retrying on a fresh browser if it crashes"""
+    session_file = os.path.join(sessions_dir, f"{job['account']}.json")
+    set_log_context(job_id=job["job_id"])
+    start = time.time()
+    attempts = 0
+    success = False
+    error = None
+
+    while attempts <= retries:
+        attempts += 1
+        try:
+            automation = pool.get()
+            automation.start_new_session(job["account"], session_file)
+            success = automation.run_automation(restaurant_name=job["restaurant"], item_name=job["item"],
+                                                items=job.get("items"))
+            if success or automation.is_alive():
+                # A failed step on a healthy browser is a real failure, not a crash
+                error = None if success else "automation step failed"
+                break
+            error = "browser stopped responding"
+        except Exception as e:
+            error = str(e)
+
+        logging.warning(f"Job {job['job_id']}: browser crashed on attempt {attempts} ({error}), restarting it")
+        pool.discard()
+
+    duration = time.time() - start
+    status = "succeeded" if success else "failed"
+    logging.info(f"Job {job['job_id']} {status} after {attempts} attempt(s) in {duration:.1f}s",
+                 extra={"duration": round(duration, 4)})
+    clear_log_context("job_id")
+    return dict(job, success=success, attempts=attempts, duration=round(duration, 2), error=error)
+
+
+def run_batch(jobs, concurrency=None, retries=DEFAULT_RETRIES, headless=True, sessions_dir=SESSIONS_DIR,
+              restaurant_cache_file=None, browser_options=None):
+    """Run jobs concurrently on a bounded pool of browsers and return an aggregated report"""
+    limit = default_concurrency()
+    concurrency = min(concurrency or limit, limit, len(jobs)) or 1
+    os.makedirs(sessions_dir, exist_ok=True)
+    logging.info(f"Running {len(jobs)} job(s) on {concurrency} browser(s)")
+
+    locator_store = LocatorStore()
+    timeout_store = TimeoutStore()
+    # Jobs for the same restaurant share one cache, so only the first has to search
+    restaurant_cache = RestaurantCache(restaurant_cache_file) if restaurant_cache_file else None
+    pool = DriverPool(headless=headless, locator_store=locator_store, restaurant_cache=restaurant_cache,
+                      browser_options=browser_options, timeout_store=timeout_store)
+    start = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="order") as executor:
+            results = list(executor.map(lambda job: run_job(pool, job, retries, sessions_dir), jobs))
+    finally:
+        pool.close_all()
+        locator_store.save()
+        timeout_store.save()
+        if restaurant_cache:
+            restaurant_cache.save()
+
+    wall_time = time.time() - start
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "jobs": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "concurrency": concurrency,
+        "wall_time": round(wall_time, 2),
+        "orders_per_minute": round(len(results) / wall_time * 60, 2) if wall_time else None,
+        "restaurant_cache_hit_rate": restaurant_cache.hit_rate() if restaurant_cache else None,
+        "results": results,
+    }
+
+
+def format_report(report):
+    """Render a batch report as a text summary"""
+    lines = [f"{'JOB':>4} {'ACCOUNT':<14} {'RESTAURANT':<28} {'ITEM':<20} {'STATUS':<9} {'TRIES':>5} {'TIME':>8}"]
+    for result in report["results"]:
+        item = result["item"] or (f"{len(result['items'])} items" if result.get("items") else "-")
+        lines.append(
+            f"{result['job_id']:>4} {result['account']:<14} {result['restaurant'][:28]:<28} "
+            f"{item[:20]:<20} {'ok' if result['success'] else 'FAILED':<9} "
+            f"{result['attempts']:>5} {result['duration']:>7.1f}s"
+        )
+    lines.append(
+        f"{report['succeeded']}/{report['jobs']} succeeded on {report['concurrency']} browser(s) "
+        f"in {report['wall_time']:.1f}s ({report['orders_per_minute']} orders/min)"
+    )
+    return "\n".join(lines)
+
+
+def save_report(report, path=BATCH_REPORT_FILE):
+    """Write the batch report as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    logging.info(f"Batch report written to {path}")
@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import tempfile
+import time
+
+from locator_store import LocatorStore, LOCATOR_STATS_FILE
+from mock_swiggy import MockSwiggyServer
+from swiggy_automation import SwiggyAutomation
+from timeout_store import TimeoutStore, TIMEOUTS_FILE
+from tracing import percentile
+
+BENCHMARK_REPORT_FILE = "benchmark_report.json"
+
+# Allowed slowdown of the end-to-end p50 against a baseline before the gate fails
+DEFAULT_MAX_REGRESSION = 0.2
+
+
+def measurement_setup(prefix, browser_options=None):
+    """Browser options plus scratch locator and timeout stores for a benchmark or load-test run. Failure
+    artifacts stay off unless asked for, since failures are in the report, and lookups stay out of the
+    real locator statistics and learned timeouts."""
+    options = dict({"artifact_dir": None}, **(browser_options or {}))
+    work_dir = tempfile.mkdtemp(prefix=prefix)
+    locator_store = LocatorStore(os.path.join(work_dir, LOCATOR_STATS_FILE))
+    timeout_store = TimeoutStore(os.path.join(work_dir, TIMEOUTS_FILE))
+    return options, locator_store, timeout_store
+
+
+def timing_stats(values):
+    """Count, mean, p50, p95, p99 and max of a list of durations"""
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 4) if values else None,
+        "p50": round(percentile(values, 50), 4) if values else None,
+        "p95": round(percentile(values, 95), 4) if values else None,
+        "p99": round(percentile(values, 99), 4) if values else None,
+        "max": round(max(values), 4) if values else None,
+    }
+
+
+def run_benchmark(iterations=5, restaurant="Chandrika Grand", item=None, page_latency=0.0, api_latency=0.0,
+                  render_delay_ms=0, browser_options=None):
+    """Run the full flow headless against the mock site and return timing statistics"""
+    server = MockSwiggyServer(page_latency=page_latency, api_latency=api_latency, render_delay_ms=render_delay_ms)
+    base_url = server.start()
+    options, locator_store, timeout_store = measurement_setup("swiggy-bench-", browser_options)
+    automation = None
+    runs = []
+    try:
+        automation = SwiggyAutomation(
+            phone_number="9000000000",
+            headless=True,
+            session_file=None,
+            checkpoint_file=None,
+            base_url=base_url,
+            locator_store=locator_store,
+            timeout_store=timeout_store,
+            **options
+        )
+        for iteration in range(1, iterations + 1):
+            # Every iteration starts logged out with an empty cart
+            automation.start_new_session(automation.phone_number)
+            start = time.perf_counter()
+            success = automation.run_automation(restaurant_name=restaurant, item_name=item)
+            total = time.perf_counter() - start
+            runs.append({
+                "iteration": iteration,
+                "success": success,
+                "total": total,
+                "steps": dict(automation.tracer.step_durations()),
+            })
+            logging.info(f"Benchmark iteration {iteration}/{iterations}: {'ok' if success else 'FAILED'} in {total:.2f}s")
+    finally:
+        if automation:
+            automation.quit()
+        server.stop()
+
+    step_names = []
+    for run in runs:
+        step_names.extend(name for name in run["steps"] if name not in step_names)
+    return {
+        "iterations": iterations,
+        "failures": sum(1 for run in runs if not run["success"]),
+        "settings": {
+            "restaurant": restaurant,
+            "item": item,
+            "page_latency": page_latency,
+            "api_latency": api_latency,
+            "render_delay_ms": render_delay_ms,
+        },
+        "end_to_end": timing_stats([run["total"] for run in runs if run["success"]]),
+        "steps": {
+            name: timing_stats([run["steps"][name] for run in runs if name in run["steps"]])
+            for name in step_names
+        },
+        "runs": runs,
+    }
+
+
+def format_report(report):
+    """Render a benchmark report as a text table"""
+    lines = [f"{'STEP':<40} {'MEAN':>8} {'P50':>8} {'P95':>8} {'MAX':>8}"]
+    rows = list(report["steps"].items()) + [("END TO END", report["end_to_end"])]
+    for name, stats in rows:
+        if stats["count"] == 0:
+            lines.append(f"{name[:40]:<40} {'-':>8} {'-':>8} {'-':>8} {'-':>8}")
+            continue
+        lines.append(
+            f"{name[:40]:<40} {stats['mean']:>7.3f}s {stats['p50']:>7.3f}s {stats['p95']:>7.3f}s {stats['max']:>7.3f}s"
+        )
+    lines.append(f"{report['iterations'] - report['failures']}/{report['iterations']} iterations succeeded")
+    return "\n".join(lines)
+
+
+def check_regression(report, baseline_path, max_regression=DEFAULT_MAX_REGRESSION):
+    """Compare end-to-end and per-step p50 against a baseline report; returns a list of regressions"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    if report["failures"]:
+        regressions.append(f"{report['failures']} iteration(s) failed")
+
+    pairs = [("end to end", report["end_to_end"], baseline.get("end_to_end", {}))]
+    pairs += [(name, stats, baseline.get("steps", {}).get(name, {})) for name, stats in report["steps"].items()]
+    for name, current, previous in pairs:
+        if not current.get("p50") or not previous.get("p50"):
+            continue
+        limit = previous["p50"] * (1 + max_regression)
+        if current["p50"] > limit:
+            regressions.append(
+                f"{name}: p50 {current['p50']:.3f}s exceeds baseline {previous['p50']:.3f}s by more than "
+                f"{max_regression:.0%}"
+            )
+    return regressions
+
+
+def save_report(report, path=BENCHMARK_REPORT_FILE):
+    """Write the benchmark report as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    logging.info(f"Benchmark report written to {path}")
@@ -0,0 +1,70 @@
+import json
+import logging
+import os
+import time
+
+from session_store import capture_session, write_private_json
+
+# Default on-disk location of the workflow checkpoint
+CHECKPOINT_FILE = "swiggy_checkpoint.json"
+
+
+class CheckpointStore:
+    """Records which workflow steps completed, where the browser was and its session state"""
+
+    def __init__(self, path=CHECKPOINT_FILE):
+        self.path = path
+
+    def load(self):
+        """Return the saved checkpoint, or None if there is none"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read checkpoint from {self.path}: {e}")
+            return None
+
+    def next_step(self, step_ids):
+        """First step in step_ids the saved checkpoint has not completed, or None"""
+        checkpoint = self.load()
+        if not checkpoint:
+            return None
+        return next((step_id for step_id in step_ids if step_id not in checkpoint["completed"]), None)
+
+    def start(self, restaurant_name, item_name):
+        """Begin a fresh checkpoint for a new run"""
+        checkpoint = {
+            "restaurant": restaurant_name,
+            "item": item_name,
+            "completed": [],
+            "urls": {},
+            "session": None,
+            "updated_at": time.time(),
+        }
+        self.write(checkpoint)
+        return checkpoint
+
+    def record_step(self, checkpoint, step_id, driver):
+        """Mark step_id completed, remembering the URL it left the browser on and the session"""
+        if step_id not in checkpoint["completed"]:
+            checkpoint["completed"].append(step_id)
+        try:
+            checkpoint["urls"][step_id] = driver.current_url
+            checkpoint["session"] = capture_session(driver)
+        except Exception as e:
+            logging.warning(f"Could not capture browser state for checkpoint: {e}")
+        checkpoint["updated_at"] = time.time()
+        self.write(checkpoint)
+
+    def write(self, checkpoint):
+        try:
+            write_private_json(self.path, checkpoint)
+        except OSError as e:
+            logging.warning(f"Could not write checkpoint to {self.path}: {e}")
+
+    def clear(self):
+        """Remove the checkpoint once the workflow has finished"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,87 @@
+import json
+import logging
+import re
+
+COMPARISON_REPORT_FILE = "comparison_report.json"
+
+
+def eta_minutes(eta):
+    """Midpoint in minutes of an ETA like '30-35 mins', or None"""
+    numbers = [int(number) for number in re.findall(r"\d+", eta or "")[:2]]
+    return sum(numbers) / len(numbers) if numbers else None
+
+
+def parse_rating(rating):
+    try:
+        return float(rating)
+    except (TypeError, ValueError):
+        return None
+
+
+def rank_restaurants(records, item_name=None):
+    """Order comparison records best first: open restaurants that have the item, cheapest, then fastest and
+    best rated; without an item, fastest and best rated. Each record gets a rank (None if unavailable)."""
+    def available(record):
+        return record["status"] == "ready" and (not item_name or record["item"] is not None)
+
+    def sort_key(record):
+        price = record["item"]["price"] if item_name and record["item"] else None
+        eta = eta_minutes(record["eta"])
+        rating = parse_rating(record["rating"])
+        return (
+            not available(record),
+            price is None,
+            price or 0,
+            eta is None,
+            eta or 0,
+            -(rating or 0),
+        )
+
+    ranked = sorted(records, key=sort_key)
+    for rank, record in enumerate(ranked, 1):
+        record["rank"] = rank if available(record) else None
+    return ranked
+
+
+def format_comparison(records, item_name=None):
+    """Render ranked comparison records as a text table"""
+    lines = [f"{'#':>2}  {'RESTAURANT':<30} {'RATING':>6} {'ETA':>12} {'PRICE':>8}  {'ITEM' if item_name else 'STATUS'}"]
+    for record in records:
+        item = record["item"]
+        if record["status"] != "ready":
+            detail = record["status"].replace("_", " ")
+        elif item_name:
+            detail = item["name"] if item else f"'{item_name}' not on menu"
+        else:
+            detail = f"{len(record['items'])} menu items"
+        price = f"{item['price']:.0f}" if item and item["price"] is not None else "-"
+        lines.append(
+            f"{record['rank'] or '-':>2}  {(record['name'] or record['query'])[:30]:<30} {record['rating'] or '-':>6} "
+            f"{record['eta'] or '-':>12} {price:>8}  {detail}"
+        )
+    return "\n".join(lines)
+
+
+def run_comparison(automation, restaurant_names, item_name=None):
+    """Log in if needed, compare the restaurants in tabs of one browser and return the ranked records"""
+    if not automation.open_swiggy():
+        raise RuntimeError("Could not open Swiggy")
+    if not automation.is_logged_in():
+        if not automation.handle_login() or not automation.wait_for_location_handling():
+            raise RuntimeError("Login or location setup failed")
+        automation.save_session()
+
+    records = automation.compare_restaurants(restaurant_names, item_name)
+    if automation.restaurant_cache:
+        automation.restaurant_cache.save()
+    ranked = rank_restaurants(records, item_name)
+    if ranked and ranked[0]["rank"]:
+        logging.info(f"Best option: {ranked[0]['name']} ({ranked[0]['url']})")
+    return ranked
+
+
+def save_report(records, path=COMPARISON_REPORT_FILE):
+    """Write the ranked comparison as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=2)
+    logging.info(f"Comparison report written to {path}")
@@ -0,0 +1,345 @@
+import itertools
+import json
+import logging
+import os
+import queue
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from batch_runner import DriverPool, run_job, parse_items, DEFAULT_RETRIES, SESSIONS_DIR
+from locator_store import LocatorStore
+from restaurant_cache import RestaurantCache
+from timeout_store import TimeoutStore
+
+DEFAULT_DAEMON_PORT = 8765
+
+# Jobs waiting for a free browser beyond this are rejected with 503
+MAX_QUEUED_JOBS = 100
+
+# Finished jobs kept for GET /jobs/<id>
+MAX_FINISHED_JOBS = 1000
+
+# An idle browser is checked this often, and replaced if it stopped responding
+HEALTH_CHECK_INTERVAL = 30
+
+# A browser is restarted after this many jobs, or once it has grown this much past its warm size
+RECYCLE_AFTER_JOBS = 50
+RECYCLE_MEMORY_GROWTH_MB = 500
+
+
+def process_tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants in MB (Linux), or None"""
+    children = {}
+    try:
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The command name may contain spaces; fields after it are space separated
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+    except OSError:
+        return None
+
+    total_kb = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb // 1024
+
+
+def browser_memory_mb(automation):
+    """Memory used by chromedriver and the Chrome processes it started, or None if unknown"""
+    try:
+        return process_tree_rss_mb(automation.driver.service.process.pid)
+    except AttributeError:
+        return None
+
+
+class AutomationDaemon:
+    """Keeps warm browsers running and feeds them queued order jobs"""
+
+    def __init__(self, workers=1, retries=DEFAULT_RETRIES, headless=True, sessions_dir=SESSIONS_DIR,
+                 restaurant_cache_file=None, recycle_after_jobs=RECYCLE_AFTER_JOBS,
+                 recycle_memory_growth_mb=RECYCLE_MEMORY_GROWTH_MB, browser_options=None):
+        self.workers = workers
+        self.retries = retries
+        self.sessions_dir = sessions_dir
+        self.recycle_after_jobs = recycle_after_jobs
+        self.recycle_memory_growth_mb = recycle_memory_growth_mb
+        self.locator_store = LocatorStore()
+        self.timeout_store = TimeoutStore()
+        self.restaurant_cache = RestaurantCache(restaurant_cache_file) if restaurant_cache_file else None
+        self.pool = DriverPool(headless=headless, locator_store=self.locator_store,
+                               restaurant_cache=self.restaurant_cache, browser_options=browser_options,
+                               timeout_store=self.timeout_store)
+        self.queue = queue.Queue(maxsize=MAX_QUEUED_JOBS)
+        self.jobs = {}
+        self.browsers = {}
+        self.job_ids = itertools.count(1)
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.threads = []
+        self.started_at = time.time()
+
+    def start(self):
+        """Start one worker thread (and browser) per configured worker"""
+        os.makedirs(self.sessions_dir, exist_ok=True)
+        for index in range(1, self.workers + 1):
+            thread = threading.Thread(target=self.worker, name=f"browser-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        logging.info(f"Daemon started with {self.workers} browser(s)")
+
+    def stop(self):
+        """Finish running jobs, cancel queued ones, then quit every browser"""
+        self.stopping.set()
+        for _ in self.threads:
+            try:
+                # Wakes an idle worker at once; a full queue means the workers are busy and see the event next
+                self.queue.put_nowait(None)
+            except queue.Full:
+                break
+        for thread in self.threads:
+            thread.join()
+        while True:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if record:
+                self.cancel(record)
+        self.pool.close_all()
+        self.locator_store.save()
+        self.timeout_store.save()
+        if self.restaurant_cache:
+            self.restaurant_cache.save()
+
+    def submit(self, job):
+        """Queue a job dict with account, restaurant and optional item or items; returns its record"""
+        if not job.get("account") or not job.get("restaurant"):
+            raise ValueError("A job needs at least 'account' and 'restaurant'")
+        record = {
+            "job_id": next(self.job_ids),
+            "account": str(job["account"]).strip(),
+            "restaurant": job["restaurant"].strip(),
+            "item": (job.get("item") or "").strip() or None,
+            "items": parse_items(job.get("items")),
+            "status": "queued",
+            "submitted_at": time.time(),
+            "result": None,
+            "done": threading.Event(),
+        }
+        with self.lock:
+            self.jobs[record["job_id"]] = record
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                del self.jobs[record["job_id"]]
+            raise
+        return record
+
+    def cancel(self, record):
+        """Finish a job that will not run because the daemon is stopping"""
+        record.update(status="cancelled", result={"success": False, "error": "daemon stopped"})
+        record["done"].set()
+
+    def job_status(self, record):
+        """JSON-safe view of a job record"""
+        return {key: value for key, value in record.items() if key != "done"}
+
+    def warm_up(self):
+        """Start this worker's browser and connect it to the site through the lightweight page every job's
+        session starts from, so the first job pays for neither"""
+        automation = self.pool.get()
+        automation.start_new_session(automation.phone_number)
+        state = self.browsers[threading.current_thread().name]
+        state.update(jobs=0, started_at=time.time(), baseline_mb=browser_memory_mb(automation))
+        state["memory_mb"] = state["baseline_mb"]
+        return automation
+
+    def needs_recycling(self, automation, state):
+        """Reason to replace this worker's browser, or None"""
+        if not automation.is_alive():
+            return "browser stopped responding"
+        if state["jobs"] >= self.recycle_after_jobs:
+            return f"ran {state['jobs']} jobs"
+        state["memory_mb"] = browser_memory_mb(automation)
+        if state["memory_mb"] is not None and state["baseline_mb"] is not None:
+            growth = state["memory_mb"] - state["baseline_mb"]
+            if growth > self.recycle_memory_growth_mb:
+                return f"memory grew by {growth} MB"
+        return None
+
+    def worker(self):
+        """Take jobs off the queue one at a time on this thread's warm browser"""
+        name = threading.current_thread().name
+        state = self.browsers.setdefault(name, {"state": "starting", "job_id": None})
+        automation = None
+        while not self.stopping.is_set():
+            try:
+                if automation is None:
+                    state["state"] = "starting"
+                    automation = self.warm_up()
+                state["state"] = "idle"
+                record = self.queue.get(timeout=HEALTH_CHECK_INTERVAL)
+            except queue.Empty:
+                record = False
+            except Exception as e:
+                logging.error(f"{name}: could not start a browser: {e}")
+                self.pool.discard()
+                automation = None
+                self.stopping.wait(HEALTH_CHECK_INTERVAL)
+                continue
+            if record is None:
+                break
+            if record and self.stopping.is_set():
+                self.cancel(record)
+                break
+
+            if record:
+                state.update(state="busy", job_id=record["job_id"])
+                record["status"] = "running"
+                record["started_at"] = time.time()
+                job = {key: record[key] for key in ("job_id", "account", "restaurant", "item", "items")}
+                result = run_job(self.pool, job, self.retries, self.sessions_dir)
+                result["queue_wait"] = round(record["started_at"] - record["submitted_at"], 2)
+                result["browser"] = name
+                record.update(status="succeeded" if result["success"] else "failed", result=result)
+                record["done"].set()
+                state.update(job_id=None, jobs=state["jobs"] + 1)
+                self.forget_old_jobs()
+                self.locator_store.save()
+                self.timeout_store.save()
+                if self.restaurant_cache:
+                    self.restaurant_cache.save()
+                if self.pool.current() is not automation:
+                    # run_job replaced a crashed browser; warm up its replacement
+                    automation = None
+                    continue
+
+            reason = self.needs_recycling(automation, state)
+            if reason:
+                logging.info(f"{name}: recycling browser ({reason})")
+                state["state"] = "recycling"
+                self.pool.discard()
+                automation = None
+        state["state"] = "stopped"
+
+    def forget_old_jobs(self):
+        with self.lock:
+            finished = [job_id for job_id, record in self.jobs.items() if record["done"].is_set()]
+            for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+                del self.jobs[job_id]
+
+    def health(self):
+        """Queue depth plus the state, job count and memory of every browser"""
+        browsers = {name: dict(state) for name, state in self.browsers.items()}
+        ready = any(state["state"] in ("idle", "busy") for state in browsers.values())
+        return {
+            "status": "ok" if ready else "starting",
+            "uptime": round(time.time() - self.started_at, 1),
+            "queued": self.queue.qsize(),
+            "browsers": browsers,
+        }
+
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """POST /jobs, GET /jobs/<id> and GET /health for the daemon on self.server.automation_daemon"""
+
+    server_version = "SwiggyDaemon/1.0"
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        logging.debug(f"daemon: {format % args}")
+
+    def send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        daemon = self.server.automation_daemon
+        if self.path == "/health":
+            health = daemon.health()
+            self.send_json(200 if health["status"] == "ok" else 503, health)
+        elif self.path.startswith("/jobs/"):
+            job_id = self.path[len("/jobs/"):]
+            record = daemon.jobs.get(int(job_id)) if job_id.isdigit() else None
+            if record is None:
+                self.send_json(404, {"error": "unknown job"})
+            else:
+                self.send_json(200, daemon.job_status(record))
+        else:
+            self.send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/jobs":
+            self.send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            job = json.loads(self.rfile.read(length) or b"{}")
+            record = self.server.automation_daemon.submit(job)
+        except (ValueError, AttributeError, TypeError, IndexError) as e:
+            self.send_json(400, {"error": str(e)})
+            return
+        except queue.Full:
+            self.send_json(503, {"error": "job queue is full"})
+            return
+
+        # By default the request waits for the result; "wait": false returns the job ID right away
+        if job.get("wait", True):
+            record["done"].wait()
+        self.send_json(200 if record["done"].is_set() else 202, self.server.automation_daemon.job_status(record))
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(daemon, port=DEFAULT_DAEMON_PORT, socket_path=None, host="127.0.0.1"):
+    """Serve the daemon's HTTP API on a Unix socket or a local TCP port until interrupted"""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, DaemonRequestHandler)
+        address = f"unix:{socket_path}"
+    else:
+        server = ThreadingHTTPServer((host, port), DaemonRequestHandler)
+        server.daemon_threads = True
+        address = f"http://{host}:{port}"
+    server.automation_daemon = daemon
+
+    daemon.start()
+    logging.info(f"Accepting jobs at {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Shutting down daemon")
+    finally:
+        server.server_close()
+        daemon.stop()
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
@@ -0,0 +1,179 @@
+import base64
+import glob
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+import zipfile
+
+# Default directory for the evidence captured when a step or locator set fails
+ARTIFACTS_DIR = "failures"
+
+# Retention: the newest archives are kept until either limit is reached, the rest are deleted
+ARTIFACT_MAX_COUNT = 50
+ARTIFACT_MAX_MB = 200
+
+# Captures waiting for the writer; further failures are dropped rather than blocking the automation
+ARTIFACT_QUEUE_SIZE = 16
+
+# The writer thread exits after this many idle seconds and is restarted by the next capture
+ARTIFACT_WORKER_IDLE = 2.0
+
+# How long quit() waits for queued captures to be written
+ARTIFACT_FLUSH_TIMEOUT = 10.0
+
+
+def enable_console_logging(chrome_options):
+    """Ask ChromeDriver to buffer every console message in the 'browser' log"""
+    prefs = dict(chrome_options.capabilities.get("goog:loggingPrefs") or {})
+    prefs["browser"] = "ALL"
+    chrome_options.set_capability("goog:loggingPrefs", prefs)
+
+
+def slug(text):
+    return re.sub(r"[^A-Za-z0-9]+", "-", text or "run").strip("-")[:40] or "run"
+
+
+class FailureArtifacts:
+    """Grabs screenshot, DOM, console log and URL when a step fails for good; a background thread
+    decodes, compresses and writes each capture as a zip and prunes old ones"""
+
+    def __init__(self, directory=ARTIFACTS_DIR, max_count=ARTIFACT_MAX_COUNT, max_mb=ARTIFACT_MAX_MB):
+        self.directory = directory
+        self.max_count = max_count
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.queue = queue.Queue(maxsize=ARTIFACT_QUEUE_SIZE)
+        self.lock = threading.Lock()
+        self.thread = None
+        self.sequence = 0
+
+    def capture(self, driver, reason, step=None, run_id=None):
+        """Read the page state on the calling thread and queue it for writing; False if skipped"""
+        capture = {"reason": reason, "step": step, "run_id": run_id, "time": time.time(), "errors": {}}
+        readers = [
+            ("url", lambda: driver.current_url),
+            ("title", lambda: driver.title),
+            # Left base64-encoded here; decoding happens on the writer thread
+            ("screenshot", driver.get_screenshot_as_base64),
+            ("dom", lambda: driver.page_source),
+            ("console", lambda: driver.get_log("browser")),
+        ]
+        for name, read in readers:
+            try:
+                capture[name] = read()
+            except Exception as e:
+                capture[name] = None
+                capture["errors"][name] = str(e)
+
+        with self.lock:
+            try:
+                self.queue.put_nowait(capture)
+            except queue.Full:
+                logging.warning(f"Failure artifact queue is full, dropping capture for {reason}")
+                return False
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="failure-artifacts")
+                self.thread.start()
+        logging.info(f"Captured failure artifacts for {reason}")
+        return True
+
+    def _run(self):
+        while True:
+            try:
+                capture = self.queue.get(timeout=ARTIFACT_WORKER_IDLE)
+            except queue.Empty:
+                with self.lock:
+                    # Checked under the lock so a capture queued meanwhile starts a new writer
+                    if self.queue.empty():
+                        self.thread = None
+                        return
+                continue
+            try:
+                path = self.write(capture)
+                logging.debug(f"Failure artifacts written to {path}")
+                self.prune()
+            except Exception as e:
+                logging.warning(f"Could not write failure artifacts for {capture['reason']}: {e}")
+            finally:
+                self.queue.task_done()
+
+    def write(self, capture):
+        """Write one capture as a zip of meta.json, screenshot.png, dom.html and console.json"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.sequence += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(capture["time"]))
+        name = f"{stamp}-{capture['run_id'] or 'run'}-{slug(capture['step'])}-{self.sequence}.zip"
+        path = os.path.join(self.directory, name)
+        meta = {key: capture[key] for key in ("reason", "step", "run_id", "time", "url", "title", "errors")}
+
+        tmp_path = f"{path}.tmp"
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("meta.json", json.dumps(meta, indent=2))
+            if capture["screenshot"]:
+                # PNG is already compressed
+                archive.writestr("screenshot.png", base64.b64decode(capture["screenshot"]),
+                                 compress_type=zipfile.ZIP_STORED)
+            if capture["dom"] is not None:
+                archive.writestr("dom.html", capture["dom"])
+            if capture["console"] is not None:
+                archive.writestr("console.json", json.dumps(capture["console"], indent=2))
+        os.replace(tmp_path, path)
+        return path
+
+    def prune(self):
+        """Delete the oldest archives beyond the count and size limits, always keeping the newest"""
+        archives = []
+        for path in glob.glob(os.path.join(self.directory, "*.zip")):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            archives.append((stat.st_mtime, stat.st_size, path))
+        archives.sort(reverse=True)
+
+        total = 0
+        for kept, (_, size, path) in enumerate(archives):
+            total += size
+            if kept and (kept >= self.max_count or total > self.max_bytes):
+                try:
+                    os.remove(path)
+                    logging.debug(f"Pruned failure artifacts {path}")
+                except OSError:
+                    # Another browser's writer may have pruned it first
+                    pass
+
+    def flush(self, timeout=ARTIFACT_FLUSH_TIMEOUT):
+        """Wait for queued captures to be written"""
+        deadline = time.time() + timeout
+        while self.queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.05)
+        if self.queue.unfinished_tasks:
+            logging.warning(f"{self.queue.unfinished_tasks} failure capture(s) still being written")
+
+
+def format_artifacts(directory=ARTIFACTS_DIR):
+    """Render the failure archives in directory as a text table, newest first"""
+    paths = sorted(glob.glob(os.path.join(directory, "*.zip")), key=os.path.getmtime, reverse=True)
+    if not paths:
+        return f"No failure artifacts in {directory}"
+    lines = [f"{'TIME':<19} {'STEP':<12} {'SIZE':>8}  {'REASON':<36} URL"]
+    total = 0
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+            with zipfile.ZipFile(path) as archive:
+                meta = json.loads(archive.read("meta.json"))
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logging.warning(f"Could not read failure artifacts {path}: {e}")
+            continue
+        total += size
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(meta["time"]))
+        lines.append(
+            f"{when:<19} {(meta['step'] or '-')[:12]:<12} {size / 1024:>6.0f}KB  {meta['reason'][:36]:<36} "
+            f"{meta['url'] or '-'}"
+        )
+    lines.append(f"{len(paths)} archive(s), {total / (1024 * 1024):.1f}MB in {directory}")
+    return "\n".join(lines)
@@ -0,0 +1,57 @@
+import json
+import logging
+import os
+import threading
+
+
+class JsonStore:
+    """In-memory state loaded from a JSON file and written back atomically when it changed.
+    Subclasses set description, implement restore() and snapshot(), and set dirty under the lock."""
+
+    # What the file holds, for log messages
+    description = "data"
+    # Key order is kept where it carries meaning, e.g. LRU order
+    sort_keys = True
+
+    def __init__(self, path):
+        self.path = path
+        self.dirty = False
+        # Batch, daemon and load runs share one store between worker threads
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Load the file, starting empty if it is missing or corrupt"""
+        data = None
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Could not read {self.description} from {self.path}: {e}")
+        self.restore(data)
+
+    def restore(self, data):
+        """Take over the content read from the file, or start empty when data is None"""
+        raise NotImplementedError
+
+    def snapshot(self):
+        """The JSON content to write; called with the lock held"""
+        raise NotImplementedError
+
+    def save(self):
+        """Write the store to disk if anything changed since the last save"""
+        with self.lock:
+            if not self.dirty:
+                return
+            content = json.dumps(self.snapshot(), indent=2, sort_keys=self.sort_keys)
+            self.dirty = False
+        # Per-thread temporary file, so concurrent saves never interleave their writes
+        tmp_path = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.dirty = True
+            logging.warning(f"Could not save {self.description} to {self.path}: {e}")
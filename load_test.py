@@ -0,0 +1,264 @@
+import csv
+import json
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+from batch_runner import default_concurrency
+from benchmark import measurement_setup, timing_stats
+from mock_swiggy import MockSwiggyServer
+from replay_store import ReplayStore
+from structured_logging import clear_log_context, set_log_context
+from swiggy_automation import SwiggyAutomation
+
+LOAD_REPORT_FILE = "load_report.json"
+LOAD_CSV_FILE = "load_report.csv"
+
+# How often the controller re-reads the profile and starts virtual users
+CONTROL_INTERVAL = 0.5
+
+CSV_FIELDS = ["name", "count", "errors", "error_rate", "mean", "p50", "p95", "p99", "max"]
+
+# Hosts a mock site can run on; anything else could be the real site
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+class LoadProfile:
+    """Virtual users over time: a linear ramp up to the peak, a steady phase, then a linear ramp down"""
+
+    def __init__(self, users, ramp_up=30.0, steady=60.0, ramp_down=30.0):
+        if users < 1:
+            raise ValueError("A load profile needs at least one user")
+        self.users = users
+        self.ramp_up = ramp_up
+        self.steady = steady
+        self.ramp_down = ramp_down
+        self.duration = ramp_up + steady + ramp_down
+
+    def users_at(self, elapsed):
+        """Number of virtual users that should be active this many seconds into the test"""
+        if elapsed < self.ramp_up:
+            # The first user starts immediately, the last one when the ramp ends
+            return min(self.users, int(self.users * elapsed / self.ramp_up) + 1)
+        if elapsed < self.ramp_up + self.steady:
+            return self.users
+        if elapsed < self.duration:
+            remaining = self.duration - elapsed
+            return max(1, int(self.users * remaining / self.ramp_down + 0.999))
+        return 0
+
+    def to_dict(self):
+        return {"users": self.users, "ramp_up": self.ramp_up, "steady": self.steady, "ramp_down": self.ramp_down}
+
+
+def parse_think_time(spec):
+    """'2' or 'constant:2', 'uniform:1-3' or 'exponential:2' (mean) seconds -> function returning one pause"""
+    kind, separator, value = spec.partition(":")
+    if not separator:
+        kind, value = "constant", spec
+    kind = kind.strip().lower()
+    try:
+        if kind == "constant":
+            seconds = float(value)
+            return lambda: seconds
+        if kind == "uniform":
+            low, _, high = value.partition("-")
+            low, high = float(low), float(high or low)
+            return lambda: random.uniform(low, high)
+        if kind == "exponential":
+            mean = float(value)
+            return lambda: random.expovariate(1 / mean) if mean > 0 else 0.0
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid think time '{spec}': use SECONDS, constant:S, uniform:MIN-MAX or exponential:MEAN")
+
+
+def check_target(base_url, session_file=None):
+    """Refuse to load a non-local site without a logged-in session: every virtual user would log in
+    with a generated phone number and make the site send OTPs to whoever owns it"""
+    if base_url and urlparse(base_url).hostname not in LOCAL_HOSTS and not session_file:
+        raise ValueError(f"{base_url} is not a local mock site; give the session file of a logged-in account "
+                         f"so virtual users skip the OTP login")
+
+
+def run_load_test(profile, think_time="constant:1", base_url=None, restaurant="Chandrika Grand", item=None,
+                  page_latency=0.0, api_latency=0.0, render_delay_ms=0, browser_options=None, session_file=None):
+    """Drive the full flow from virtual users following the profile and return throughput, error and latency
+    statistics. Without a base_url the users target a local mock site with the given latency. With a
+    session_file every iteration starts from that logged-in session instead of logging in."""
+    check_target(base_url, session_file)
+    pause = parse_think_time(think_time)
+    server = None
+    if not base_url:
+        server = MockSwiggyServer(page_latency=page_latency, api_latency=api_latency, render_delay_ms=render_delay_ms)
+        base_url = server.start()
+    if profile.users > default_concurrency():
+        logging.warning(f"{profile.users} virtual users exceed the {default_concurrency()} browsers this machine "
+                        f"comfortably runs; latencies will include local contention")
+
+    options, locator_store, timeout_store = measurement_setup("swiggy-load-", browser_options)
+    # Users share one recording so their updates don't overwrite each other
+    replay_file = options.get("replay_file")
+    replay_store = ReplayStore(replay_file) if replay_file else None
+    lock = threading.Lock()
+    stop = threading.Event()
+    active_users = [0]
+    runs = []
+    startup_failures = []
+    timeline = []
+    started = time.time()
+
+    def virtual_user(index):
+        set_log_context(job_id=f"vu-{index}")
+        automation = None
+        try:
+            automation = SwiggyAutomation(
+                phone_number=f"9{index:09d}",
+                headless=True,
+                session_file=None,
+                checkpoint_file=None,
+                base_url=base_url,
+                locator_store=locator_store,
+                timeout_store=timeout_store,
+                replay_store=replay_store,
+                **options
+            )
+            iteration = 0
+            # Users above the profile's current count finish their iteration and leave
+            while not stop.is_set() and index < active_users[0]:
+                iteration += 1
+                # Every iteration starts with an empty cart, logged out or from the given session
+                automation.start_new_session(automation.phone_number, session_file)
+                offset = time.time() - started
+                start = time.perf_counter()
+                try:
+                    success = automation.run_automation(restaurant_name=restaurant, item_name=item)
+                except Exception as e:
+                    logging.error(f"Virtual user {index} iteration {iteration} raised: {e}")
+                    success = False
+                total = time.perf_counter() - start
+                with lock:
+                    runs.append({
+                        "user": index,
+                        "iteration": iteration,
+                        "offset": round(offset, 3),
+                        "success": success,
+                        "total": total,
+                        "steps": [[name, duration, ok] for name, duration, ok in automation.tracer.step_results()],
+                    })
+                stop.wait(max(0.0, pause()))
+        except Exception as e:
+            logging.error(f"Virtual user {index} could not start: {e}")
+            with lock:
+                startup_failures.append({"user": index, "error": str(e)})
+        finally:
+            if automation:
+                automation.quit()
+            clear_log_context("job_id")
+
+    threads = {}
+    try:
+        while True:
+            elapsed = time.time() - started
+            if elapsed >= profile.duration:
+                break
+            wanted = profile.users_at(elapsed)
+            active_users[0] = wanted
+            for index in range(wanted):
+                if index not in threads:
+                    thread = threading.Thread(target=virtual_user, args=(index,), name=f"vu-{index}", daemon=True)
+                    threads[index] = thread
+                    thread.start()
+            running = sum(1 for thread in threads.values() if thread.is_alive())
+            timeline.append([round(elapsed, 1), wanted, running])
+            time.sleep(CONTROL_INTERVAL)
+    finally:
+        active_users[0] = 0
+        stop.set()
+        for thread in threads.values():
+            thread.join()
+        if server:
+            server.stop()
+    duration = time.time() - started
+
+    step_names = []
+    for run in runs:
+        step_names.extend(name for name, _, _ in run["steps"] if name not in step_names)
+    report = {
+        "settings": {
+            "profile": profile.to_dict(),
+            "think_time": think_time,
+            "base_url": None if server else base_url,
+            "session_file": session_file,
+            "restaurant": restaurant,
+            "item": item,
+            "page_latency": page_latency if server else None,
+            "api_latency": api_latency if server else None,
+            "render_delay_ms": render_delay_ms if server else None,
+        },
+        "duration": round(duration, 3),
+        "users_started": len(threads),
+        "startup_failures": startup_failures,
+        "iterations": len(runs),
+        "failures": sum(1 for run in runs if not run["success"]),
+        "throughput_per_minute": round(len(runs) * 60 / duration, 3) if duration else None,
+        "successes_per_minute": round(sum(1 for run in runs if run["success"]) * 60 / duration, 3) if duration else None,
+        "end_to_end": load_stats([run["total"] for run in runs if run["success"]], len(runs)),
+        "steps": {},
+        "timeline": timeline,
+        "runs": runs,
+    }
+    for name in step_names:
+        results = [(duration, ok) for run in runs for step, duration, ok in run["steps"] if step == name]
+        report["steps"][name] = load_stats([duration for duration, ok in results if ok], len(results))
+    return report
+
+
+def load_stats(durations, attempts):
+    """Latency statistics of the successful durations plus the error count and rate out of all attempts"""
+    stats = timing_stats(durations)
+    errors = attempts - len(durations)
+    stats.update(errors=errors, error_rate=round(errors / attempts, 4) if attempts else None)
+    return stats
+
+
+def format_report(report):
+    """Render a load-test report as a text table"""
+    lines = [f"{'STEP':<40} {'COUNT':>6} {'ERR%':>6} {'P50':>8} {'P95':>8} {'P99':>8} {'MAX':>8}"]
+    rows = list(report["steps"].items()) + [("END TO END", report["end_to_end"])]
+    for name, stats in rows:
+        attempts = stats["count"] + stats["errors"]
+        error_rate = f"{stats['error_rate']:.1%}" if stats["error_rate"] is not None else "-"
+        if stats["count"] == 0:
+            lines.append(f"{name[:40]:<40} {attempts:>6} {error_rate:>6} {'-':>8} {'-':>8} {'-':>8} {'-':>8}")
+            continue
+        lines.append(
+            f"{name[:40]:<40} {attempts:>6} {error_rate:>6} {stats['p50']:>7.3f}s {stats['p95']:>7.3f}s "
+            f"{stats['p99']:>7.3f}s {stats['max']:>7.3f}s"
+        )
+    lines.append(
+        f"{report['iterations'] - report['failures']}/{report['iterations']} iterations succeeded in "
+        f"{report['duration']:.0f}s with up to {report['settings']['profile']['users']} users "
+        f"({report['throughput_per_minute']} iterations/min)"
+    )
+    if report["startup_failures"]:
+        lines.append(f"{len(report['startup_failures'])} virtual user(s) could not start a browser")
+    return "\n".join(lines)
+
+
+def save_report(report, path=LOAD_REPORT_FILE, csv_path=LOAD_CSV_FILE):
+    """Write the load-test report as JSON and its per-step statistics as CSV"""
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logging.info(f"Load-test report written to {path}")
+    if csv_path:
+        rows = list(report["steps"].items()) + [("end_to_end", report["end_to_end"])]
+        with open(csv_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for name, stats in rows:
+                writer.writerow(dict(stats, name=name))
+        logging.info(f"Load-test statistics written to {csv_path}")
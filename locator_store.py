@@ -0,0 +1,109 @@
+import time
+
+from json_store import JsonStore
+
+# Default on-disk location of the locator statistics
+LOCATOR_STATS_FILE = "locator_stats.json"
+
+# A locator that used to match but has found nothing in this many lookups in a row is
+# treated as stale (the UI probably changed) and tried last
+STALE_AFTER_MISSES = 3
+
+
+def locator_key(locator):
+    """Stable string key for a (By, value) locator tuple"""
+    locator_type, locator_value = locator
+    return f"{locator_type}={locator_value}"
+
+
+class LocatorStore(JsonStore):
+    """Locator hit/miss statistics per lookup ('step/label'), persisted between runs"""
+
+    description = "locator stats"
+
+    def __init__(self, path=LOCATOR_STATS_FILE):
+        super().__init__(path)
+
+    def restore(self, data):
+        self.steps = data or {}
+
+    def snapshot(self):
+        return self.steps
+
+    def _entry(self, step, locator):
+        return self.steps.setdefault(step, {}).setdefault(locator_key(locator), {
+            "hits": 0,
+            "misses": 0,
+            "consecutive_misses": 0,
+            "total_match_time": 0.0,
+            "last_hit": None,
+        })
+
+    def is_stale(self, stats):
+        """Whether a locator that used to match has stopped matching"""
+        return stats["hits"] > 0 and stats["consecutive_misses"] >= STALE_AFTER_MISSES
+
+    def rank(self, step, locators):
+        """Order locators so the most reliable one comes first: highest hit rate, then most recently hit"""
+        with self.lock:
+            step_stats = {key: dict(stats) for key, stats in self.steps.get(step, {}).items()}
+
+        def sort_key(indexed):
+            index, locator = indexed
+            stats = step_stats.get(locator_key(locator))
+            if not stats or stats["hits"] == 0:
+                # Unproven locators keep their hand-written order
+                return (1, 0.0, 0.0, index)
+            if self.is_stale(stats):
+                return (2, 0.0, 0.0, index)
+            # Time to match mostly measures how fast the page rendered, so it doesn't decide the order
+            hit_rate = stats["hits"] / (stats["hits"] + stats["misses"])
+            return (0, -hit_rate, -(stats["last_hit"] or 0.0), index)
+
+        return [locator for _, locator in sorted(enumerate(locators), key=sort_key)]
+
+    def record(self, step, winner, elapsed, missed=()):
+        """Record the outcome of one lookup: the winning locator (or None) with its time to match, and the
+        locators that were checked and matched nothing. Locators never checked (the race stopped at the
+        winner) are left alone."""
+        with self.lock:
+            if winner is not None:
+                stats = self._entry(step, winner)
+                stats["hits"] += 1
+                stats["consecutive_misses"] = 0
+                stats["total_match_time"] += elapsed
+                stats["last_hit"] = time.time()
+            for locator in missed:
+                stats = self._entry(step, locator)
+                stats["misses"] += 1
+                stats["consecutive_misses"] += 1
+            self.dirty = True
+
+    def format_stats(self, step=None):
+        """Render the statistics as a text table; step filters by workflow step ID or full 'step/label'"""
+        if not self.steps:
+            return f"No locator statistics recorded in {self.path}"
+
+        rows = []
+        for step_name, step_stats in self.steps.items():
+            if step and step_name != step and not step_name.startswith(f"{step}/"):
+                continue
+            for key, stats in step_stats.items():
+                lookups = stats["hits"] + stats["misses"]
+                hit_rate = stats["hits"] / lookups if lookups else 0.0
+                avg_time = stats["total_match_time"] / stats["hits"] if stats["hits"] else None
+                rows.append((step_name, key, stats, hit_rate, avg_time))
+
+        if not rows:
+            return f"No locator statistics recorded for step '{step}'"
+
+        rows.sort(key=lambda row: (row[0], row[4] is None, row[4] or 0.0))
+        lines = [f"{'LOOKUP':<28} {'HITS':>5} {'MISSES':>6} {'HIT%':>6} {'AVG MATCH':>10}  LOCATOR"]
+        for step_name, key, stats, hit_rate, avg_time in rows:
+            avg_text = f"{avg_time:.3f}s" if avg_time is not None else "-"
+            flag = " (stale)" if self.is_stale(stats) else ""
+            lines.append(
+                f"{step_name[:28]:<28} {stats['hits']:>5} {stats['misses']:>6} "
+                f"{hit_rate * 100:>5.1f}% {avg_text:>10}  {key}{flag}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,437 @@
+import argparse
+import json
+import logging
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Restaurants and menus served by the stand-in site
+MOCK_RESTAURANTS = [
+    {
+        "id": "10001", "name": "Chandrika Grand", "slug": "chandrika-grand",
+        "rating": 4.3, "eta": "30-35 mins", "distance": "2.4 km", "cuisines": "South Indian, Chinese",
+        "menu": [
+            {"id": "501", "name": "Masala Dosa", "price": 120},
+            {"id": "502", "name": "Idli Vada", "price": 90},
+            {"id": "503", "name": "Veg Biryani", "price": 220, "customizable": True},
+            {"id": "504", "name": "Filter Coffee", "price": 40},
+        ],
+    },
+    {
+        "id": "10002", "name": "Chandrika Grand Express", "slug": "chandrika-grand-express",
+        "rating": 4.0, "eta": "20-25 mins", "distance": "1.1 km", "cuisines": "South Indian",
+        "menu": [
+            {"id": "601", "name": "Masala Dosa", "price": 110},
+            {"id": "602", "name": "Filter Coffee", "price": 35},
+        ],
+    },
+    {
+        "id": "10003", "name": "Domino's Pizza", "slug": "dominos-pizza",
+        "rating": 4.1, "eta": "25-30 mins", "distance": "3.0 km", "cuisines": "Pizzas",
+        "menu": [
+            {"id": "701", "name": "Margherita", "price": 239, "customizable": True},
+            {"id": "702", "name": "Garlic Breadsticks", "price": 119},
+        ],
+    },
+    {
+        "id": "10004", "name": "Meghana Foods", "slug": "meghana-foods",
+        "rating": 4.5, "eta": "35-40 mins", "distance": "4.2 km", "cuisines": "Biryani, Andhra",
+        "menu": [
+            {"id": "801", "name": "Chicken Biryani", "price": 310},
+            {"id": "802", "name": "Veg Biryani", "price": 250},
+        ],
+    },
+]
+
+MOCK_ADDRESSES = [
+    {"id": "a1", "type": "Home", "line": "12, 4th Cross, Indiranagar, Bengaluru"},
+    {"id": "a2", "type": "Work", "line": "Tower B, Outer Ring Road, Bengaluru"},
+]
+
+PAGE_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+header { display: flex; justify-content: space-between; padding: 16px; border-bottom: 1px solid #ddd; }
+.drawer { position: fixed; top: 0; right: 0; width: 360px; height: 100%; background: #fff;
+          box-shadow: -2px 0 8px #0003; padding: 24px; display: none; }
+.shimmer { height: 80px; margin: 12px; background: #eee; }
+.restaurant-card, .menu-item, .address-item { display: block; margin: 12px; padding: 12px; border: 1px solid #ddd; }
+.view-cart { position: fixed; bottom: 0; left: 0; right: 0; padding: 16px; background: #60b246; color: #fff; cursor: pointer; }
+.address-item.selected { border-color: #60b246; }
+.modal { position: fixed; top: 30%; left: 30%; padding: 24px; background: #fff; border: 1px solid #999; }
+"""
+
+# Shared page behaviour: latency-aware fetch helper, render delay and the login drawer
+PAGE_SCRIPT = """
+var CONFIG = window.MOCK_CONFIG;
+function api(method, path, body) {
+    return fetch(path, {method: method, body: body ? JSON.stringify(body) : undefined,
+                        headers: {'Content-Type': 'application/json'}}).then(function(r) { return r.json(); });
+}
+function later(fn) { setTimeout(fn, CONFIG.renderDelay); }
+function el(html) { var div = document.createElement('div'); div.innerHTML = html.trim(); return div.firstChild; }
+function escapeHtml(text) { var div = document.createElement('div'); div.textContent = text; return div.innerHTML; }
+function cart() { return JSON.parse(localStorage.getItem('mockCart') || '{}'); }
+function saveCart(items) { localStorage.setItem('mockCart', JSON.stringify(items)); }
+function cartCount() { var c = cart(), n = 0; for (var k in c) { n += c[k].quantity; } return n; }
+
+if (!localStorage.getItem('userLocation')) {
+    // Simulate the site detecting the delivery location shortly after load
+    later(function() {
+        localStorage.setItem('userLocation', JSON.stringify({lat: 12.97, lng: 77.64, address: 'Indiranagar'}));
+    });
+}
+
+function openLogin() {
+    document.getElementById('login-drawer').style.display = 'block';
+}
+function sendOtp() {
+    api('POST', '/dapi/auth/sms-otp', {mobile: document.getElementById('mobile').value}).then(function() {
+        later(function() {
+            document.getElementById('phone-step').style.display = 'none';
+            document.getElementById('otp-step').style.display = 'block';
+            if (CONFIG.autoOtp) {
+                // Auto-fill hook standing in for the user typing the OTP
+                setTimeout(function() {
+                    document.getElementById('otp').value = '123456';
+                    document.getElementById('verify').disabled = false;
+                }, CONFIG.otpDelay);
+            }
+        });
+    });
+}
+function verifyOtp() {
+    api('POST', '/dapi/auth/verify-otp', {otp: document.getElementById('otp').value}).then(function(result) {
+        if (!result.ok) {
+            document.getElementById('otp-error').style.display = 'block';
+            return;
+        }
+        later(function() {
+            document.getElementById('login-drawer').style.display = 'none';
+            var signIn = document.getElementById('sign-in');
+            signIn.outerHTML = '<a href="/my-account" id="account">Account</a>';
+        });
+    });
+}
+"""
+
+LOGIN_DRAWER = """
+<div class="drawer" id="login-drawer">
+  <h2>Login</h2>
+  <div id="phone-step">
+    <input type="tel" id="mobile" name="mobile" maxlength="10" placeholder="Phone number">
+    <button onclick="sendOtp()">Continue</button>
+  </div>
+  <div id="otp-step" style="display: none">
+    <input type="tel" id="otp" maxlength="6" placeholder="One time password"
+           oninput="document.getElementById('verify').disabled = this.value.length !== 6">
+    <button id="verify" disabled onclick="verifyOtp()">Verify OTP</button>
+    <div id="otp-error" class="otp-error" style="display: none">Invalid OTP, please try again</div>
+  </div>
+</div>
+"""
+
+HOME_BODY = """
+<main><h1>Order food online</h1><a href="/search">Search for restaurants</a></main>
+"""
+
+SEARCH_BODY = """
+<main>
+  <input type="text" name="searchQuery" placeholder="Search for restaurants and food" id="search-input">
+  <div id="results"></div>
+</main>
+<script>
+function renderResults(query) {
+    var results = document.getElementById('results');
+    results.innerHTML = '<div class="shimmer"></div><div class="shimmer"></div>';
+    api('GET', '/dapi/restaurants/search/v3?str=' + encodeURIComponent(query)).then(function(data) {
+        later(function() {
+            results.innerHTML = '';
+            data.data.restaurants.forEach(function(r) {
+                results.appendChild(el(
+                    '<a class="restaurant-card" data-restaurant-id="' + r.id + '" href="/restaurants/' + r.slug + '-' + r.id + '">' +
+                    '<div class="restaurant-name">' + escapeHtml(r.name) + '</div>' +
+                    '<div class="rating">' + r.rating + '</div>' +
+                    '<div class="eta">' + r.eta + '</div>' +
+                    '<div class="distance">' + r.distance + '</div>' +
+                    '<div class="cuisines">' + escapeHtml(r.cuisines) + '</div></a>'));
+            });
+        });
+    });
+}
+document.getElementById('search-input').addEventListener('keydown', function(event) {
+    if (event.key === 'Enter') {
+        history.pushState({}, '', '/search?query=' + encodeURIComponent(this.value));
+        renderResults(this.value);
+    }
+});
+var initial = new URLSearchParams(location.search).get('query');
+if (initial) {
+    document.getElementById('search-input').value = initial;
+    renderResults(initial);
+}
+</script>
+"""
+
+MENU_BODY = """
+<main>
+  <h1 id="restaurant-name"></h1>
+  <div class="restaurant-meta"><span class="rating"></span> <span class="eta"></span></div>
+  <div id="menu"><div class="shimmer"></div><div class="shimmer"></div></div>
+</main>
+<div class="view-cart" id="view-cart" style="display: none" onclick="location.href='/checkout'">
+  <span class="cart-count" id="cart-count"></span> <span>View Cart</span>
+</div>
+<script>
+var RESTAURANT_ID = '%(restaurant_id)s';
+function updateCartBar() {
+    var count = cartCount();
+    document.getElementById('cart-count').textContent = count + (count === 1 ? ' item' : ' items');
+    document.getElementById('view-cart').style.display = count ? 'block' : 'none';
+}
+function addToCart(item, button) {
+    api('POST', '/dapi/cart', {restaurantId: RESTAURANT_ID, itemId: item.id}).then(function() {
+        var items = cart();
+        var entry = items[item.id] || {name: item.name, price: item.price, quantity: 0};
+        entry.quantity += 1;
+        items[item.id] = entry;
+        saveCart(items);
+        var quantity = document.querySelector('[data-item-id="' + item.id + '"] .quantity');
+        quantity.textContent = entry.quantity;
+        updateCartBar();
+    });
+}
+function onAdd(item, button) {
+    if (!item.customizable) {
+        addToCart(item, button);
+        return;
+    }
+    var modal = el('<div class="modal customization-modal"><h3>Customise ' + escapeHtml(item.name) + '</h3>' +
+                   '<label><input type="radio" name="size" checked> Regular</label>' +
+                   '<button class="add-item-confirm">Add Item to cart</button></div>');
+    modal.querySelector('button').onclick = function() { modal.remove(); addToCart(item, button); };
+    document.body.appendChild(modal);
+}
+api('GET', '/dapi/menu/pl?restaurantId=' + RESTAURANT_ID).then(function(data) {
+    later(function() {
+        var info = data.data.restaurant;
+        document.getElementById('restaurant-name').textContent = info.name;
+        document.querySelector('.restaurant-meta .rating').textContent = info.rating;
+        document.querySelector('.restaurant-meta .eta').textContent = info.eta;
+        var menu = document.getElementById('menu');
+        menu.innerHTML = '';
+        data.data.items.forEach(function(item) {
+            var quantity = (cart()[item.id] || {}).quantity || 0;
+            var node = el('<div class="menu-item" data-item-id="' + item.id + '">' +
+                          '<div class="item-name">' + escapeHtml(item.name) + '</div>' +
+                          '<div class="item-price">₹' + item.price + '</div>' +
+                          '<button class="add-button">ADD</button>' +
+                          '<span class="quantity">' + quantity + '</span></div>');
+            node.querySelector('button').onclick = function() { onAdd(item, this); };
+            menu.appendChild(node);
+        });
+        updateCartBar();
+    });
+});
+</script>
+"""
+
+CHECKOUT_BODY = """
+<main>
+  <h1>Secure Checkout</h1>
+  <div id="addresses"><div class="shimmer"></div></div>
+  <button id="pay" style="display: none">Proceed to Pay</button>
+</main>
+<script>
+api('GET', '/dapi/addresses').then(function(data) {
+    later(function() {
+        var container = document.getElementById('addresses');
+        container.innerHTML = '';
+        data.data.addresses.forEach(function(address) {
+            var node = el('<div class="address-item" data-address-id="' + address.id + '">' +
+                          '<div class="address-type">' + address.type + '</div>' +
+                          '<div class="address-line">' + escapeHtml(address.line) + '</div></div>');
+            node.onclick = function() {
+                api('POST', '/dapi/addresses/select', {id: address.id}).then(function() {
+                    document.querySelectorAll('.address-item').forEach(function(n) { n.classList.remove('selected'); });
+                    node.classList.add('selected');
+                    document.getElementById('pay').style.display = 'block';
+                });
+            };
+            container.appendChild(node);
+        });
+    });
+});
+</script>
+"""
+
+ACCOUNT_BODY = """
+<main><h1>My Account</h1></main>
+"""
+
+
+class MockSwiggyHandler(BaseHTTPRequestHandler):
+    """Serves the stand-in pages and JSON endpoints with the server's configured latency"""
+
+    server_version = "MockSwiggy/1.0"
+    # Keep-alive, so pooled API clients reuse their connections like they would against the real site
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without this, delayed ACKs stall each kept-alive response ~40ms
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logging.debug(f"mock-swiggy: {format % args}")
+
+    def logged_in(self):
+        return "_is_logged_in=1" in self.headers.get("Cookie", "")
+
+    def send_body(self, status, content_type, body, headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_json(self, payload, headers=None):
+        time.sleep(self.server.api_latency)
+        self.send_body(200, "application/json", json.dumps(payload), headers)
+
+    def send_page(self, title, body):
+        time.sleep(self.server.page_latency)
+        config = {
+            "renderDelay": self.server.render_delay_ms,
+            "autoOtp": self.server.auto_otp,
+            "otpDelay": self.server.otp_delay_ms,
+        }
+        if self.logged_in():
+            account = '<a href="/my-account" id="account">Account</a>'
+        else:
+            account = '<a id="sign-in" href="javascript:void(0)" onclick="openLogin()">Sign in</a>'
+        html = (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            f"<title>{title}</title><style>{PAGE_STYLE}</style>"
+            f"<script>window.MOCK_CONFIG = {json.dumps(config)};</script>"
+            f"<script>{PAGE_SCRIPT}</script></head><body>"
+            f"<header><a href='/'>Swiggy</a><a href='/search'>Search</a>{account}</header>"
+            f"{LOGIN_DRAWER}{body}</body></html>"
+        )
+        self.send_body(200, "text/html; charset=utf-8", html)
+
+    def restaurant(self, restaurant_id):
+        return next((r for r in MOCK_RESTAURANTS if r["id"] == restaurant_id), None)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        menu_match = re.fullmatch(r"/restaurants/[\w-]*?-?(\d+)", url.path)
+
+        if url.path == "/":
+            self.send_page("Swiggy", HOME_BODY)
+        elif url.path == "/search":
+            self.send_page("Search | Swiggy", SEARCH_BODY)
+        elif menu_match and self.restaurant(menu_match.group(1)):
+            self.send_page("Menu | Swiggy", MENU_BODY % {"restaurant_id": menu_match.group(1)})
+        elif url.path == "/checkout":
+            self.send_page("Checkout | Swiggy", CHECKOUT_BODY)
+        elif url.path == "/my-account":
+            self.send_page("Account | Swiggy", ACCOUNT_BODY)
+        elif url.path == "/robots.txt":
+            self.send_body(200, "text/plain", "User-agent: *\n")
+        elif url.path == "/dapi/restaurants/search/v3":
+            term = query.get("str", [""])[0].lower()
+            matches = [
+                {key: value for key, value in r.items() if key != "menu"}
+                for r in MOCK_RESTAURANTS if term and term in r["name"].lower()
+            ]
+            self.send_json({"statusCode": 0, "data": {"restaurants": matches}})
+        elif url.path == "/dapi/menu/pl":
+            restaurant = self.restaurant(query.get("restaurantId", [""])[0])
+            if not restaurant:
+                self.send_body(404, "application/json", json.dumps({"statusCode": 1, "error": "not found"}))
+                return
+            info = {key: value for key, value in restaurant.items() if key != "menu"}
+            self.send_json({"statusCode": 0, "data": {"restaurant": info, "items": restaurant["menu"]}})
+        elif url.path == "/dapi/addresses":
+            self.send_json({"statusCode": 0, "data": {"addresses": MOCK_ADDRESSES}})
+        else:
+            self.send_body(404, "text/html", "<h1>Page not found</h1>")
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        if url.path == "/dapi/auth/sms-otp":
+            self.send_json({"ok": True})
+        elif url.path == "/dapi/auth/verify-otp":
+            if body.get("otp") == "123456":
+                self.send_json({"ok": True}, {"Set-Cookie": "_is_logged_in=1; Path=/"})
+            else:
+                self.send_json({"ok": False})
+        elif url.path in ("/dapi/cart", "/dapi/addresses/select"):
+            self.send_json({"ok": True})
+        else:
+            self.send_body(404, "application/json", json.dumps({"ok": False}))
+
+
+class MockSwiggyServer(ThreadingHTTPServer):
+    """Local stand-in for the Swiggy site with configurable latency"""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, page_latency=0.0, api_latency=0.0, render_delay_ms=0,
+                 auto_otp=True, otp_delay_ms=200):
+        super().__init__((host, port), MockSwiggyHandler)
+        self.page_latency = page_latency
+        self.api_latency = api_latency
+        self.render_delay_ms = render_delay_ms
+        self.auto_otp = auto_otp
+        self.otp_delay_ms = otp_delay_ms
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread and return the base URL"""
+        self.thread = threading.Thread(target=self.serve_forever, name="mock-swiggy", daemon=True)
+        self.thread.start()
+        logging.info(f"Mock Swiggy site running at {self.base_url}")
+        return self.base_url
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    """Run the mock site in the foreground"""
+    parser = argparse.ArgumentParser(description="Local stand-in for the Swiggy site")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Seconds added to every page response")
+    parser.add_argument("--api-latency", type=float, default=0.0, help="Seconds added to every JSON response")
+    parser.add_argument("--render-delay", type=int, default=0, help="Milliseconds before fetched content renders")
+    parser.add_argument("--manual-otp", action="store_true", help="Do not auto-fill the OTP (use 123456)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server = MockSwiggyServer(port=args.port, page_latency=args.page_latency, api_latency=args.api_latency,
+                              render_delay_ms=args.render_delay, auto_otp=not args.manual_otp)
+    logging.info(f"Serving mock Swiggy site at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
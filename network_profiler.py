@@ -0,0 +1,346 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, parse_qsl
+
+# Records every long task (>50 ms of main-thread work) of each new document
+LONG_TASK_OBSERVER_JS = """
+window.__swiggyLongTasks = [];
+try {
+    new PerformanceObserver(function(list) {
+        list.getEntries().forEach(function(entry) {
+            window.__swiggyLongTasks.push(entry.duration);
+        });
+    }).observe({type: 'longtask', buffered: true});
+} catch (e) {}
+"""
+
+# Returns and clears the long task durations recorded on the current page
+TAKE_LONG_TASKS_JS = "var tasks = window.__swiggyLongTasks || []; window.__swiggyLongTasks = []; return tasks;"
+
+# Performance.getMetrics counters reported per step, as (metric, summary key, scale)
+PAGE_METRICS = [
+    ("TaskDuration", "task_ms", 1000),
+    ("ScriptDuration", "script_ms", 1000),
+    ("LayoutDuration", "layout_ms", 1000),
+    ("RecalcStyleDuration", "style_ms", 1000),
+]
+
+# Heaviest hosts and slowest requests listed per step
+PROFILE_TOP_N = 5
+
+UNATTRIBUTED_STEP = "(between steps)"
+
+
+def enable_performance_logging(chrome_options):
+    """Ask ChromeDriver to buffer CDP Network events in the 'performance' log"""
+    prefs = dict(chrome_options.capabilities.get("goog:loggingPrefs") or {})
+    prefs["performance"] = "ALL"
+    chrome_options.set_capability("goog:loggingPrefs", prefs)
+    chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+
+def headers_list(headers):
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+class NetworkProfiler:
+    """Attributes network requests, bytes, long tasks, page metrics and WebDriver round-trips to workflow steps"""
+
+    def __init__(self):
+        self.driver = None
+        self.collecting = False
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Forget everything recorded for the previous run"""
+        self.steps = {}
+        self.requests = {}
+        self.current = None
+        self.step_started = {}
+
+    def attach(self, driver):
+        """Enable the CDP domains and count WebDriver commands on a freshly started driver"""
+        self.driver = driver
+        try:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": LONG_TASK_OBSERVER_JS})
+        except Exception as e:
+            logging.warning(f"Could not enable CDP profiling: {e}")
+
+        original_execute = driver.execute
+
+        def timed_execute(command, params=None):
+            if self.collecting:
+                return original_execute(command, params)
+            start = time.perf_counter()
+            try:
+                return original_execute(command, params)
+            finally:
+                self.record_command(time.perf_counter() - start)
+
+        driver.execute = timed_execute
+        logging.info("Network profiling enabled")
+
+    def step(self, name):
+        """The summary record of a step, created on first use"""
+        if name not in self.steps:
+            self.steps[name] = {
+                "step": name,
+                "duration": 0.0,
+                "requests": 0,
+                "failed": 0,
+                "blocked": 0,
+                "bytes": 0,
+                "by_type": {},
+                "long_tasks": 0,
+                "long_task_ms": 0.0,
+                "webdriver_commands": 0,
+                "webdriver_ms": 0.0,
+                "metrics": dict.fromkeys([key for _, key, _ in PAGE_METRICS], 0.0),
+                "js_heap_mb": None,
+            }
+        return self.steps[name]
+
+    def record_command(self, elapsed):
+        with self.lock:
+            record = self.step(self.current or UNATTRIBUTED_STEP)
+            record["webdriver_commands"] += 1
+            record["webdriver_ms"] += elapsed * 1000
+
+    def page_metrics(self):
+        self.collecting = True
+        try:
+            metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        except Exception:
+            return {}
+        finally:
+            self.collecting = False
+        return {metric["name"]: metric["value"] for metric in metrics}
+
+    def start_step(self, name):
+        """Attribute everything from now on to the named step"""
+        self.collect()
+        self.current = name
+        self.step_started[name] = (time.perf_counter(), self.page_metrics())
+
+    def end_step(self):
+        """Close the current step: drain pending events, long tasks and page metric deltas into it"""
+        if self.current is None:
+            return None
+        self.collect()
+        started, before = self.step_started.pop(self.current)
+        after = self.page_metrics()
+        record = self.step(self.current)
+        record["duration"] += time.perf_counter() - started
+        for metric, key, scale in PAGE_METRICS:
+            if metric in after:
+                # Counters restart with every new document; a drop means the step navigated
+                delta = after[metric] - before.get(metric, 0)
+                record["metrics"][key] += (after[metric] if delta < 0 else delta) * scale
+        if "JSHeapUsedSize" in after:
+            record["js_heap_mb"] = round(after["JSHeapUsedSize"] / (1024 * 1024), 1)
+        self.current = None
+        logging.info(f"Profile: {format_step(record)}")
+        return record
+
+    def collect(self):
+        """Drain ChromeDriver's performance log and the page's long tasks into the current step"""
+        if self.driver is None:
+            return
+        # The profiler's own commands are not WebDriver chatter of the step
+        self.collecting = True
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logging.debug(f"Could not read the performance log: {e}")
+            entries = []
+        try:
+            long_tasks = self.driver.execute_script(TAKE_LONG_TASKS_JS) or []
+        except Exception:
+            # Mid-navigation; the old document's tasks are gone
+            long_tasks = []
+        finally:
+            self.collecting = False
+
+        step_name = self.current or UNATTRIBUTED_STEP
+        with self.lock:
+            if long_tasks:
+                record = self.step(step_name)
+                record["long_tasks"] += len(long_tasks)
+                record["long_task_ms"] += sum(long_tasks)
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, ValueError):
+                    continue
+                self.handle_event(step_name, message.get("method"), message.get("params", {}))
+
+    def handle_event(self, step_name, method, params):
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            if request_id in self.requests and params.get("redirectResponse"):
+                # A redirect reuses the request ID; keep the hop as its own entry
+                self.requests[f"{request_id}:{params['timestamp']}"] = self.requests.pop(request_id)
+            self.requests[request_id] = {
+                "step": step_name,
+                "url": params["request"]["url"],
+                "method": params["request"]["method"],
+                "request_headers": params["request"].get("headers", {}),
+                "type": params.get("type", "Other"),
+                "wall_time": params.get("wallTime", time.time()),
+                "start": params["timestamp"],
+                "end": None,
+                "status": None,
+                "status_text": "",
+                "mime_type": "",
+                "response_headers": {},
+                "protocol": "",
+                "bytes": 0,
+                "error": None,
+            }
+            self.step(step_name)["requests"] += 1
+            return
+
+        request = self.requests.get(request_id)
+        if request is None:
+            return
+        if method == "Network.responseReceived":
+            response = params["response"]
+            request.update(status=response.get("status"), status_text=response.get("statusText", ""),
+                           mime_type=response.get("mimeType", ""), response_headers=response.get("headers", {}),
+                           protocol=response.get("protocol", ""))
+        elif method == "Network.loadingFinished":
+            request.update(end=params["timestamp"], bytes=params.get("encodedDataLength", 0))
+            record = self.step(request["step"])
+            record["bytes"] += request["bytes"]
+            by_type = record["by_type"].setdefault(request["type"], {"requests": 0, "bytes": 0})
+            by_type["requests"] += 1
+            by_type["bytes"] += request["bytes"]
+        elif method == "Network.loadingFailed":
+            request.update(end=params["timestamp"], error=params.get("blockedReason") or params.get("errorText"))
+            self.step(request["step"])["blocked" if params.get("blockedReason") else "failed"] += 1
+
+    def summary(self):
+        """Per-step totals plus the heaviest hosts and slowest requests of each step"""
+        with self.lock:
+            requests = list(self.requests.values())
+            steps = [dict(record, by_type=dict(record["by_type"]), metrics=dict(record["metrics"]))
+                     for record in self.steps.values()]
+        for record in steps:
+            own = [request for request in requests if request["step"] == record["step"]]
+            hosts = {}
+            for request in own:
+                host = urlsplit(request["url"]).hostname or "-"
+                hosts[host] = hosts.get(host, 0) + request["bytes"]
+            record["top_hosts"] = sorted(hosts.items(), key=lambda pair: -pair[1])[:PROFILE_TOP_N]
+            timed = [request for request in own if request["end"] is not None]
+            timed.sort(key=lambda request: request["start"] - request["end"])
+            record["slowest"] = [
+                {"url": request["url"], "ms": round((request["end"] - request["start"]) * 1000, 1)}
+                for request in timed[:PROFILE_TOP_N]
+            ]
+            record["duration"] = round(record["duration"], 4)
+            record["webdriver_ms"] = round(record["webdriver_ms"], 1)
+            record["long_task_ms"] = round(record["long_task_ms"], 1)
+            record["metrics"] = {key: round(value, 1) for key, value in record["metrics"].items()}
+        return steps
+
+    def har(self):
+        """The recorded requests as a HAR 1.2 log, with one page per step"""
+        with self.lock:
+            requests = list(self.requests.values())
+        pages = []
+        for request in requests:
+            if request["step"] not in [page["id"] for page in pages]:
+                pages.append({
+                    "id": request["step"],
+                    "title": request["step"],
+                    "startedDateTime": iso_time(request["wall_time"]),
+                    "pageTimings": {},
+                })
+        entries = []
+        for request in requests:
+            elapsed = (request["end"] - request["start"]) * 1000 if request["end"] is not None else -1
+            entries.append({
+                "pageref": request["step"],
+                "startedDateTime": iso_time(request["wall_time"]),
+                "time": round(max(elapsed, 0), 3),
+                "request": {
+                    "method": request["method"],
+                    "url": request["url"],
+                    "httpVersion": request["protocol"] or "HTTP/1.1",
+                    "cookies": [],
+                    "headers": headers_list(request["request_headers"]),
+                    "queryString": [{"name": name, "value": value}
+                                    for name, value in parse_qsl(urlsplit(request["url"]).query)],
+                    "headersSize": -1,
+                    "bodySize": -1,
+                },
+                "response": {
+                    "status": request["status"] or 0,
+                    "statusText": request["status_text"] or (request["error"] or ""),
+                    "httpVersion": request["protocol"] or "HTTP/1.1",
+                    "cookies": [],
+                    "headers": headers_list(request["response_headers"]),
+                    "content": {"size": request["bytes"], "mimeType": request["mime_type"]},
+                    "redirectURL": "",
+                    "headersSize": -1,
+                    "bodySize": request["bytes"],
+                },
+                "cache": {},
+                "timings": {"send": 0, "wait": round(max(elapsed, 0), 3), "receive": 0},
+                "_resourceType": request["type"],
+                "_error": request["error"],
+            })
+        return {"log": {"version": "1.2", "creator": {"name": "swiggy-automation", "version": "1.0"},
+                        "pages": pages, "entries": entries}}
+
+    def export(self, profile_dir, run_id):
+        """Write profile_dir/har-<run_id>.har and profile-<run_id>.json"""
+        try:
+            os.makedirs(profile_dir, exist_ok=True)
+            har_path = os.path.join(profile_dir, f"har-{run_id}.har")
+            with open(har_path, "w", encoding="utf-8") as f:
+                json.dump(self.har(), f)
+            summary_path = os.path.join(profile_dir, f"profile-{run_id}.json")
+            with open(summary_path, "w", encoding="utf-8") as f:
+                json.dump({"run_id": run_id, "steps": self.summary()}, f, indent=2)
+            logging.info(f"Network profile written to {summary_path} and {har_path}")
+        except OSError as e:
+            logging.warning(f"Could not export network profile to {profile_dir}: {e}")
+
+
+def iso_time(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def format_step(record):
+    """One-line summary of a step's profile"""
+    return (
+        f"{record['step']}: {record['requests']} request(s), {record['bytes'] / 1024:.0f} KB, "
+        f"{record['failed']} failed, {record['blocked']} blocked, "
+        f"{record['long_tasks']} long task(s) ({record['long_task_ms']:.0f} ms), "
+        f"script {record['metrics']['script_ms']:.0f} ms, "
+        f"{record['webdriver_commands']} WebDriver command(s) ({record['webdriver_ms']:.0f} ms)"
+    )
+
+
+def format_profile(steps):
+    """Render a profile summary as a text table"""
+    lines = [f"{'STEP':<28} {'TIME':>7} {'REQS':>5} {'KB':>7} {'FAIL':>5} {'BLOCK':>5} {'LONG':>5} "
+             f"{'LONG MS':>8} {'SCRIPT MS':>9} {'WD CMDS':>7} {'WD MS':>7}"]
+    for record in steps:
+        lines.append(
+            f"{record['step'][:28]:<28} {record['duration']:>6.2f}s {record['requests']:>5} "
+            f"{record['bytes'] / 1024:>7.0f} {record['failed']:>5} {record['blocked']:>5} {record['long_tasks']:>5} "
+            f"{record['long_task_ms']:>8.0f} {record['metrics']['script_ms']:>9.0f} "
+            f"{record['webdriver_commands']:>7} {record['webdriver_ms']:>7.0f}"
+        )
+        for host, size in record.get("top_hosts", []):
+            lines.append(f"    {host:<40} {size / 1024:>7.0f} KB")
+    return "\n".join(lines)
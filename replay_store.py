@@ -0,0 +1,76 @@
+import time
+
+from json_store import JsonStore
+
+# Default on-disk location of the recorded flow
+REPLAY_FILE = "replay.json"
+
+# Share of a recorded fingerprint's non-empty fields (besides the tag) that must still match
+FINGERPRINT_MIN_MATCH = 0.75
+
+
+def fingerprint_matches(recorded, current):
+    """Whether an element still looks like the one recorded: same tag and most other attributes"""
+    if not recorded or not current or recorded.get("tag") != current.get("tag"):
+        return False
+    fields = [name for name, value in recorded.items() if name != "tag" and value]
+    if not fields:
+        return True
+    same = sum(1 for name in fields if current.get(name) == recorded[name])
+    return same / len(fields) >= FINGERPRINT_MIN_MATCH
+
+
+class ReplayStore(JsonStore):
+    """Winning locator, element fingerprint and click method per step and element, from successful runs"""
+
+    description = "replay recording"
+
+    def __init__(self, path=REPLAY_FILE):
+        super().__init__(path)
+
+    def restore(self, data):
+        self.steps = data or {}
+
+    def snapshot(self):
+        return self.steps
+
+    def get(self, step, description):
+        """The recorded entry for an element of a step, or None"""
+        with self.lock:
+            entry = self.steps.get(step, {}).get(description)
+            return dict(entry) if entry else None
+
+    def commit(self, recording):
+        """Store what a successful run used: {step: {description: {locator, fingerprint, method}}}"""
+        with self.lock:
+            for step, elements in recording.items():
+                for description, element in elements.items():
+                    entry = self.steps.setdefault(step, {}).setdefault(description, {"replays": 0, "mismatches": 0})
+                    entry.update(locator=element["locator"], fingerprint=element["fingerprint"],
+                                 method=element["method"] or entry.get("method"), recorded_at=time.time())
+            self.dirty = True
+
+    def record_result(self, step, description, ok):
+        """Count one replay attempt as a hit or a fingerprint mismatch"""
+        with self.lock:
+            entry = self.steps.get(step, {}).get(description)
+            if entry is None:
+                return
+            entry["replays" if ok else "mismatches"] += 1
+            self.dirty = True
+
+    def format_stats(self):
+        """Render the recorded elements as a text table"""
+        if not self.steps:
+            return f"No flow recorded in {self.path}"
+        lines = [f"{'STEP':<12} {'ELEMENT':<28} {'METHOD':>6} {'REPLAYS':>7} {'MISMATCH':>8}  LOCATOR"]
+        with self.lock:
+            rows = [(step, description, dict(entry)) for step, elements in sorted(self.steps.items())
+                    for description, entry in sorted(elements.items())]
+        for step, description, entry in rows:
+            locator = "=".join(entry["locator"])
+            lines.append(
+                f"{step[:12]:<12} {description[:28]:<28} {entry.get('method') or '-':>6} {entry['replays']:>7} "
+                f"{entry['mismatches']:>8}  {locator}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,127 @@
+import logging
+import time
+from collections import OrderedDict
+
+from json_store import JsonStore
+from swiggy_api import normalize_name
+
+# Default on-disk location of the restaurant cache
+RESTAURANT_CACHE_FILE = "restaurant_cache.json"
+
+# Restaurant URLs and menus rarely change; re-resolve after a day anyway
+RESTAURANT_CACHE_TTL = 24 * 60 * 60
+
+# Least recently used entries beyond this are evicted
+RESTAURANT_CACHE_MAX_ENTRIES = 200
+
+COUNTERS = ("warm_hits", "cold_hits", "misses", "expired", "evictions", "invalidations")
+
+
+def location_key(location):
+    """Delivery location rounded to ~100 m, so small GPS jitter shares cache entries"""
+    if not location:
+        return "any"
+    return f"{float(location['lat']):.3f},{float(location['lng']):.3f}"
+
+
+def cache_key(location, restaurant_name):
+    return f"{location_key(location)}|{normalize_name(restaurant_name)}"
+
+
+class RestaurantCache(JsonStore):
+    """Resolved restaurant URLs and menu items keyed by (location, restaurant name), with TTL and LRU eviction"""
+
+    description = "restaurant cache"
+    # Entries are kept least recently used first
+    sort_keys = False
+
+    def __init__(self, path=RESTAURANT_CACHE_FILE, ttl=RESTAURANT_CACHE_TTL, max_entries=RESTAURANT_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = dict.fromkeys(COUNTERS, 0)
+        # Keys read or written by this process; a hit on one of them is warm, else cold (first use after loading)
+        self.used = set()
+        super().__init__(path)
+
+    def restore(self, data):
+        self.entries = OrderedDict((data or {}).get("entries", {}))
+        self.stats.update((data or {}).get("stats", {}))
+
+    def snapshot(self):
+        return {"entries": self.entries, "stats": self.stats}
+
+    def get(self, location, restaurant_name):
+        """The fresh entry for this restaurant, or None; counts the lookup as a warm/cold hit or a miss"""
+        key = cache_key(location, restaurant_name)
+        with self.lock:
+            self.dirty = True
+            entry = self.entries.get(key)
+            if entry and time.time() - entry["stored_at"] > self.ttl:
+                del self.entries[key]
+                self.stats["expired"] += 1
+                entry = None
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self.stats["warm_hits" if key in self.used else "cold_hits"] += 1
+            self.used.add(key)
+            entry["last_used"] = time.time()
+            self.entries.move_to_end(key)
+            return dict(entry)
+
+    def put(self, location, restaurant_name, url, restaurant=None, items=None):
+        """Remember where a restaurant resolved to, evicting the least recently used entries"""
+        key = cache_key(location, restaurant_name)
+        now = time.time()
+        with self.lock:
+            self.entries[key] = {
+                "query": restaurant_name,
+                "url": url,
+                "restaurant": restaurant,
+                "items": items,
+                "stored_at": now,
+                "last_used": now,
+            }
+            self.entries.move_to_end(key)
+            self.used.add(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+            self.dirty = True
+
+    def invalidate(self, location, restaurant_name, reason):
+        """Drop an entry that turned out to be wrong"""
+        key = cache_key(location, restaurant_name)
+        with self.lock:
+            if self.entries.pop(key, None) is None:
+                return
+            self.stats["invalidations"] += 1
+            self.dirty = True
+        logging.info(f"Dropped cached restaurant '{restaurant_name}': {reason}")
+
+    def hit_rate(self):
+        """Fraction of lookups served from the cache, or None before the first lookup"""
+        with self.lock:
+            hits = self.stats["warm_hits"] + self.stats["cold_hits"]
+            lookups = hits + self.stats["misses"]
+        return hits / lookups if lookups else None
+
+    def format_stats(self):
+        """Render the counters and cached restaurants as text"""
+        with self.lock:
+            stats = dict(self.stats)
+            entries = list(self.entries.items())
+        rate = self.hit_rate()
+        lines = [
+            f"{len(entries)} cached restaurant(s), hit rate {'-' if rate is None else f'{rate:.0%}'}",
+            "  ".join(f"{name}={stats[name]}" for name in COUNTERS),
+        ]
+        if entries:
+            lines.append(f"{'LOCATION':<16} {'RESTAURANT':<30} {'AGE':>8} {'ITEMS':>6}  URL")
+        for key, entry in reversed(entries):
+            location = key.split("|", 1)[0]
+            age = (time.time() - entry["stored_at"]) / 60
+            items = "-" if entry["items"] is None else len(entry["items"])
+            lines.append(f"{location:<16} {entry['query'][:30]:<30} {age:>6.0f}m {items:>6}  {entry['url']}")
+        return "\n".join(lines)
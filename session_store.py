@@ -0,0 +1,114 @@
+import json
+import logging
+import os
+import threading
+import time
+
+# Default on-disk location of the saved login session
+SESSION_FILE = "swiggy_session.json"
+
+# Saved sessions older than this are ignored (Swiggy expires logins eventually)
+SESSION_MAX_AGE = 7 * 24 * 60 * 60
+
+# Lightweight same-origin page used to attach cookies and localStorage
+# without rendering the full homepage
+SESSION_RESTORE_PATH = "/robots.txt"
+
+
+def capture_session(driver):
+    """Snapshot the browser's cookies and localStorage for the current origin"""
+    return {
+        "saved_at": time.time(),
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script(
+            "var items = {};"
+            "for (var i = 0; i < localStorage.length; i++) {"
+            "    var key = localStorage.key(i);"
+            "    items[key] = localStorage.getItem(key);"
+            "}"
+            "return items;"
+        ),
+    }
+
+
+def apply_session(driver, session, base_url):
+    """Attach captured cookies and localStorage to base_url; returns the number of cookies set"""
+    driver.get(base_url.rstrip("/") + SESSION_RESTORE_PATH)
+    restored = 0
+    for cookie in session["cookies"]:
+        # Chrome rejects expiry values with a fractional part
+        if "expiry" in cookie:
+            cookie["expiry"] = int(cookie["expiry"])
+        try:
+            driver.add_cookie(cookie)
+            restored += 1
+        except Exception as e:
+            logging.debug(f"Skipped cookie {cookie.get('name')}: {e}")
+    driver.execute_script(
+        "var items = arguments[0];"
+        "for (var key in items) { localStorage.setItem(key, items[key]); }",
+        session["local_storage"]
+    )
+    return restored
+
+
+def write_private_json(path, data):
+    """Write JSON readable only by the current user (the data holds authentication cookies)"""
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class SessionStore:
+    """Saves and restores the cookies and localStorage of a logged-in browser"""
+
+    def __init__(self, path=SESSION_FILE, max_age=SESSION_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+
+    def save(self, driver):
+        """Save the current cookies and localStorage; returns True on success"""
+        try:
+            session = capture_session(driver)
+            write_private_json(self.path, session)
+            logging.info(f"Saved session ({len(session['cookies'])} cookies) to {self.path}")
+            return True
+        except Exception as e:
+            logging.warning(f"Could not save session: {e}")
+            return False
+
+    def load(self):
+        """Return the saved session, or None if it is missing, unreadable or expired"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                session = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Could not read session from {self.path}: {e}")
+            return None
+        if time.time() - session.get("saved_at", 0) > self.max_age:
+            logging.info("Saved session has expired, ignoring it")
+            return None
+        return session
+
+    def restore(self, driver, base_url):
+        """Attach the saved cookies and localStorage to base_url; returns True if a session was restored"""
+        session = self.load()
+        if not session:
+            return False
+        try:
+            restored = apply_session(driver, session, base_url)
+            logging.info(f"Restored session ({restored} cookies) from {self.path}")
+            return restored > 0
+        except Exception as e:
+            logging.warning(f"Could not restore session: {e}")
+            return False
+
+    def clear(self):
+        """Delete the saved session, e.g. after it turned out to be logged out"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            logging.info(f"Removed stale session file {self.path}")
@@ -0,0 +1,153 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import threading
+import time
+
+# Default on-disk location of the JSON-lines log
+LOG_FILE = "swiggy_automation.log"
+
+# The log file is rotated at this size (or on a schedule, see configure_logging), keeping this many old files
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+CONSOLE_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+# Libraries whose DEBUG output (one record per WebDriver command) would drown the sampled debug log
+QUIET_LOGGERS = ("selenium", "urllib3")
+
+# Per-thread fields stamped on every record logged by that thread
+CONTEXT_FIELDS = ("run_id", "job_id", "step")
+
+_context = threading.local()
+_listener = None
+
+
+def set_log_context(**fields):
+    """Attach fields (run_id, job_id, step) to every later record logged by this thread"""
+    _context.__dict__.update(fields)
+
+
+def clear_log_context(*names):
+    """Remove the named context fields, or all of them, for this thread"""
+    for name in names or CONTEXT_FIELDS:
+        _context.__dict__.pop(name, None)
+
+
+class ContextFilter(logging.Filter):
+    """Copies the calling thread's log context onto the record before it leaves that thread"""
+
+    def filter(self, record):
+        for name in CONTEXT_FIELDS:
+            if not hasattr(record, name):
+                setattr(record, name, getattr(_context, name, None))
+        return True
+
+
+class DebugSampler(logging.Filter):
+    """Lets through only a random fraction of DEBUG records; other levels always pass"""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record with the time, level, message, thread and log context"""
+
+    def format(self, record):
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{int(record.msecs):03d}",
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS + ("duration",):
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the message and traceback separate, so each output handler formats its own"""
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(log_file=LOG_FILE, max_bytes=LOG_MAX_BYTES, backup_count=LOG_BACKUP_COUNT, rotate_when=None,
+                      debug_sample_rate=0.0, console=True):
+    """Route all logging through a queue to a background thread that writes JSON lines to a rotating
+    log_file and plain text to the console. rotate_when (e.g. 'midnight', 'H') rotates on a schedule
+    instead of by size; a debug_sample_rate above 0 logs that fraction of DEBUG records."""
+    global _listener
+    handlers = []
+    if log_file:
+        if rotate_when:
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                log_file, when=rotate_when, backupCount=backup_count, encoding="utf-8"
+            )
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+            )
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        # Sampled debug records go to the file only
+        console_handler.setLevel(logging.INFO)
+        handlers.append(console_handler)
+
+    # The automation threads only enqueue; formatting and file I/O happen on the listener's thread
+    log_queue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    if 0 < debug_sample_rate < 1:
+        queue_handler.addFilter(DebugSampler(debug_sample_rate))
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.DEBUG if debug_sample_rate > 0 else logging.INFO)
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.INFO)
+
+    shutdown_logging()
+    _listener = listener
+    return listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background writer"""
+    global _listener
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
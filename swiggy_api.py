@@ -0,0 +1,264 @@
+import difflib
+import http.client
+import json
+import logging
+import queue
+import re
+import unicodedata
+from urllib.parse import urlencode, urlsplit
+
+# JSON endpoints the site's search and menu pages call, relative to the site root
+SEARCH_PATH = "/dapi/restaurants/search/v3"
+MENU_PATH = "/dapi/menu/pl"
+
+# Idle keep-alive connections kept per client
+DEFAULT_POOL_SIZE = 4
+DEFAULT_API_TIMEOUT = 10
+
+# Keys that mark a JSON object as restaurant info rather than a menu item
+RESTAURANT_KEYS = ("cuisines", "avgRating", "slug", "sla")
+ITEM_KEYS = ("price", "defaultPrice")
+
+# Lowest match_score pick_restaurant accepts
+MIN_MATCH_SCORE = 0.6
+
+# Inexact candidates scoring within this of the best are too close to tell apart
+AMBIGUITY_MARGIN = 0.05
+
+
+class ApiError(Exception):
+    """A search/menu request failed; status is the HTTP status when there was a response"""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+class ConnectionPool:
+    """Reusable keep-alive HTTP(S) connections to one host, safe to share between threads"""
+
+    def __init__(self, base_url, size=DEFAULT_POOL_SIZE, timeout=DEFAULT_API_TIMEOUT):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.size = size
+        self.timeout = timeout
+        self.idle = queue.LifoQueue()
+
+    def acquire(self):
+        """An idle connection, or a new one if all are in use"""
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def release(self, connection):
+        """Return a connection for reuse, closing it if the pool is already full"""
+        if self.idle.qsize() < self.size:
+            self.idle.put_nowait(connection)
+        else:
+            connection.close()
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def walk(node):
+    """Every JSON object nested anywhere inside node"""
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from walk(value)
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def restaurant_url(info, base_url):
+    """Absolute URL of a restaurant's menu page"""
+    link = (info.get("cta") or {}).get("link") or info.get("url")
+    if link and link.startswith("http"):
+        return link
+    if link and link.startswith("/"):
+        return base_url + link
+    return f"{base_url}/restaurants/{info.get('slug') or slugify(info['name'])}-{info['id']}"
+
+
+def parse_restaurants(payload, base_url):
+    """Restaurant records from a search or menu response, in response order"""
+    records = []
+    seen = set()
+    for node in walk(payload.get("data", payload)):
+        if "id" not in node or "name" not in node or not any(key in node for key in RESTAURANT_KEYS):
+            continue
+        restaurant_id = str(node["id"])
+        if restaurant_id in seen:
+            continue
+        seen.add(restaurant_id)
+        sla = node.get("sla") or {}
+        cuisines = node.get("cuisines")
+        records.append({
+            "id": restaurant_id,
+            "name": node["name"],
+            "rating": node.get("rating", node.get("avgRating")),
+            "eta": node.get("eta") or sla.get("slaString"),
+            "distance": node.get("distance") or sla.get("lastMileTravelString"),
+            "cuisines": ", ".join(cuisines) if isinstance(cuisines, list) else cuisines,
+            "url": restaurant_url(node, base_url),
+        })
+    return records
+
+
+def parse_menu_items(payload):
+    """Menu item records from a menu response; prices are in the endpoint's own units"""
+    records = []
+    seen = set()
+    for node in walk(payload.get("data", payload)):
+        if "id" not in node or "name" not in node or not any(key in node for key in ITEM_KEYS):
+            continue
+        if any(key in node for key in RESTAURANT_KEYS) or str(node["id"]) in seen:
+            continue
+        seen.add(str(node["id"]))
+        records.append({
+            "id": str(node["id"]),
+            "name": node["name"],
+            "price": node.get("price", node.get("defaultPrice")),
+            "customizable": bool(node.get("customizable") or node.get("addons") or node.get("variantsV2")),
+        })
+    return records
+
+
+def normalize_name(text):
+    """Case-, accent- and punctuation-insensitive form of a restaurant or item name"""
+    text = "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch)).casefold()
+    text = re.sub(r"['\u2019`]", "", text).replace("&", " and ")
+    return " ".join(re.sub(r"[\W_]+", " ", text).split())
+
+
+def match_score(name, wanted):
+    """1.0 for the same normalized name, 0.8-1.0 when name contains wanted as whole words, else scaled
+    fuzzy similarity"""
+    name, wanted = normalize_name(name), normalize_name(wanted)
+    if not name or not wanted:
+        return 0.0
+    if name == wanted:
+        return 1.0
+    if f" {wanted} " in f" {name} ":
+        # Prefer the tightest containing name: "Chandrika Grand" over "Chandrika Grand Express"
+        return 0.8 + 0.2 * len(wanted) / len(name)
+    return 0.8 * difflib.SequenceMatcher(None, name, wanted).ratio()
+
+
+def pick_restaurant(restaurants, name, min_score=MIN_MATCH_SCORE):
+    """The record whose name best matches name: the first exact match (in result order, usually the
+    nearest branch), else the best partial match. None if nothing scores at least min_score, or if
+    several partial matches score too close to choose between."""
+    scored = [(match_score(restaurant["name"], name), restaurant) for restaurant in restaurants]
+    exact = [restaurant for score, restaurant in scored if score == 1.0]
+    if exact:
+        return exact[0]
+    candidates = sorted((pair for pair in scored if pair[0] >= min_score), key=lambda pair: -pair[0])
+    if not candidates:
+        return None
+    close = [restaurant["name"] for score, restaurant in candidates if candidates[0][0] - score < AMBIGUITY_MARGIN]
+    if len(close) > 1:
+        logging.error(f"'{name}' matches several restaurants about equally ({', '.join(close)}); "
+                      f"use the full name")
+        return None
+    return candidates[0][1]
+
+
+class SwiggyApiClient:
+    """Calls the search and menu JSON endpoints the site's own pages use, with the browser's cookies"""
+
+    def __init__(self, base_url, cookies=None, user_agent=None, pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_API_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.pool = ConnectionPool(self.base_url, pool_size, timeout)
+        self.user_agent = user_agent
+        self.cookie_header = ""
+        self.requests = 0
+        self.set_cookies(cookies or [])
+
+    @classmethod
+    def from_driver(cls, driver, base_url, **kwargs):
+        """A client authenticated as the WebDriver session"""
+        client = cls(base_url, user_agent=driver.execute_script("return navigator.userAgent"), **kwargs)
+        client.update_from_driver(driver)
+        return client
+
+    def set_cookies(self, cookies):
+        self.cookie_header = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+
+    def update_from_driver(self, driver):
+        """Pick up cookies the browser gained since the client was created (e.g. after login)"""
+        self.set_cookies(driver.get_cookies())
+
+    def get_json(self, path, params=None):
+        """GET a JSON endpoint on a pooled connection; raises ApiError on any failure"""
+        target = f"{path}?{urlencode(params)}" if params else path
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if self.cookie_header:
+            headers["Cookie"] = self.cookie_header
+        if self.user_agent:
+            headers["User-Agent"] = self.user_agent
+
+        # A pooled connection the server has since closed fails once; retry on a fresh one
+        for attempt in range(2):
+            connection = self.pool.acquire()
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                if attempt:
+                    raise ApiError(f"GET {path} failed: {e}") from e
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                self.pool.release(connection)
+            break
+        self.requests += 1
+
+        if response.status != 200:
+            raise ApiError(f"GET {path} returned HTTP {response.status}", response.status)
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise ApiError(f"GET {path} returned invalid JSON", response.status) from e
+        if payload.get("statusCode", 0) != 0:
+            raise ApiError(f"GET {path} returned statusCode {payload.get('statusCode')}", response.status)
+        return payload
+
+    def search_restaurants(self, query, location=None):
+        """Restaurant records matching query; location is a {'lat', 'lng'} dict when known"""
+        params = {"str": query}
+        if location:
+            params.update(lat=location["lat"], lng=location["lng"])
+        restaurants = parse_restaurants(self.get_json(SEARCH_PATH, params), self.base_url)
+        logging.debug(f"API search for '{query}' returned {len(restaurants)} restaurant(s)")
+        return restaurants
+
+    def fetch_menu(self, restaurant_id, location=None):
+        """{'restaurant': record or None, 'items': [records]} for one restaurant"""
+        params = {"restaurantId": restaurant_id}
+        if location:
+            params.update(lat=location["lat"], lng=location["lng"])
+        payload = self.get_json(MENU_PATH, params)
+        restaurants = parse_restaurants(payload, self.base_url)
+        return {"restaurant": restaurants[0] if restaurants else None, "items": parse_menu_items(payload)}
+
+    def close(self):
+        self.pool.close()
@@ -1,587 +1,2477 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, ElementClickInterceptedException
-import time
-import logging
-from datetime import datetime
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('swiggy_automation.log'),
-        logging.StreamHandler()
-    ]
-)
-
-class SwiggyAutomation:
-    def _init_(self, phone_number="9391496810", headless=False):
-        self.phone_number = phone_number
-        self.driver = None
-        self.wait = None
-        self.setup_driver(headless)
-        
-    def setup_driver(self, headless=False):
-        """Initialize Chrome WebDriver with optimized settings"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        
-        # Add performance and stability options
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-        
-        # Suppress Chrome logging
-        chrome_options.add_argument("--log-level=3")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--silent")
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.maximize_window()
-            self.wait = WebDriverWait(self.driver, 15)
-            logging.info("Chrome WebDriver initialized successfully")
-        except Exception as e:
-            logging.error(f"Failed to initialize WebDriver: {e}")
-            raise
-    
-    def safe_click(self, element, method="click"):
-        """Safely click an element with multiple fallback methods"""
-        try:
-            if method == "click":
-                element.click()
-            elif method == "js":
-                self.driver.execute_script("arguments[0].click();", element)
-            elif method == "action":
-                from selenium.webdriver.common.action_chains import ActionChains
-                ActionChains(self.driver).move_to_element(element).click().perform()
-            return True
-        except Exception as e:
-            logging.warning(f"Click method '{method}' failed: {e}")
-            return False
-    
-    def find_and_click(self, locators, description, timeout=10):
-        """Find element using multiple locators and click with fallback methods"""
-        for locator_type, locator_value in locators:
-            try:
-                element = WebDriverWait(self.driver, timeout).until(
-                    EC.element_to_be_clickable((locator_type, locator_value))
-                )
-                
-                # Try multiple click methods
-                for method in ["click", "js", "action"]:
-                    if self.safe_click(element, method):
-                        logging.info(f"Successfully clicked {description}")
-                        return True
-                        
-            except TimeoutException:
-                continue
-            except Exception as e:
-                logging.warning(f"Error with locator {locator_value}: {e}")
-                continue
-        
-        logging.error(f"Failed to find and click {description}")
-        return False
-    
-    def open_swiggy(self):
-        """Open Swiggy homepage"""
-        try:
-            self.driver.get("https://www.swiggy.com/")
-            logging.info("Opened Swiggy homepage")
-            time.sleep(3)
-            return True
-        except Exception as e:
-            logging.error(f"Failed to open Swiggy: {e}")
-            return False
-    
-    def debug_current_state(self):
-        """Debug current page state"""
-        try:
-            logging.info(f"Current URL: {self.driver.current_url}")
-            logging.info(f"Page Title: {self.driver.title}")
-            
-            # Check for common elements
-            elements_to_check = [
-                ("OTP input", "//input[@type='tel' and @maxlength='6']"),
-                ("OTP input", "//input[@placeholder*='OTP' or @placeholder*='otp']"),
-                ("Verify button", "//button[contains(text(),'Verify')]"),
-                ("Continue button", "//button[contains(text(),'Continue')]"),
-                ("Login form", "//form"),
-                ("Error message", "//*[contains(@class, 'error') or contains(text(), 'error')]")
-            ]
-            
-            for element_name, xpath in elements_to_check:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, xpath)
-                    if elements:
-                        logging.info(f"Found {len(elements)} {element_name} element(s)")
-                        for i, elem in enumerate(elements):
-                            if elem.is_displayed():
-                                logging.info(f"  {element_name} {i+1}: visible, enabled={elem.is_enabled()}")
-                            else:
-                                logging.info(f"  {element_name} {i+1}: hidden")
-                except Exception as e:
-                    logging.warning(f"Error checking {element_name}: {e}")
-                    
-        except Exception as e:
-            logging.error(f"Debug failed: {e}")
-    
-    def handle_login(self):
-        """Handle login process with improved OTP handling"""
-        # Multiple possible login button locators
-        login_locators = [
-            (By.XPATH, "//a[contains(text(),'Sign in')]"),
-            (By.XPATH, "//span[contains(text(),'Sign In')]"),
-            (By.XPATH, "//div[contains(text(),'Sign in')]"),
-            (By.XPATH, "//button[contains(text(),'Login')]"),
-            (By.XPATH, "//*[contains(@class, 'login') or contains(@class, 'sign-in')]"),
-            (By.CSS_SELECTOR, "[data-testid='login-cta']")
-        ]
-        
-        if not self.find_and_click(login_locators, "login button"):
-            logging.error("Could not find login button")
-            return False
-        
-        time.sleep(3)
-        
-        # Enter phone number
-        phone_locators = [
-            (By.XPATH, "//input[@type='tel']"),
-            (By.XPATH, "//input[@id='mobile']"),
-            (By.XPATH, "//input[@placeholder*='mobile' or @placeholder*='phone']"),
-            (By.CSS_SELECTOR, "input[type='tel']"),
-            (By.XPATH, "//input[@name='mobile']")
-        ]
-        
-        phone_input = None
-        for locator_type, locator_value in phone_locators:
-            try:
-                phone_input = self.wait.until(
-                    EC.presence_of_element_located((locator_type, locator_value))
-                )
-                if phone_input.is_displayed():
-                    break
-            except TimeoutException:
-                continue
-        
-        if not phone_input:
-            logging.error("Phone input field not found")
-            return False
-        
-        try:
-            phone_input.clear()
-            phone_input.send_keys(self.phone_number)
-            logging.info(f"Entered phone number: {self.phone_number}")
-            time.sleep(2)
-        except Exception as e:
-            logging.error(f"Failed to enter phone number: {e}")
-            return False
-        
-        # Click login/continue after phone
-        login_after_phone_locators = [
-            (By.XPATH, "//button[contains(text(),'Login') or contains(text(),'Continue') or contains(text(),'Send OTP')]"),
-            (By.XPATH, "//a[contains(text(),'Login') or contains(text(),'Continue') or contains(text(),'Send OTP')]"),
-            (By.CSS_SELECTOR, "[data-testid='login-cta']"),
-            (By.XPATH, "//button[contains(@class, 'login') or contains(@class, 'continue')]")
-        ]
-        
-        if not self.find_and_click(login_after_phone_locators, "login after phone"):
-            logging.error("Could not find login/continue button after phone entry")
-            return False
-        
-        time.sleep(3)
-        
-        # Debug current state before OTP
-        logging.info("=== DEBUG: Current state before OTP ===")
-        self.debug_current_state()
-        
-        # Wait for OTP entry with better user interaction
-        print("🔢 Please enter the OTP manually in the browser...")
-        print("⏳ Waiting for OTP entry and automatic verification...")
-        
-        # Wait for either OTP completion or verify button to become available
-        otp_completed = False
-        for i in range(120):  # Wait up to 2 minutes
-            try:
-                # Check if we're already logged in (page changed)
-                if "swiggy.com" in self.driver.current_url and "login" not in self.driver.current_url.lower():
-                    otp_completed = True
-                    logging.info("Login detected - OTP was successful")
-                    break
-                
-                # Check if verify button exists and is clickable
-                verify_locators = [
-                    (By.XPATH, "//button[contains(text(),'Verify') or contains(text(),'Continue') or contains(text(),'Proceed')]"),
-                    (By.XPATH, "//a[contains(text(),'Verify') or contains(text(),'Continue') or contains(text(),'Proceed')]"),
-                    (By.CSS_SELECTOR, "[data-testid='verify-cta']"),
-                    (By.XPATH, "//button[contains(@class, 'verify') or contains(@class, 'continue')]")
-                ]
-                
-                for locator_type, locator_value in verify_locators:
-                    try:
-                        verify_button = self.driver.find_element(locator_type, locator_value)
-                        if verify_button.is_displayed() and verify_button.is_enabled():
-                            # Try to click verify button
-                            if self.safe_click(verify_button, "click"):
-                                logging.info("Clicked verify button")
-                                time.sleep(3)
-                                # Check if login was successful
-                                if "login" not in self.driver.current_url.lower():
-                                    otp_completed = True
-                                break
-                    except:
-                        continue
-                
-                if otp_completed:
-                    break
-                    
-                # Show countdown every 10 seconds
-                if i % 10 == 0 and i > 0:
-                    remaining = 120 - i
-                    print(f"⏳ Still waiting... {remaining} seconds remaining")
-                
-                time.sleep(1)
-                
-            except Exception as e:
-                logging.warning(f"Error during OTP wait: {e}")
-                time.sleep(1)
-                continue
-        
-        if not otp_completed:
-            logging.error("OTP verification timed out or failed")
-            return False
-        
-        # Additional wait for page to fully load after login
-        time.sleep(5)
-        logging.info("Login process completed successfully")
-        return True
-    
-    def wait_for_location_handling(self):
-        """Wait for manual location/address handling"""
-        print("📍 Please handle location/address selection manually if prompted...")
-        print("⏳ Waiting for you to complete location setup (60 seconds)...")
-        time.sleep(60)
-        logging.info("Location handling wait completed")
-        return True
-    
-    def navigate_to_search_page(self):
-        """Navigate to Swiggy search page"""
-        try:
-            search_url = "https://www.swiggy.com/search"
-            self.driver.get(search_url)
-            logging.info(f"Navigated to search page: {search_url}")
-            time.sleep(5)  # Wait for page to load
-            return True
-        except Exception as e:
-            logging.error(f"Failed to navigate to search page: {e}")
-            return False
-    
-    def search_restaurant(self, restaurant_name="Chandrika Grand"):
-        """Search for a restaurant on the search page"""
-        # Multiple possible search input locators
-        search_locators = [
-            (By.XPATH, "//input[@placeholder*='Search']"),
-            (By.XPATH, "//input[@placeholder*='restaurants']"),
-            (By.XPATH, "//input[@placeholder*='dishes']"),
-            (By.CSS_SELECTOR, "input[placeholder*='Search']"),
-            (By.XPATH, "//*[contains(@class, 'search')]//input"),
-            (By.XPATH, "//input[@type='text']"),
-            (By.XPATH, "//input[@name='searchQuery']")
-        ]
-        
-        search_input = None
-        for attempt in range(10):  # Try for 10 seconds
-            for locator_type, locator_value in search_locators:
-                try:
-                    search_input = self.driver.find_element(locator_type, locator_value)
-                    if search_input.is_displayed() and search_input.is_enabled():
-                        break
-                except:
-                    continue
-            
-            if search_input and search_input.is_displayed():
-                break
-            
-            time.sleep(1)
-        
-        if not search_input:
-            logging.error("Search input not found")
-            return False
-        
-        try:
-            # Clear and enter search term
-            search_input.clear()
-            search_input.send_keys(restaurant_name)
-            logging.info(f"Entered search term: {restaurant_name}")
-            time.sleep(2)
-            
-            # Press Enter or click search button
-            search_input.send_keys(Keys.RETURN)
-            logging.info(f"Searched for restaurant: {restaurant_name}")
-            time.sleep(5)  # Wait for search results
-            return True
-        except Exception as e:
-            logging.error(f"Failed to search for restaurant: {e}")
-            return False
-    
-    def select_restaurant(self, restaurant_name="Chandrika Grand"):
-        """Select restaurant from search results"""
-        restaurant_locators = [
-            (By.XPATH, f"//div[contains(text(),'{restaurant_name}')]"),
-            (By.XPATH, f"//h3[contains(text(),'{restaurant_name}')]"),
-            (By.XPATH, f"//span[contains(text(),'{restaurant_name}')]"),
-            (By.XPATH, f"//*[contains(text(),'{restaurant_name}')]"),
-            (By.XPATH, f"//a[contains(text(),'{restaurant_name}')]"),
-            (By.XPATH, f"//div[contains(@class, 'restaurant') and contains(text(),'{restaurant_name}')]"),
-            (By.XPATH, f"//div[contains(@class, 'RestaurantList')]//div[contains(text(),'{restaurant_name}')]")
-        ]
-        
-        # Wait for search results to load
-        time.sleep(5)
-        
-        if self.find_and_click(restaurant_locators, f"restaurant: {restaurant_name}"):
-            logging.info(f"Selected restaurant: {restaurant_name}")
-            time.sleep(5)  # Wait for restaurant page to load
-            return True
-        
-        logging.error(f"Could not find restaurant: {restaurant_name}")
-        return False
-    
-    def add_item_to_cart(self):
-        """Add first available item to cart"""
-        # Multiple possible add button locators
-        add_button_locators = [
-            (By.XPATH, "//button[contains(text(),'ADD') or contains(text(),'Add')]"),
-            (By.XPATH, "//div[contains(text(),'ADD') or contains(text(),'Add')]"),
-            (By.CSS_SELECTOR, "[data-testid='add-item-btn']"),
-            (By.XPATH, "//*[contains(@class, 'add-btn') or contains(@class, 'add-button')]"),
-            (By.XPATH, "//button[contains(@class, 'styles_base__') and contains(text(), 'ADD')]")
-        ]
-        
-        try:
-            # Wait for menu to load
-            time.sleep(5)
-            
-            # Find first add button
-            add_button = None
-            for locator_type, locator_value in add_button_locators:
-                try:
-                    add_button = self.wait.until(
-                        EC.element_to_be_clickable((locator_type, locator_value))
-                    )
-                    break
-                except TimeoutException:
-                    continue
-            
-            if not add_button:
-                logging.error("Add button not found")
-                return False
-            
-            # Scroll to button and click to add first item
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_button)
-            time.sleep(2)
-            
-            if self.safe_click(add_button, "js"):
-                logging.info("Added first item to cart")
-                time.sleep(3)
-                return True
-            
-        except Exception as e:
-            logging.error(f"Failed to add item to cart: {e}")
-            return False
-    
-    def view_cart_and_select_address(self):
-        """View cart and select home address"""
-        # View cart
-        view_cart_locators = [
-            (By.XPATH, "//span[contains(text(),'View Cart')]"),
-            (By.XPATH, "//button[contains(text(),'View Cart')]"),
-            (By.CSS_SELECTOR, "[data-testid='view-cart-btn']"),
-            (By.XPATH, "//*[contains(@class, 'view-cart')]"),
-            (By.XPATH, "//div[contains(text(),'View Cart')]"),
-            (By.XPATH, "//a[contains(text(),'View Cart')]")
-        ]
-        
-        if not self.find_and_click(view_cart_locators, "view cart button"):
-            logging.error("Could not find view cart button")
-            return False
-        
-        time.sleep(5)
-        
-        # Select home address
-        if not self.select_home_address():
-            logging.error("Could not select home address")
-            return False
-        
-        logging.info("Successfully viewed cart and selected home address")
-        return True
-    
-    def select_home_address(self):
-        """Select home address from available addresses"""
-        try:
-            # Wait for address section to load
-            time.sleep(3)
-            
-            # Multiple possible home address locators
-            home_address_locators = [
-                (By.XPATH, "//div[contains(text(),'Home') or contains(text(),'HOME')]"),
-                (By.XPATH, "//span[contains(text(),'Home') or contains(text(),'HOME')]"),
-                (By.XPATH, "//*[contains(@class, 'address') and contains(text(), 'Home')]"),
-                (By.XPATH, "//label[contains(text(),'Home')]"),
-                (By.XPATH, "//div[contains(@class, 'address-type') and contains(text(), 'Home')]"),
-                (By.XPATH, "//button[contains(text(),'Home')]"),
-                (By.XPATH, "//*[contains(@data-testid, 'address') and contains(text(), 'Home')]")
-            ]
-            
-            # Try to find and click home address
-            for locator_type, locator_value in home_address_locators:
-                try:
-                    home_address = self.wait.until(
-                        EC.element_to_be_clickable((locator_type, locator_value))
-                    )
-                    
-                    if home_address.is_displayed():
-                        # Scroll to address and click
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", home_address)
-                        time.sleep(1)
-                        
-                        if self.safe_click(home_address, "js"):
-                            logging.info("Selected home address")
-                            time.sleep(3)
-                            return True
-                            
-                except TimeoutException:
-                    continue
-                except Exception as e:
-                    logging.warning(f"Error with home address locator {locator_value}: {e}")
-                    continue
-            
-            # If no specific "Home" address found, try to select first address
-            logging.warning("Home address not found, trying to select first available address")
-            return self.select_first_address()
-            
-        except Exception as e:
-            logging.error(f"Failed to select home address: {e}")
-            return False
-    
-    def select_first_address(self):
-        """Select the first available address if home address not found"""
-        try:
-            # Generic address locators
-            address_locators = [
-                (By.XPATH, "//div[contains(@class, 'address-item')]"),
-                (By.XPATH, "//div[contains(@class, 'address-card')]"),
-                (By.XPATH, "//button[contains(@class, 'address')]"),
-                (By.XPATH, "//*[contains(@class, 'address') and contains(@class, 'selectable')]"),
-                (By.XPATH, "//label[contains(@class, 'address')]"),
-                (By.XPATH, "//div[contains(@class, 'delivery-address')]")
-            ]
-            
-            for locator_type, locator_value in address_locators:
-                try:
-                    address_element = self.wait.until(
-                        EC.element_to_be_clickable((locator_type, locator_value))
-                    )
-                    
-                    if address_element.is_displayed():
-                        # Scroll to address and click
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", address_element)
-                        time.sleep(1)
-                        
-                        if self.safe_click(address_element, "js"):
-                            logging.info("Selected first available address")
-                            time.sleep(3)
-                            return True
-                            
-                except TimeoutException:
-                    continue
-                except Exception as e:
-                    logging.warning(f"Error with address locator {locator_value}: {e}")
-                    continue
-            
-            logging.warning("No address could be selected automatically")
-            print("📍 Please select your delivery address manually within 30 seconds...")
-            time.sleep(30)
-            return True
-            
-        except Exception as e:
-            logging.error(f"Failed to select address: {e}")
-            return False
-    
-    def run_automation(self, restaurant_name="Chandrika Grand"):
-        """Run complete automation workflow"""
-        try:
-            steps = [
-                ("Opening Swiggy", self.open_swiggy),
-                ("Handling login", self.handle_login),
-                ("Waiting for location handling", self.wait_for_location_handling),
-                ("Navigating to search page", self.navigate_to_search_page),
-                ("Searching restaurant", lambda: self.search_restaurant(restaurant_name)),
-                ("Selecting restaurant", lambda: self.select_restaurant(restaurant_name)),
-                ("Adding item to cart", self.add_item_to_cart),
-                ("Viewing cart and selecting address", self.view_cart_and_select_address)
-            ]
-            
-            for step_name, step_function in steps:
-                logging.info(f"Starting: {step_name}")
-                if not step_function():
-                    logging.error(f"Failed: {step_name}")
-                    return False
-                logging.info(f"Completed: {step_name}")
-            
-            logging.info("✅ Automation completed successfully!")
-            print("🎉 Automation complete! The item has been added to cart and home address selected.")
-            print("📋 You can now review the order and proceed with payment manually.")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Automation failed with error: {e}")
-            return False
-    
-    def cleanup(self):
-        """Clean up resources"""
-        if self.driver:
-            logging.info("Closing browser...")
-            # Don't quit immediately, let user review
-            # self.driver.quit()
-
-
-def main():
-    """Main execution function"""
-    # Configuration
-    PHONE_NUMBER = "9XXXXXXXXX"  # Change this to your phone number
-    RESTAURANT_NAME = "Chandrika Grand"  # Change this to your preferred restaurant
-    
-    automation = SwiggyAutomation(phone_number=PHONE_NUMBER)
-    
-    try:
-        success = automation.run_automation(restaurant_name=RESTAURANT_NAME)
-        if success:
-            print("✅ Automation completed successfully!")
-        else:
-            print("❌ Automation failed. Check logs for details.")
-    
-    except KeyboardInterrupt:
-        logging.info("Automation interrupted by user")
-    except Exception as e:
-        logging.error(f"Unexpected error: {e}")
-    finally:
-        # Keep browser open for manual review
-        input("Press Enter to close the browser...")
-        automation.cleanup()
-
-
-if _name_ == "_main_":
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, ElementClickInterceptedException,
+                                        NoSuchWindowException, WebDriverException)
+import argparse
+import json
+import sys
+import time
+import logging
+from datetime import datetime
+
+from locator_store import LocatorStore, LOCATOR_STATS_FILE
+from session_store import SessionStore, SESSION_FILE, SESSION_RESTORE_PATH, apply_session
+from checkpoint import CheckpointStore, CHECKPOINT_FILE
+from tracing import Tracer, SPANS_FILE, load_spans, summarize, format_summary
+from swiggy_api import SwiggyApiClient, ApiError, pick_restaurant, match_score, normalize_name
+from restaurant_cache import RestaurantCache, RESTAURANT_CACHE_FILE
+from timeout_store import TimeoutStore, TIMEOUTS_FILE
+from network_profiler import NetworkProfiler, enable_performance_logging, format_profile
+from replay_store import ReplayStore, REPLAY_FILE, fingerprint_matches
+from failure_artifacts import (FailureArtifacts, enable_console_logging, format_artifacts, ARTIFACTS_DIR,
+                               ARTIFACT_MAX_COUNT, ARTIFACT_MAX_MB)
+from structured_logging import (configure_logging, set_log_context, clear_log_context, LOG_FILE, LOG_MAX_BYTES,
+                                LOG_BACKUP_COUNT)
+
+BASE_URL = "https://www.swiggy.com"
+
+# Cookie Swiggy sets to "1" for an authenticated session
+LOGIN_COOKIE = "_is_logged_in"
+
+# Header elements only rendered for a logged-in user
+LOGGED_IN_LOCATORS = [
+    (By.XPATH, "//a[contains(@href, '/my-account')]"),
+    (By.CSS_SELECTOR, "[data-testid='profile-icon']"),
+]
+
+# Steps a restored, logged-in session does not need to repeat
+SESSION_SKIPPABLE_STEPS = ["login", "location"]
+
+# Steps that find and open the restaurant page; a restaurant cache hit skips them
+RESTAURANT_STEPS = ["search_page", "search", "select"]
+
+# Steps that wait on the user and are therefore never retried automatically
+MANUAL_STEPS = ["login", "location"]
+
+# Automatic retries for a failed step, and the delay before the first retry (doubles each time)
+DEFAULT_STEP_RETRIES = 2
+STEP_RETRY_BACKOFF = 1.0
+
+# Step IDs in workflow order, usable with resume_from; API mode opens the restaurant without the search page
+WORKFLOW_STEP_IDS = ["open", "login", "location", "search_page", "search", "select", "add_item", "cart"]
+API_WORKFLOW_STEP_IDS = ["open", "login", "location", "select", "add_item", "cart"]
+
+# URL patterns (Network.setBlockedURLs wildcards) for each blockable resource category
+BLOCKABLE_RESOURCES = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico", "*media-assets.swiggy.com*"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*connect.facebook.net*", "*hotjar.com*", "*clarity.ms*", "*branch.io*",
+        "*sentry.io*", "*nr-data.net*", "*newrelic.com*",
+    ],
+}
+
+# Chrome page-load strategies and the document.readyState values that count as ready for each
+PAGE_READY_STATES = {
+    "normal": ["complete"],
+    "eager": ["interactive", "complete"],
+    "none": ["interactive", "complete"],
+}
+
+# Upper bounds (in seconds) for the condition-based waits. Each wait returns
+# as soon as its condition holds; these only cap how long a slow page can take.
+DEFAULT_WAIT_TIMEOUTS = {
+    "page_ready": 15,
+    "network_idle": 10,
+    "url_change": 15,
+    "element": 10,
+    "stable": 3,
+    "spinner": 10,
+    "location": 60,
+    "otp": 120,
+    "manual_address": 30,
+}
+
+# Waits on the user, whose timing says nothing about the page; always given their full ceiling
+MANUAL_WAIT_KEYS = ["location", "otp", "manual_address"]
+
+# How often the wait conditions are re-evaluated
+POLL_INTERVAL = 0.1
+
+# Quiet period with no in-flight requests before the network counts as idle
+NETWORK_IDLE_TIME = 0.5
+
+# Loading indicators Swiggy shows while content is being fetched
+SPINNER_SELECTORS = [
+    "[class*='shimmer']",
+    "[class*='Shimmer']",
+    "[class*='spinner']",
+    "[class*='Spinner']",
+    "[class*='loader']",
+    "[class*='Loader']",
+    "[data-testid*='loader']",
+]
+
+# Counts in-flight fetch/XHR requests so network idle can be detected in-page;
+# installed before any page script runs so requests made during page load are counted
+NETWORK_HOOKS_JS = """
+if (!window.__swiggyNet) {
+    window.__swiggyNet = {pending: 0, lastActivity: Date.now()};
+    var net = window.__swiggyNet;
+    var start = function() { net.pending++; net.lastActivity = Date.now(); };
+    var done = function() { net.pending = Math.max(0, net.pending - 1); net.lastActivity = Date.now(); };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            start();
+            return originalFetch.apply(this, arguments).then(
+                function(response) { done(); return response; },
+                function(error) { done(); throw error; }
+            );
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        start();
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+}
+"""
+
+# Installs the hooks if the page predates them, then reports the network state
+NETWORK_MONITOR_JS = NETWORK_HOOKS_JS + """
+var resources = performance.getEntriesByType('resource');
+var lastEnd = 0;
+for (var i = 0; i < resources.length; i++) {
+    lastEnd = Math.max(lastEnd, resources[i].responseEnd);
+}
+return {
+    pending: window.__swiggyNet.pending,
+    idleFor: Date.now() - window.__swiggyNet.lastActivity,
+    resources: resources.length,
+    sinceLastResource: performance.now() - lastEnd
+};
+"""
+
+SPINNER_VISIBLE_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var nodes = document.querySelectorAll(selectors[i]);
+    for (var j = 0; j < nodes.length; j++) {
+        var rect = nodes[j].getBoundingClientRect();
+        var style = window.getComputedStyle(nodes[j]);
+        if (rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none') {
+            return true;
+        }
+    }
+}
+return false;
+"""
+
+# Shared in-page helpers: resolve a (By, value) locator and test visibility/enabled state
+DOM_HELPERS_JS = """
+function candidates(type, value) {
+    if (type === 'xpath') {
+        var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    if (type === 'css selector') {
+        return document.querySelectorAll(value);
+    }
+    if (type === 'id') {
+        return document.querySelectorAll('#' + CSS.escape(value));
+    }
+    if (type === 'name') {
+        return document.querySelectorAll('[name="' + CSS.escape(value) + '"]');
+    }
+    if (type === 'class name') {
+        return document.getElementsByClassName(value);
+    }
+    if (type === 'tag name') {
+        return document.getElementsByTagName(value);
+    }
+    return [];
+}
+function isVisible(el) {
+    if (!el.getClientRects || !el.getClientRects().length) {
+        return false;
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && parseFloat(style.opacity) > 0;
+}
+function isEnabled(el) {
+    return !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+}
+function fingerprint(el) {
+    var classes = typeof el.className === 'string' ? el.className.split(/\\s+/).filter(Boolean).sort() : [];
+    return {
+        tag: el.tagName.toLowerCase(),
+        id: el.id || '',
+        name: el.getAttribute('name') || '',
+        type: el.getAttribute('type') || '',
+        testid: el.getAttribute('data-testid') || '',
+        placeholder: el.getAttribute('placeholder') || '',
+        classes: classes.slice(0, 5).join(' '),
+        text: (el.innerText || el.value || '').trim().slice(0, 40)
+    };
+}
+"""
+
+# Evaluates a whole locator set in one round-trip and returns the first match
+# (in locator order) that satisfies the requested condition, with its fingerprint
+LOCATOR_RACE_JS = DOM_HELPERS_JS + """
+var locators = arguments[0];
+var condition = arguments[1];
+for (var i = 0; i < locators.length; i++) {
+    var nodes;
+    try {
+        nodes = candidates(locators[i][0], locators[i][1]);
+    } catch (e) {
+        continue;  // invalid selector, try the next one
+    }
+    for (var j = 0; j < nodes.length; j++) {
+        var el = nodes[j];
+        if (condition === 'present'
+                || (condition === 'visible' && isVisible(el))
+                || (condition === 'clickable' && isVisible(el) && isEnabled(el))) {
+            return {index: i, element: el, fingerprint: fingerprint(el)};
+        }
+    }
+}
+return null;
+"""
+
+# Collects visibility, enabled state, text and bounding box of every match of a
+# set of named locator groups, plus URL/title/readyState, in one round-trip
+PAGE_SNAPSHOT_JS = DOM_HELPERS_JS + """
+var groups = arguments[0];
+var maxMatches = arguments[1];
+var snapshot = {url: location.href, title: document.title, readyState: document.readyState, elements: {}};
+for (var g = 0; g < groups.length; g++) {
+    var name = groups[g][0];
+    var locators = groups[g][1];
+    var matches = [];
+    var seen = [];
+    for (var i = 0; i < locators.length && matches.length < maxMatches; i++) {
+        var nodes;
+        try {
+            nodes = candidates(locators[i][0], locators[i][1]);
+        } catch (e) {
+            continue;
+        }
+        for (var j = 0; j < nodes.length && matches.length < maxMatches; j++) {
+            var el = nodes[j];
+            if (seen.indexOf(el) !== -1) {
+                continue;
+            }
+            seen.push(el);
+            var rect = el.getBoundingClientRect();
+            matches.push({
+                locator: i,
+                element: el,
+                tag: el.tagName.toLowerCase(),
+                visible: isVisible(el),
+                enabled: isEnabled(el),
+                text: (el.innerText || el.value || '').trim().slice(0, 200),
+                rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height}
+            });
+        }
+    }
+    snapshot.elements[name] = matches;
+}
+return snapshot;
+"""
+
+# Indexes every rendered search result card (a link to a restaurant page) in one pass:
+# name, link, rating, ETA and distance, plus the card element itself to click
+SEARCH_RESULTS_JS = DOM_HELPERS_JS + """
+var maxResults = arguments[0];
+var links = document.querySelectorAll("a[href*='/restaurants/']");
+var results = [];
+var seen = {};
+function field(card, selectors, pattern) {
+    for (var i = 0; i < selectors.length; i++) {
+        var node = card.querySelector(selectors[i]);
+        if (node && node.innerText.trim()) {
+            return node.innerText.trim();
+        }
+    }
+    var match = pattern ? (card.innerText || '').match(pattern) : null;
+    return match ? match[0].trim() : null;
+}
+for (var i = 0; i < links.length && results.length < maxResults; i++) {
+    var card = links[i];
+    if (seen[card.href] || !isVisible(card)) {
+        continue;
+    }
+    seen[card.href] = true;
+    var lines = (card.innerText || '').split('\\n').map(function(line) { return line.trim(); }).filter(Boolean);
+    var name = field(card, ["[class*='restaurant-name']", "[class*='RestaurantName']", "[class*='name']", "h3", "h2"], null) || lines[0];
+    if (!name) {
+        continue;
+    }
+    results.push({
+        element: card,
+        name: name,
+        href: card.href,
+        rating: field(card, ["[class*='rating']", "[class*='Rating']"], /\\b[0-5]\\.\\d\\b/),
+        eta: field(card, ["[class*='eta']", "[class*='sla']"], /\\d+\\s*(-\\s*\\d+\\s*)?mins?/i),
+        distance: field(card, ["[class*='distance']"], /\\d+(\\.\\d+)?\\s*km/i)
+    });
+}
+return results;
+"""
+
+# Async login watcher: resolves as soon as the login completes (login cookie, account
+# link or a URL change away from login), the verify button becomes clickable, or an
+# error banner appears. Driven by a MutationObserver plus history/input listeners.
+LOGIN_WATCH_JS = DOM_HELPERS_JS + """
+var verifyLocators = arguments[0];
+var accountLocators = arguments[1];
+var errorLocators = arguments[2];
+var timeoutMs = arguments[3];
+var startUrl = arguments[4];
+var ignoreError = arguments[5];
+var ignoreVerify = arguments[6];
+var callback = arguments[arguments.length - 1];
+var changed = false;
+var done = false;
+
+function firstMatch(locators, clickable) {
+    for (var i = 0; i < locators.length; i++) {
+        var nodes;
+        try {
+            nodes = candidates(locators[i][0], locators[i][1]);
+        } catch (e) {
+            continue;
+        }
+        for (var j = 0; j < nodes.length; j++) {
+            if (isVisible(nodes[j]) && (!clickable || isEnabled(nodes[j]))) {
+                return nodes[j];
+            }
+        }
+    }
+    return null;
+}
+function check() {
+    if (document.cookie.indexOf('_is_logged_in=1') !== -1) {
+        return {event: 'logged_in', detail: 'login cookie'};
+    }
+    if (firstMatch(accountLocators, false)) {
+        return {event: 'logged_in', detail: 'account link'};
+    }
+    if (location.href !== startUrl && location.href.toLowerCase().indexOf('login') === -1) {
+        return {event: 'logged_in', detail: 'URL change'};
+    }
+    var error = firstMatch(errorLocators, false);
+    var errorText = error ? (error.innerText || '').trim() : '';
+    if (errorText && errorText !== ignoreError) {
+        return {event: 'error', detail: errorText};
+    }
+    // Right after a verify click, only report the button again once the page has reacted
+    if (!ignoreVerify || changed) {
+        var verify = firstMatch(verifyLocators, true);
+        if (verify) {
+            return {event: 'verify_enabled', element: verify};
+        }
+    }
+    return null;
+}
+function finish(result) {
+    if (done) {
+        return;
+    }
+    done = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    window.removeEventListener('popstate', onChange);
+    window.removeEventListener('hashchange', onChange);
+    window.removeEventListener('swiggy:locationchange', onChange);
+    document.removeEventListener('input', onChange, true);
+    callback(result);
+}
+function onChange() {
+    changed = true;
+    var result = check();
+    if (result) {
+        finish(result);
+    }
+}
+
+if (!window.__swiggyHistoryPatched) {
+    window.__swiggyHistoryPatched = true;
+    ['pushState', 'replaceState'].forEach(function(method) {
+        var original = history[method];
+        history[method] = function() {
+            var value = original.apply(this, arguments);
+            window.dispatchEvent(new Event('swiggy:locationchange'));
+            return value;
+        };
+    });
+}
+
+var observer = new MutationObserver(onChange);
+var timer = setTimeout(function() { finish({event: 'timeout'}); }, timeoutMs);
+var initial = check();
+if (initial) {
+    finish(initial);
+} else {
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    window.addEventListener('popstate', onChange);
+    window.addEventListener('hashchange', onChange);
+    window.addEventListener('swiggy:locationchange', onChange);
+    document.addEventListener('input', onChange, true);
+}
+"""
+
+# Async batch cart add: indexes every menu item's ADD control in one pass, then for each
+# (name, quantity) clicks ADD/+ and waits for the cart counter or the item's quantity to
+# go up before the next click, confirming customization popups along the way
+CART_ADD_JS = DOM_HELPERS_JS + """
+var wanted = arguments[0];
+var addLocators = arguments[1];
+var incrementLocators = arguments[2];
+var countLocators = arguments[3];
+var confirmLocators = arguments[4];
+var findTimeoutMs = arguments[5];
+var confirmTimeoutMs = arguments[6];
+var callback = arguments[arguments.length - 1];
+var results = [];
+
+function normalize(text) {
+    return (text || '').normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase()
+        .replace(/['\\u2019`]/g, '').replace(/&/g, ' and ').replace(/[^0-9a-z\\u0080-\\uffff]+/g, ' ').trim();
+}
+function matches(locators, visibleOnly) {
+    var found = [];
+    for (var i = 0; i < locators.length; i++) {
+        var nodes;
+        try {
+            nodes = candidates(locators[i][0], locators[i][1]);
+        } catch (e) {
+            continue;
+        }
+        for (var j = 0; j < nodes.length; j++) {
+            if (found.indexOf(nodes[j]) === -1 && (!visibleOnly || isVisible(nodes[j]))) {
+                found.push(nodes[j]);
+            }
+        }
+    }
+    return found;
+}
+function indexMenu() {
+    // Each control's item card is its highest ancestor that holds no other control; an item already
+    // in the cart may show only its quantity stepper instead of an ADD control
+    var controls = matches(addLocators.concat(incrementLocators), true);
+    var menu = [];
+    controls.forEach(function(control) {
+        var card = control;
+        while (card.parentElement && card.parentElement !== document.body) {
+            var others = controls.some(function(other) {
+                return other !== control && card.parentElement.contains(other);
+            });
+            if (others) {
+                break;
+            }
+            card = card.parentElement;
+        }
+        if (menu.some(function(entry) { return entry.card === card; })) {
+            return;
+        }
+        var lines = (card.innerText || '').split('\\n').map(normalize).filter(Boolean);
+        menu.push({control: control, card: card, lines: lines});
+    });
+    return menu;
+}
+function findItem(menu, name) {
+    var target = normalize(name);
+    for (var i = 0; i < menu.length; i++) {
+        if (menu[i].lines.indexOf(target) !== -1) {
+            return menu[i];
+        }
+    }
+    for (var i = 0; i < menu.length; i++) {
+        if (menu[i].lines.some(function(line) { return line.indexOf(target) !== -1; })) {
+            return menu[i];
+        }
+    }
+    return null;
+}
+function cartCount() {
+    var counters = matches(countLocators, false);
+    for (var i = 0; i < counters.length; i++) {
+        var number = (counters[i].innerText || counters[i].textContent || '').match(/\\d+/);
+        if (number) {
+            return parseInt(number[0], 10);
+        }
+    }
+    return 0;
+}
+function itemQuantity(entry) {
+    // The stepper between - and + (or a quantity badge) is the only all-digit text in the card
+    var nodes = entry.card.querySelectorAll('*');
+    for (var i = 0; i < nodes.length; i++) {
+        if (!nodes[i].children.length && /^\\d+$/.test((nodes[i].textContent || '').trim())) {
+            return parseInt(nodes[i].textContent, 10);
+        }
+    }
+    return 0;
+}
+function nextControl(entry, inCart) {
+    if (inCart) {
+        var increments = matches(incrementLocators, true).filter(function(node) { return entry.card.contains(node); });
+        if (increments.length) {
+            return increments[0];
+        }
+    }
+    var adds = matches(addLocators, true).filter(function(node) { return entry.card.contains(node); });
+    return adds.length ? adds[0] : (isVisible(entry.control) ? entry.control : null);
+}
+function addItem(entry, result, next) {
+    if (result.present + result.added >= result.requested) {
+        return next();
+    }
+    var control = nextControl(entry, result.present + result.added);
+    if (!control) {
+        result.status = 'no_control';
+        return next();
+    }
+    var before = {cart: cartCount(), item: itemQuantity(entry)};
+    control.scrollIntoView({block: 'center'});
+    control.click();
+    var started = Date.now();
+    (function poll() {
+        var confirm = matches(confirmLocators, true).filter(function(node) { return !node.__swiggyConfirmed; })[0];
+        if (confirm) {
+            confirm.__swiggyConfirmed = true;
+            confirm.click();
+            result.customized = true;
+        }
+        if (cartCount() > before.cart || itemQuantity(entry) > before.item) {
+            result.added += 1;
+            return addItem(entry, result, next);
+        }
+        if (Date.now() - started > confirmTimeoutMs) {
+            result.status = 'unconfirmed';
+            return next();
+        }
+        setTimeout(poll, 50);
+    })();
+}
+function run(menu) {
+    var i = 0;
+    (function next() {
+        if (i >= wanted.length) {
+            callback({results: results, cartCount: cartCount()});
+            return;
+        }
+        var name = wanted[i][0];
+        var result = {name: name, requested: wanted[i][1], present: 0, added: 0, customized: false, status: 'ok',
+                      matched: null};
+        results.push(result);
+        i += 1;
+        var entry = findItem(menu, name);
+        if (!entry) {
+            result.status = 'not_found';
+            return next();
+        }
+        result.matched = entry.lines[entry.lines.indexOf(normalize(name))] || entry.lines[0];
+        // Units already in the cart (e.g. from a failed earlier attempt) count towards the request
+        result.present = itemQuantity(entry);
+        addItem(entry, result, next);
+    })();
+}
+
+// The menu may still be rendering: wait until every wanted item has a card or findTimeoutMs passes
+var waitStarted = Date.now();
+(function waitForMenu() {
+    var menu = indexMenu();
+    var missing = wanted.some(function(pair) { return !findItem(menu, pair[0]); });
+    if (!missing || Date.now() - waitStarted > findTimeoutMs) {
+        run(menu);
+    } else {
+        setTimeout(waitForMenu, 100);
+    }
+})();
+"""
+
+# Visible messages shown when an OTP is rejected
+OTP_ERROR_LOCATORS = [
+    (By.XPATH, "//*[contains(text(), 'Invalid OTP') or contains(text(), 'invalid OTP') or contains(text(), 'Incorrect OTP')]"),
+    (By.XPATH, "//*[contains(@class, 'error') and normalize-space(text())]"),
+]
+
+# The login watcher re-arms this often so the countdown can be shown
+LOGIN_WATCH_INTERVAL = 10
+
+# Most elements recorded per locator group in a page snapshot
+SNAPSHOT_MAX_MATCHES = 20
+
+# Most result cards indexed from one search results page
+MAX_SEARCH_RESULTS = 50
+
+# Controls and indicators used by the batch cart add
+ADD_CONTROL_LOCATORS = [
+    (By.XPATH, "//button[normalize-space(text())='ADD' or normalize-space(text())='Add']"),
+    (By.XPATH, "//div[normalize-space(text())='ADD' or normalize-space(text())='Add']"),
+    (By.CSS_SELECTOR, "[data-testid='add-item-btn']"),
+    (By.CSS_SELECTOR, "[class*='add-btn'], [class*='add-button']"),
+]
+INCREMENT_LOCATORS = [
+    (By.XPATH, "//button[normalize-space(text())='+']"),
+    (By.XPATH, "//div[normalize-space(text())='+']"),
+    (By.CSS_SELECTOR, "[data-testid='increment-item'], [class*='increment']"),
+]
+CART_COUNT_LOCATORS = [
+    (By.CSS_SELECTOR, "[class*='cart-count'], [data-testid='cart-count']"),
+    (By.XPATH, "//*[contains(@class, 'cart') and contains(text(), 'Item')]"),
+    (By.XPATH, "//*[contains(@class, 'cart') and contains(text(), 'item')]"),
+]
+CUSTOMIZATION_CONFIRM_LOCATORS = [
+    (By.XPATH, "//button[contains(text(), 'Add Item')]"),
+    (By.XPATH, "//button[contains(text(), 'Continue')]"),
+    (By.XPATH, "//button[contains(text(), 'Repeat')]"),
+    (By.CSS_SELECTOR, "[class*='customiz'] button[class*='confirm'], [data-testid='menu-customize-continue-button']"),
+]
+
+# How long the batch cart add waits for the menu to render, and for each click to register
+CART_FIND_TIMEOUT = 10
+CART_CONFIRM_TIMEOUT = 5
+
+# Most menu items read from each restaurant page when comparing restaurants
+COMPARE_MAX_MENU_ITEMS = 300
+
+LOCATION_SET_JS = """
+var stored = window.localStorage.getItem('userLocation');
+var inputs = document.querySelectorAll("input[placeholder*='location'], input[placeholder*='area'], input[placeholder*='Enter your delivery']");
+for (var i = 0; i < inputs.length; i++) {
+    if (inputs[i].offsetParent !== null) {
+        return false;
+    }
+}
+return !!stored;
+"""
+
+# Delivery location the site stored after detecting or being given one; used as API query coordinates
+USER_LOCATION_JS = """
+try {
+    var stored = JSON.parse(window.localStorage.getItem('userLocation') || 'null');
+    return stored && stored.lat && stored.lng ? {lat: stored.lat, lng: stored.lng} : null;
+} catch (e) {
+    return null;
+}
+"""
+
+# HTTP status of the current page when the browser exposes it, else a guess from a "not found" page
+PAGE_STATUS_JS = """
+var navigation = performance.getEntriesByType('navigation')[0];
+if (navigation && navigation.responseStatus) {
+    return navigation.responseStatus;
+}
+var heading = document.querySelector('h1');
+var text = document.title + ' ' + (heading ? heading.innerText : '');
+return /\\b404\\b|not found/i.test(text) ? 404 : 200;
+"""
+
+# Reads a restaurant page in one call for the comparison mode: load status, name,
+# rating, ETA and every menu item with its price, plus the wanted item if given.
+# Returns no element references, so it can be run against any tab.
+MENU_SNAPSHOT_JS = DOM_HELPERS_JS + """
+var addLocators = arguments[0];
+var wanted = arguments[1];
+var maxItems = arguments[2];
+
+function normalize(text) {
+    return (text || '').normalize('NFKD').replace(/[\\u0300-\\u036f]/g, '').toLowerCase()
+        .replace(/['\\u2019`]/g, '').replace(/&/g, ' and ').replace(/[^0-9a-z\\u0080-\\uffff]+/g, ' ').trim();
+}
+function field(selectors, pattern) {
+    for (var i = 0; i < selectors.length; i++) {
+        var nodes = document.querySelectorAll(selectors[i]);
+        for (var j = 0; j < nodes.length; j++) {
+            var text = (nodes[j].innerText || '').trim();
+            var match = text.match(pattern);
+            if (match) {
+                return match[0].trim();
+            }
+        }
+    }
+    var match = (document.body.innerText || '').match(pattern);
+    return match ? match[0].trim() : null;
+}
+
+var heading = document.querySelector('h1');
+var result = {
+    url: location.href,
+    status: 'loading',
+    name: heading && heading.innerText.trim() ? heading.innerText.trim() : document.title,
+    rating: null,
+    eta: null,
+    items: [],
+    item: null
+};
+if (document.readyState === 'loading' || location.href === 'about:blank') {
+    return result;
+}
+var navigation = performance.getEntriesByType('navigation')[0];
+if ((navigation && navigation.responseStatus >= 400) || /\\b404\\b|not found/i.test(document.title + ' ' + result.name)) {
+    result.status = 'not_found';
+    return result;
+}
+
+var controls = [];
+for (var i = 0; i < addLocators.length; i++) {
+    var nodes;
+    try {
+        nodes = candidates(addLocators[i][0], addLocators[i][1]);
+    } catch (e) {
+        continue;
+    }
+    for (var j = 0; j < nodes.length; j++) {
+        if (controls.indexOf(nodes[j]) === -1 && isVisible(nodes[j])) {
+            controls.push(nodes[j]);
+        }
+    }
+}
+if (!controls.length) {
+    if (/currently (closed|unavailable)|not accepting orders/i.test(document.body.innerText || '')) {
+        result.status = 'closed';
+    }
+    return result;
+}
+
+var target = normalize(wanted);
+var partial = null;
+for (var i = 0; i < controls.length && result.items.length < maxItems; i++) {
+    // Each ADD control's item card is its highest ancestor that holds no other ADD control
+    var card = controls[i];
+    while (card.parentElement && card.parentElement !== document.body) {
+        var parent = card.parentElement;
+        if (controls.some(function(other) { return other !== controls[i] && parent.contains(other); })) {
+            break;
+        }
+        card = parent;
+    }
+    var lines = (card.innerText || '').split('\\n').map(function(line) { return line.trim(); }).filter(Boolean);
+    var price = (card.innerText || '').match(/\\u20b9\\s*([\\d,]+(\\.\\d+)?)/);
+    var names = lines.filter(function(line) { return !/\\u20b9|^\\d+$|^add\\b|^[+-]$/i.test(line); });
+    if (!names.length) {
+        continue;
+    }
+    var item = {name: names[0], price: price ? parseFloat(price[1].replace(/,/g, '')) : null};
+    result.items.push(item);
+    if (target && !result.item) {
+        var normalized = names.map(normalize);
+        if (normalized.indexOf(target) !== -1) {
+            result.item = item;
+        } else if (!partial && normalized.some(function(line) { return line.indexOf(target) !== -1; })) {
+            partial = item;
+        }
+    }
+}
+result.item = result.item || partial;
+result.rating = field(["[class*='rating']", "[class*='Rating']"], /\\b[0-5]\\.\\d\\b/);
+result.eta = field(["[class*='eta']", "[class*='sla']", "[class*='deliveryTime']"], /\\d+\\s*(-\\s*\\d+\\s*)?mins?/i);
+result.status = 'ready';
+return result;
+"""
+
+ADDRESS_SELECTED_JS = """
+var selected = document.querySelector("[class*='address'][class*='selected'], [class*='address'][class*='Selected'], [aria-checked='true'][class*='address']");
+if (selected) {
+    return true;
+}
+var buttons = document.querySelectorAll('button, div, span');
+for (var i = 0; i < buttons.length; i++) {
+    var text = buttons[i].textContent.trim();
+    if ((text === 'Proceed to Pay' || text === 'PROCEED TO PAY') && buttons[i].offsetParent !== null) {
+        return true;
+    }
+}
+return false;
+"""
+
+def xpath_literal(text):
+    """Quote text for use in an XPath expression, even when it contains quotes"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+class StepAborted(Exception):
+    """A step failure that retrying the step cannot fix"""
+
+
+class SwiggyAutomation:
+    def __init__(self, phone_number="9391496810", headless=False, wait_timeouts=None, locator_store=None,
+                 session_file=SESSION_FILE, user_data_dir=None, block_resources=None, block_url_patterns=None,
+                 page_load_strategy="normal", trace_dir=None, base_url=BASE_URL, checkpoint_file=CHECKPOINT_FILE,
+                 step_retries=DEFAULT_STEP_RETRIES, api_mode=False, restaurant_cache=None, timeout_store=None,
+                 adaptive_timeouts=True, profile_dir=None, replay_file=None, replay=False, replay_store=None,
+                 artifact_dir=ARTIFACTS_DIR, artifact_max_count=ARTIFACT_MAX_COUNT, artifact_max_mb=ARTIFACT_MAX_MB):
+        unknown = set(block_resources or []) - set(BLOCKABLE_RESOURCES)
+        if unknown:
+            raise ValueError(f"Unknown resource categories: {', '.join(sorted(unknown))}")
+        if page_load_strategy not in PAGE_READY_STATES:
+            raise ValueError(f"Unknown page load strategy: {page_load_strategy}")
+        
+        self.phone_number = phone_number
+        self.driver = None
+        self.wait_timeouts = dict(DEFAULT_WAIT_TIMEOUTS)
+        if wait_timeouts:
+            self.wait_timeouts.update(wait_timeouts)
+        # Learned timeouts shorten waits on conditions that usually hold quickly
+        self.timeout_store = timeout_store if timeout_store is not None else TimeoutStore()
+        self.adaptive_timeouts = adaptive_timeouts
+        self.current_step = None
+        self.reported_timeouts = set()
+        self.locator_store = locator_store if locator_store is not None else LocatorStore()
+        self.session_store = SessionStore(session_file) if session_file else None
+        self.user_data_dir = user_data_dir
+        self.session_restored = False
+        self.block_resources = list(block_resources or [])
+        self.block_url_patterns = list(block_url_patterns or [])
+        self.page_load_strategy = page_load_strategy
+        self.tracer = Tracer()
+        self.trace_dir = trace_dir
+        self.base_url = base_url.rstrip("/")
+        self.checkpoint_store = CheckpointStore(checkpoint_file) if checkpoint_file else None
+        self.step_retries = step_retries
+        self.api_mode = api_mode
+        self.api_client = None
+        self.restaurant_cache = restaurant_cache
+        # What the select step resolved the restaurant to (and its menu, when known), for the cache
+        self.resolved_restaurant = None
+        self.resolved_items = None
+        # Opt-in per-step network/performance profile, exported to profile_dir after each run
+        self.profile_dir = profile_dir
+        self.profiler = NetworkProfiler() if profile_dir else None
+        # Recording of the elements successful runs used; replayed instead of searched when replay is on
+        self.replay_store = replay_store or (ReplayStore(replay_file) if replay_file else None)
+        self.replay = replay and self.replay_store is not None
+        self.recording = {}
+        # Screenshot, DOM, console log and URL captured when a step or locator set fails
+        self.artifacts = FailureArtifacts(artifact_dir, artifact_max_count, artifact_max_mb) if artifact_dir else None
+        self.setup_driver(headless)
+        
+    def setup_driver(self, headless=False):
+        """Initialize Chrome WebDriver with optimized settings"""
+        chrome_options = Options()
+        if headless:
+            chrome_options.add_argument("--headless")
+        
+        # Add performance and stability options
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-popup-blocking")
+        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+        # Comparison tabs load in the background; don't throttle their timers and rendering
+        chrome_options.add_argument("--disable-background-timer-throttling")
+        chrome_options.add_argument("--disable-renderer-backgrounding")
+        
+        # Suppress Chrome logging
+        chrome_options.add_argument("--log-level=3")
+        chrome_options.add_argument("--disable-logging")
+        chrome_options.add_argument("--silent")
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # A managed profile keeps the login across runs without a session file
+        if self.user_data_dir:
+            chrome_options.add_argument(f"--user-data-dir={self.user_data_dir}")
+        
+        # eager/none return from driver.get() before every subresource has loaded;
+        # the wait_for_* helpers provide the readiness checks instead
+        chrome_options.page_load_strategy = self.page_load_strategy
+        if "images" in self.block_resources:
+            chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        if self.profiler:
+            enable_performance_logging(chrome_options)
+        if self.artifacts:
+            enable_console_logging(chrome_options)
+        
+        try:
+            self.driver = webdriver.Chrome(options=chrome_options)
+            self.driver.maximize_window()
+            logging.info("Chrome WebDriver initialized successfully")
+            
+            self.apply_resource_policy()
+            self.install_network_monitor()
+            if self.profiler:
+                self.profiler.attach(self.driver)
+            
+            if self.session_store:
+                self.session_restored = self.session_store.restore(self.driver, self.base_url)
+        except Exception as e:
+            logging.error(f"Failed to initialize WebDriver: {e}")
+            raise
+    
+    def install_network_monitor(self):
+        """Hook fetch/XHR on every new document so network idle also sees requests started during page load"""
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_HOOKS_JS})
+        except WebDriverException as e:
+            logging.warning(f"Could not install the network monitor, it will start on the first idle check: {e}")
+    
+    def apply_resource_policy(self):
+        """Block the configured resource categories and URL patterns through CDP"""
+        patterns = []
+        for category in self.block_resources:
+            patterns.extend(BLOCKABLE_RESOURCES[category])
+        patterns.extend(self.block_url_patterns)
+        if not patterns:
+            return
+        
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            logging.info(f"Blocking {len(patterns)} URL pattern(s): {', '.join(self.block_resources) or 'custom'}")
+        except Exception as e:
+            logging.warning(f"Could not apply resource blocking: {e}")
+    
+    def safe_click(self, element, method="click"):
+        """Safely click an element with multiple fallback methods"""
+        with self.tracer.span(f"click: {method}", "click", method=method) as span:
+            try:
+                if method == "click":
+                    element.click()
+                elif method == "js":
+                    self.driver.execute_script("arguments[0].click();", element)
+                elif method == "action":
+                    from selenium.webdriver.common.action_chains import ActionChains
+                    ActionChains(self.driver).move_to_element(element).click().perform()
+                return True
+            except Exception as e:
+                span.ok = False
+                # Callers try the next method and report if all of them fail
+                logging.debug(f"Click method '{method}' failed: {e}")
+                return False
+    
+    def race_locators(self, locators, condition="clickable"):
+        """Check every locator in a single script call; the first match as {index, element, fingerprint}, or None"""
+        return self.driver.execute_script(
+            LOCATOR_RACE_JS, [[locator_type, locator_value] for locator_type, locator_value in locators], condition
+        )
+
+    def probe_locators(self, locators, condition="clickable"):
+        """Check every locator in a single script call; return (element, locator) of the first match"""
+        result = self.race_locators(locators, condition)
+        if not result:
+            return None, None
+        return result["element"], locators[result["index"]]
+
+    def resolve_locators(self, locators, description, timeout=None, condition="clickable", learned_timeout=True):
+        """Race all candidate locators against one timeout and return (element, winning locator)"""
+        # Most reliable locators first, stale ones last; the same label can mean different elements in
+        # different steps, so statistics are kept per step
+        stats_key = f"{self.current_step or 'run'}/{description}"
+        ordered = self.locator_store.rank(stats_key, locators)
+        # When replaying, the recorded locator leads the same race instead of getting a wait of its own
+        entry = self.replay_entry(description)
+        recorded = tuple(entry["locator"]) if entry else None
+        if recorded in [tuple(locator) for locator in ordered]:
+            ordered = [recorded] + [locator for locator in ordered if tuple(locator) != recorded]
+        else:
+            recorded = None
+        polls = [0]
+
+        def first_match(driver):
+            polls[0] += 1
+            result = self.race_locators(ordered, condition)
+            return result or False
+
+        with self.tracer.span(f"locate: {description}", "locator", candidates=len(ordered)) as span:
+            start = time.time()
+            result = self.wait_until(first_match, "element", description, timeout, learned_timeout=learned_timeout)
+            winner = ordered[result["index"]] if result else None
+            # The race checks locators in order and stops at the first match
+            missed = ordered[:result["index"]] if result else ordered
+            if recorded and result:
+                result, winner = self.check_replay(entry, description, ordered, result, condition)
+            self.locator_store.record(stats_key, winner, time.time() - start, missed)
+            span.attrs["polls"] = polls[0]
+            if not result:
+                span.ok = False
+                return None, None
+            span.attrs["winner"] = winner[1]
+        logging.info(f"Resolved {description} via {winner[1]}")
+        self.record_element(description, winner, result["fingerprint"])
+        return result["element"], winner
+
+    def replay_entry(self, description):
+        """The recorded element for description in the current step, when replaying"""
+        if not self.replay:
+            return None
+        return self.replay_store.get(self.current_step or "run", description)
+
+    def check_replay(self, entry, description, ordered, result, condition="clickable"):
+        """Score a race led by the recorded locator (ordered[0]) as a replay hit or miss. If the recorded
+        locator matched an element that no longer looks the same, probe the other locators once and
+        prefer their match. Returns (race result, winning locator)."""
+        recorded = ordered[0]
+        if result["index"] != 0:
+            self.replay_store.record_result(self.current_step or "run", description, False)
+            logging.info(f"Replay of {description} failed (not found), resolved via another locator")
+            return result, ordered[result["index"]]
+        ok = fingerprint_matches(entry["fingerprint"], result["fingerprint"])
+        self.replay_store.record_result(self.current_step or "run", description, ok)
+        if ok:
+            logging.debug(f"Replayed {description} via {recorded[1]}")
+            return result, recorded
+        logging.info(f"Replay of {description} failed (fingerprint mismatch), checking the other locators")
+        other = self.race_locators(ordered[1:], condition) if len(ordered) > 1 else None
+        if other:
+            return other, ordered[1 + other["index"]]
+        return result, recorded
+
+    def capture_failure(self, reason):
+        """Queue the current page state as failure evidence; written in the background"""
+        if self.artifacts and self.driver:
+            with self.tracer.span(f"capture: {reason}", "capture"):
+                self.artifacts.capture(self.driver, reason, self.current_step, self.tracer.run_id)
+
+    def record_element(self, description, locator, fingerprint):
+        """Remember the element this run used, to be committed to the replay file if the run succeeds"""
+        if self.replay_store is not None:
+            self.recording.setdefault(self.current_step or "run", {})[description] = {
+                "locator": list(locator), "fingerprint": fingerprint, "method": None
+            }
+
+    def record_click(self, description, method):
+        """Remember which click method worked on the element recorded for description"""
+        element = self.recording.get(self.current_step or "run", {}).get(description)
+        if element:
+            element["method"] = method
+
+    def snapshot(self, groups, max_matches=SNAPSHOT_MAX_MATCHES):
+        """Capture URL, title and every match of each named locator group in one script call"""
+        # groups maps a name to a list of (By, value) locators; each match is a dict
+        # with element, tag, visible, enabled, text and rect keys
+        payload = [
+            [name, [[locator_type, locator_value] for locator_type, locator_value in locators]]
+            for name, locators in groups.items()
+        ]
+        return self.driver.execute_script(PAGE_SNAPSHOT_JS, payload, max_matches)
+
+    def extract_search_results(self, max_results=MAX_SEARCH_RESULTS):
+        """Index the rendered search results in one script call; each is a dict with
+        element, name, href, rating, eta and distance keys"""
+        return self.driver.execute_script(SEARCH_RESULTS_JS, max_results) or []
+    
+    def find_and_click(self, locators, description, timeout=10):
+        """Find element using multiple locators and click with fallback methods"""
+        remaining = list(locators)
+        methods = ["click", "js", "action"]
+        entry = self.replay_entry(description)
+        if entry and entry.get("method") in methods:
+            # The method that worked last time goes first
+            methods.remove(entry["method"])
+            methods.insert(0, entry["method"])
+        while remaining:
+            element, locator = self.resolve_locators(remaining, description, timeout)
+            if element is None:
+                break
+
+            # Try multiple click methods
+            for method in methods:
+                if self.safe_click(element, method):
+                    logging.info(f"Successfully clicked {description}")
+                    self.record_click(description, method)
+                    return True
+
+            # Every click method failed on the winner, race the remaining locators
+            logging.warning(f"Could not click {description} found via {locator[1]}")
+            remaining.remove(locator)
+
+        logging.error(f"Failed to find and click {description}")
+        return False
+
+    def wait_until(self, condition, timeout_key, description, timeout=None, label=None, learned_timeout=True):
+        """Poll a condition until it is truthy or its timeout is reached; the timeout is learned from
+        earlier waits on the same step and label (default: description), capped at the configured ceiling.
+        Pass learned_timeout=False when the caller falls back to something else on a miss."""
+        ceiling = self.wait_timeouts[timeout_key] if timeout is None else timeout
+        key = f"{self.current_step or 'run'}/{timeout_key}: {label or description}"
+        learn = self.adaptive_timeouts and timeout_key not in MANUAL_WAIT_KEYS
+        # A slow page must not end a step that is never retried, or send a lookup down its fallback path
+        shorten = learn and learned_timeout and self.current_step not in MANUAL_STEPS
+        timeout = self.timeout_store.timeout(key, ceiling) if shorten else ceiling
+        if timeout < ceiling and key not in self.reported_timeouts:
+            self.reported_timeouts.add(key)
+            logging.info(f"Learned timeout for {key}: {timeout:.2f}s (ceiling {ceiling}s)")
+        with self.tracer.span(f"wait: {description}", "wait", timeout=timeout, ceiling=ceiling) as span:
+            start = time.time()
+            try:
+                result = WebDriverWait(self.driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+            except TimeoutException:
+                span.ok = False
+                result = None
+                logging.warning(f"Timed out after {timeout:.2f}s waiting for {description}")
+            if learn:
+                self.timeout_store.record(key, time.time() - start, timed_out=not span.ok)
+            return result
+
+    def wait_for_page_ready(self, timeout=None):
+        """Wait for document.readyState to reach the state the page-load strategy treats as ready"""
+        ready_states = PAGE_READY_STATES[self.page_load_strategy]
+        return bool(self.wait_until(
+            lambda d: d.execute_script("return document.readyState") in ready_states,
+            "page_ready", "document ready", timeout
+        ))
+
+    def wait_for_network_idle(self, idle_time=NETWORK_IDLE_TIME, timeout=None):
+        """Wait until no fetch/XHR is in flight and no resource has finished for idle_time"""
+        idle_ms = idle_time * 1000
+
+        def network_idle(driver):
+            state = driver.execute_script(NETWORK_MONITOR_JS)
+            return (state["pending"] == 0
+                    and state["idleFor"] >= idle_ms
+                    and state["sinceLastResource"] >= idle_ms)
+
+        return bool(self.wait_until(network_idle, "network_idle", "network idle", timeout))
+
+    def wait_for_url_change(self, old_url, timeout=None):
+        """Wait for the current URL to differ from old_url"""
+        return bool(self.wait_until(
+            EC.url_changes(old_url), "url_change", f"URL to change from {old_url}", timeout, label="URL change"
+        ))
+
+    def wait_for_element_stable(self, element, timeout=None):
+        """Wait for an element's bounding box to stop moving (e.g. after scrolling)"""
+        last_rect = {}
+
+        def rect_unchanged(driver):
+            rect = driver.execute_script(
+                "var r = arguments[0].getBoundingClientRect();"
+                "return [r.x, r.y, r.width, r.height];", element
+            )
+            stable = rect == last_rect.get("value")
+            last_rect["value"] = rect
+            return stable
+
+        return bool(self.wait_until(rect_unchanged, "stable", "element to stop moving", timeout))
+
+    def wait_for_spinner_gone(self, timeout=None):
+        """Wait until no loading spinner or shimmer placeholder is visible"""
+        return bool(self.wait_until(
+            lambda d: not d.execute_script(SPINNER_VISIBLE_JS, SPINNER_SELECTORS),
+            "spinner", "loading indicators to disappear", timeout
+        ))
+
+    def wait_for_page_settled(self):
+        """Wait for document ready, loading indicators gone and network idle"""
+        ready = self.wait_for_page_ready()
+        spinner_gone = self.wait_for_spinner_gone()
+        idle = self.wait_for_network_idle()
+        return ready and spinner_gone and idle
+
+    def open_swiggy(self):
+        """Open Swiggy homepage"""
+        try:
+            self.driver.get(f"{self.base_url}/")
+            logging.info("Opened Swiggy homepage")
+            self.wait_for_page_settled()
+            return True
+        except Exception as e:
+            logging.error(f"Failed to open Swiggy: {e}")
+            return False
+    
+    def is_logged_in(self):
+        """Fast check for an authenticated session: login cookie first, then the account link"""
+        try:
+            cookie = self.driver.get_cookie(LOGIN_COOKIE)
+            if cookie and cookie.get("value") == "1":
+                return True
+            account_link, _ = self.probe_locators(LOGGED_IN_LOCATORS, "visible")
+            return account_link is not None
+        except Exception as e:
+            logging.warning(f"Login probe failed: {e}")
+            return False
+    
+    def save_session(self):
+        """Persist the current login so later runs can skip login and location setup"""
+        if self.session_store:
+            self.session_store.save(self.driver)
+    
+    def watch_login(self, verify_locators, start_url, timeout, ignore_error=None, ignore_verify=False):
+        """Block in-page until a login event happens or timeout seconds pass; returns the event dict"""
+        self.driver.set_script_timeout(timeout + 5)
+        return self.driver.execute_async_script(
+            LOGIN_WATCH_JS,
+            [[locator_type, locator_value] for locator_type, locator_value in verify_locators],
+            [[locator_type, locator_value] for locator_type, locator_value in LOGGED_IN_LOCATORS],
+            [[locator_type, locator_value] for locator_type, locator_value in OTP_ERROR_LOCATORS],
+            int(timeout * 1000),
+            start_url,
+            ignore_error,
+            ignore_verify
+        )
+    
+    def debug_current_state(self):
+        """Debug current page state"""
+        try:
+            # Check for common elements
+            elements_to_check = {
+                "OTP input": [
+                    (By.XPATH, "//input[@type='tel' and @maxlength='6']"),
+                    (By.XPATH, "//input[contains(@placeholder, 'OTP') or contains(@placeholder, 'otp')]")
+                ],
+                "Verify button": [(By.XPATH, "//button[contains(text(),'Verify')]")],
+                "Continue button": [(By.XPATH, "//button[contains(text(),'Continue')]")],
+                "Login form": [(By.XPATH, "//form")],
+                "Error message": [(By.XPATH, "//*[contains(@class, 'error') or contains(text(), 'error')]")]
+            }
+            
+            state = self.snapshot(elements_to_check)
+            logging.info(f"Current URL: {state['url']}")
+            logging.info(f"Page Title: {state['title']}")
+            
+            for element_name, elements in state["elements"].items():
+                if elements:
+                    logging.info(f"Found {len(elements)} {element_name} element(s)")
+                    for i, elem in enumerate(elements):
+                        if elem["visible"]:
+                            logging.debug(f"  {element_name} {i+1}: visible, enabled={elem['enabled']}")
+                        else:
+                            logging.debug(f"  {element_name} {i+1}: hidden")
+                    
+        except Exception as e:
+            logging.error(f"Debug failed: {e}")
+    
+    def handle_login(self):
+        """Handle login process with improved OTP handling"""
+        # Multiple possible login button locators
+        login_locators = [
+            (By.XPATH, "//a[contains(text(),'Sign in')]"),
+            (By.XPATH, "//span[contains(text(),'Sign In')]"),
+            (By.XPATH, "//div[contains(text(),'Sign in')]"),
+            (By.XPATH, "//button[contains(text(),'Login')]"),
+            (By.XPATH, "//*[contains(@class, 'login') or contains(@class, 'sign-in')]"),
+            (By.CSS_SELECTOR, "[data-testid='login-cta']")
+        ]
+        
+        if not self.find_and_click(login_locators, "login button"):
+            logging.error("Could not find login button")
+            return False
+        
+        # The phone input wait below returns as soon as the login drawer renders
+        
+        # Enter phone number
+        phone_locators = [
+            (By.XPATH, "//input[@type='tel']"),
+            (By.XPATH, "//input[@id='mobile']"),
+            (By.XPATH, "//input[@placeholder*='mobile' or @placeholder*='phone']"),
+            (By.CSS_SELECTOR, "input[type='tel']"),
+            (By.XPATH, "//input[@name='mobile']")
+        ]
+        
+        phone_input, _ = self.resolve_locators(phone_locators, "phone input", condition="visible")
+        
+        if not phone_input:
+            logging.error("Phone input field not found")
+            return False
+        
+        try:
+            phone_input.clear()
+            phone_input.send_keys(self.phone_number)
+            logging.info(f"Entered phone number: {self.phone_number}")
+        except Exception as e:
+            logging.error(f"Failed to enter phone number: {e}")
+            return False
+        
+        # Click login/continue after phone
+        login_after_phone_locators = [
+            (By.XPATH, "//button[contains(text(),'Login') or contains(text(),'Continue') or contains(text(),'Send OTP')]"),
+            (By.XPATH, "//a[contains(text(),'Login') or contains(text(),'Continue') or contains(text(),'Send OTP')]"),
+            (By.CSS_SELECTOR, "[data-testid='login-cta']"),
+            (By.XPATH, "//button[contains(@class, 'login') or contains(@class, 'continue')]")
+        ]
+        
+        if not self.find_and_click(login_after_phone_locators, "login after phone"):
+            logging.error("Could not find login/continue button after phone entry")
+            return False
+        
+        # Wait for the OTP request to complete
+        self.wait_for_network_idle()
+        
+        # Debug current state before OTP
+        logging.info("=== DEBUG: Current state before OTP ===")
+        self.debug_current_state()
+        
+        # Wait for OTP entry with better user interaction
+        print("🔢 Please enter the OTP manually in the browser...")
+        print("⏳ Waiting for OTP entry and automatic verification...")
+        
+        # Wait for either OTP completion or verify button to become available
+        verify_locators = [
+            (By.XPATH, "//button[contains(text(),'Verify') or contains(text(),'Continue') or contains(text(),'Proceed')]"),
+            (By.XPATH, "//a[contains(text(),'Verify') or contains(text(),'Continue') or contains(text(),'Proceed')]"),
+            (By.CSS_SELECTOR, "[data-testid='verify-cta']"),
+            (By.XPATH, "//button[contains(@class, 'verify') or contains(@class, 'continue')]")
+        ]
+        
+        otp_completed = False
+        start_url = self.driver.current_url
+        deadline = time.time() + self.wait_timeouts["otp"]
+        last_error = None
+        clicked_verify = False
+        
+        with self.tracer.span("wait: OTP login", "wait", timeout=self.wait_timeouts["otp"]) as span:
+            while not otp_completed:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                
+                try:
+                    result = self.watch_login(verify_locators, start_url, min(remaining, LOGIN_WATCH_INTERVAL),
+                                              last_error, clicked_verify)
+                except Exception as e:
+                    # A full navigation tears down the in-page watcher; check where we ended up
+                    logging.info(f"Page changed during OTP wait: {e}")
+                    otp_completed = self.is_logged_in()
+                    continue
+                
+                event = result["event"]
+                clicked_verify = False
+                if event == "logged_in":
+                    otp_completed = True
+                    logging.info(f"Login detected via {result['detail']} - OTP was successful")
+                elif event == "verify_enabled":
+                    # Try to click verify button
+                    if self.safe_click(result["element"], "click"):
+                        logging.info("Clicked verify button")
+                        clicked_verify = True
+                        self.wait_for_network_idle()
+                elif event == "error":
+                    last_error = result["detail"]
+                    logging.warning(f"Login error shown: {last_error}")
+                    print(f"⚠️ {last_error} - please re-enter the OTP")
+                else:
+                    print(f"⏳ Still waiting... {int(deadline - time.time())} seconds remaining")
+            span.ok = otp_completed
+        
+        if not otp_completed:
+            logging.error("OTP verification timed out or failed")
+            return False
+        
+        # Wait for the post-login page to finish loading
+        self.wait_for_page_settled()
+        logging.info("Login process completed successfully")
+        return True
+    
+    def wait_for_location_handling(self):
+        """Wait for manual location/address handling"""
+        print("📍 Please handle location/address selection manually if prompted...")
+        timeout = self.wait_timeouts["location"]
+        print(f"⏳ Waiting for you to complete location setup (up to {timeout} seconds)...")
+        if self.wait_until(lambda d: d.execute_script(LOCATION_SET_JS), "location", "delivery location"):
+            logging.info("Delivery location detected")
+        logging.info("Location handling wait completed")
+        return True
+    
+    def navigate_to_search_page(self):
+        """Navigate to Swiggy search page"""
+        try:
+            search_url = f"{self.base_url}/search"
+            self.driver.get(search_url)
+            logging.info(f"Navigated to search page: {search_url}")
+            self.wait_for_page_settled()
+            return True
+        except Exception as e:
+            logging.error(f"Failed to navigate to search page: {e}")
+            return False
+    
+    def search_restaurant(self, restaurant_name="Chandrika Grand"):
+        """Search for a restaurant on the search page"""
+        # Multiple possible search input locators
+        search_locators = [
+            (By.XPATH, "//input[@placeholder*='Search']"),
+            (By.XPATH, "//input[@placeholder*='restaurants']"),
+            (By.XPATH, "//input[@placeholder*='dishes']"),
+            (By.CSS_SELECTOR, "input[placeholder*='Search']"),
+            (By.XPATH, "//*[contains(@class, 'search')]//input"),
+            (By.XPATH, "//input[@type='text']"),
+            (By.XPATH, "//input[@name='searchQuery']")
+        ]
+        
+        search_input, _ = self.resolve_locators(search_locators, "search input")
+        
+        if not search_input:
+            logging.error("Search input not found")
+            return False
+        
+        try:
+            # Clear and enter search term
+            search_input.clear()
+            search_input.send_keys(restaurant_name)
+            logging.info(f"Entered search term: {restaurant_name}")
+            
+            # Press Enter or click search button
+            search_input.send_keys(Keys.RETURN)
+            logging.info(f"Searched for restaurant: {restaurant_name}")
+            self.wait_for_page_settled()  # Wait for search results
+            return True
+        except Exception as e:
+            logging.error(f"Failed to search for restaurant: {e}")
+            return False
+    
+    def select_restaurant(self, restaurant_name="Chandrika Grand"):
+        """Select restaurant from search results"""
+        # Wait for search results to load
+        self.wait_for_spinner_gone()
+        results = self.wait_until(lambda d: self.extract_search_results(), "element", "search results",
+                                  learned_timeout=False)
+        
+        if not results:
+            # No restaurant links on the page; fall back to matching the name in the text
+            literal = xpath_literal(restaurant_name)
+            restaurant_locators = [
+                (By.XPATH, f"//h3[contains(text(),{literal})]"),
+                (By.XPATH, f"//div[contains(@class, 'restaurant') and contains(text(),{literal})]"),
+                (By.XPATH, f"//*[contains(text(),{literal})]")
+            ]
+            results_url = self.driver.current_url
+            if not self.find_and_click(restaurant_locators, f"restaurant: {restaurant_name}"):
+                logging.error(f"Could not find restaurant: {restaurant_name}")
+                return False
+            self.resolved_restaurant = {"name": restaurant_name}
+        else:
+            restaurant = pick_restaurant(results, restaurant_name)
+            if not restaurant:
+                names = ", ".join(result["name"] for result in results[:5])
+                logging.error(f"No search result matches {restaurant_name} (saw: {names})")
+                return False
+            logging.info(f"Matched '{restaurant_name}' to result '{restaurant['name']}' "
+                         f"(score {match_score(restaurant['name'], restaurant_name):.2f}, "
+                         f"rating {restaurant['rating']}, {restaurant['eta']}, {restaurant['distance']})")
+            self.resolved_restaurant = {key: value for key, value in restaurant.items() if key != "element"}
+            
+            results_url = self.driver.current_url
+            if not any(self.safe_click(restaurant["element"], method) for method in ["click", "js"]):
+                # The card re-rendered under us; its link is just as good
+                logging.info(f"Opening {restaurant['href']} directly")
+                self.driver.get(restaurant["href"])
+        
+        logging.info(f"Selected restaurant: {restaurant_name}")
+        # Wait for restaurant page to load
+        self.wait_for_url_change(results_url)
+        self.wait_for_page_settled()
+        return True
+    
+    def api(self):
+        """The search/menu API client, carrying the browser's current cookies"""
+        if self.api_client is None:
+            self.api_client = SwiggyApiClient.from_driver(self.driver, self.base_url)
+        else:
+            self.api_client.update_from_driver(self.driver)
+        return self.api_client
+    
+    def open_restaurant_via_api(self, restaurant_name="Chandrika Grand", item_name=None):
+        """Resolve the restaurant through the search API and load its menu page directly"""
+        try:
+            client = self.api()
+            location = self.driver.execute_script(USER_LOCATION_JS)
+            with self.tracer.span("api: search", "api", query=restaurant_name):
+                restaurant = pick_restaurant(client.search_restaurants(restaurant_name, location), restaurant_name)
+            if not restaurant:
+                logging.error(f"API search found no restaurant matching: {restaurant_name}")
+                return False
+            
+            if item_name:
+                with self.tracer.span("api: menu", "api", restaurant_id=restaurant["id"]):
+                    items = client.fetch_menu(restaurant["id"], location)["items"]
+                if not any(normalize_name(item["name"]) == normalize_name(item_name) for item in items):
+                    logging.warning(f"'{item_name}' is not on the {restaurant['name']} menu returned by the API")
+                self.resolved_items = items
+        except ApiError as e:
+            # The rendered pages still work when the JSON endpoints change or refuse us
+            logging.warning(f"Search API unavailable ({e}), falling back to the search page")
+            return (self.navigate_to_search_page() and self.search_restaurant(restaurant_name)
+                    and self.select_restaurant(restaurant_name))
+        
+        logging.info(f"Resolved {restaurant['name']} via API: {restaurant['url']}")
+        self.resolved_restaurant = restaurant
+        self.driver.get(restaurant["url"])
+        self.wait_for_page_settled()
+        return True
+    
+    def open_cached_restaurant(self, restaurant_name, item_name=None):
+        """Go straight to a cached restaurant page; False on a cache miss or a stale entry"""
+        location = self.driver.execute_script(USER_LOCATION_JS)
+        entry = self.restaurant_cache.get(location, restaurant_name)
+        if not entry:
+            return False
+        
+        items = entry["items"]
+        if item_name and items is not None and not any(
+                normalize_name(item["name"]) == normalize_name(item_name) for item in items):
+            self.restaurant_cache.invalidate(location, restaurant_name, f"'{item_name}' is not on the cached menu")
+            return False
+        
+        self.driver.get(entry["url"])
+        self.wait_for_page_settled()
+        if self.driver.execute_script(PAGE_STATUS_JS) == 404:
+            self.restaurant_cache.invalidate(location, restaurant_name, f"{entry['url']} returned 404")
+            return False
+        
+        logging.info(f"Opened cached restaurant page for {restaurant_name}: {entry['url']}")
+        self.resolved_restaurant = entry["restaurant"]
+        self.resolved_items = items
+        return True
+    
+    def cache_restaurant(self, restaurant_name):
+        """Remember the restaurant page the select step ended on"""
+        location = self.driver.execute_script(USER_LOCATION_JS)
+        self.restaurant_cache.put(location, restaurant_name, self.driver.current_url,
+                                  restaurant=self.resolved_restaurant, items=self.resolved_items)
+    
+    def resolve_restaurant_url(self, restaurant_name):
+        """Menu page URL of a restaurant from the cache, the search API (in API mode) or the search page"""
+        location = self.driver.execute_script(USER_LOCATION_JS)
+        if self.restaurant_cache:
+            entry = self.restaurant_cache.get(location, restaurant_name)
+            if entry:
+                return entry["url"]
+        
+        if self.api_mode:
+            try:
+                with self.tracer.span("api: search", "api", query=restaurant_name):
+                    restaurant = pick_restaurant(self.api().search_restaurants(restaurant_name, location),
+                                                 restaurant_name)
+                if restaurant:
+                    return restaurant["url"]
+            except ApiError as e:
+                logging.warning(f"API search for {restaurant_name} failed, using the search page: {e}")
+        
+        if not (self.navigate_to_search_page() and self.search_restaurant(restaurant_name)):
+            return None
+        results = self.wait_until(lambda d: self.extract_search_results(), "element", "search results")
+        restaurant = pick_restaurant(results or [], restaurant_name)
+        return restaurant["href"] if restaurant else None
+    
+    def compare_restaurants(self, restaurant_names, item_name=None):
+        """Load several restaurant pages in parallel tabs of this browser and read each one's rating,
+        ETA and menu prices; returns one record per restaurant, in the given order"""
+        records = []
+        for restaurant_name in restaurant_names:
+            with self.tracer.span(f"resolve: {restaurant_name}", "step"):
+                url = self.resolve_restaurant_url(restaurant_name)
+            if not url:
+                logging.warning(f"Could not find restaurant: {restaurant_name}")
+            records.append({"query": restaurant_name, "url": url, "status": "loading" if url else "not_found",
+                            "name": None, "rating": None, "eta": None, "items": [], "item": None})
+        
+        main_tab = self.driver.current_window_handle
+        tabs = {}
+        try:
+            for record in records:
+                if not record["url"]:
+                    continue
+                try:
+                    self.driver.switch_to.new_window("tab")
+                    # Known before anything else can fail, so the finally block closes it
+                    tabs[self.driver.current_window_handle] = record
+                    # CDP blocking only applies to the tab it was sent to
+                    self.apply_resource_policy()
+                    # Assigning the location returns at once, so all tabs load at the same time
+                    self.driver.execute_script("window.location.href = arguments[0];", record["url"])
+                except WebDriverException as e:
+                    logging.warning(f"Could not open a tab for {record['query']}: {e}")
+                    record["status"] = "unavailable"
+            
+            pending = {handle: record for handle, record in tabs.items() if record["status"] == "loading"}
+            
+            def snapshot_tabs(driver):
+                for handle, record in list(pending.items()):
+                    try:
+                        driver.switch_to.window(handle)
+                    except NoSuchWindowException:
+                        # The tab closed or crashed; the other restaurants are still compared
+                        logging.warning(f"Tab for {record['query']} is gone")
+                        record["status"] = "unavailable"
+                        del pending[handle]
+                        continue
+                    try:
+                        snapshot = driver.execute_script(MENU_SNAPSHOT_JS, ADD_CONTROL_LOCATORS, item_name,
+                                                         COMPARE_MAX_MENU_ITEMS)
+                    except WebDriverException:
+                        # The tab is between documents; read it on the next poll
+                        continue
+                    record.update(snapshot)
+                    if snapshot["status"] != "loading":
+                        del pending[handle]
+                return not pending
+            
+            with self.tracer.span(f"compare: {len(tabs)} tab(s)", "step"):
+                self.wait_until(snapshot_tabs, "page_ready", f"{len(tabs)} restaurant tab(s) to load",
+                                label="restaurant tabs")
+            for record in pending.values():
+                record["status"] = "timed_out"
+        finally:
+            for handle in tabs:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except WebDriverException:
+                    pass
+            try:
+                self.driver.switch_to.window(main_tab)
+            except WebDriverException as e:
+                logging.warning(f"Could not return to the main tab: {e}")
+        
+        if self.restaurant_cache:
+            location = self.driver.execute_script(USER_LOCATION_JS)
+            for record in records:
+                if record["status"] == "ready":
+                    restaurant = {key: record[key] for key in ("name", "rating", "eta")}
+                    self.restaurant_cache.put(location, record["query"], record["url"], restaurant=restaurant,
+                                              items=record["items"])
+                elif record["status"] == "not_found" and record["url"]:
+                    # A cached URL that no longer leads to the restaurant must not be used again
+                    self.restaurant_cache.invalidate(location, record["query"], "menu page not found")
+        return records
+    
+    def add_item_to_cart(self, item_name=None):
+        """Add the named item (or the first available item) to cart"""
+        # Multiple possible add button locators
+        add_button_locators = [
+            (By.XPATH, "//button[contains(text(),'ADD') or contains(text(),'Add')]"),
+            (By.XPATH, "//div[contains(text(),'ADD') or contains(text(),'Add')]"),
+            (By.CSS_SELECTOR, "[data-testid='add-item-btn']"),
+            (By.XPATH, "//*[contains(@class, 'add-btn') or contains(@class, 'add-button')]"),
+            (By.XPATH, "//button[contains(@class, 'styles_base__') and contains(text(), 'ADD')]")
+        ]
+        description = "add button"
+        
+        if item_name:
+            # Only the ADD control inside the closest container holding the item name
+            item = xpath_literal(item_name)
+            add_button_locators = [
+                (By.XPATH, f"//*[contains(text(), {item})]/ancestor::*[.//button[contains(text(),'ADD') or contains(text(),'Add')]][1]"
+                           "//button[contains(text(),'ADD') or contains(text(),'Add')]"),
+                (By.XPATH, f"//*[contains(text(), {item})]/ancestor::*[.//*[@data-testid='add-item-btn']][1]"
+                           "//*[@data-testid='add-item-btn']")
+            ]
+            description = f"add button: {item_name}"
+        
+        try:
+            # Wait for menu to load
+            self.wait_for_page_settled()
+            
+            # Find first add button
+            add_button, _ = self.resolve_locators(add_button_locators, description)
+            
+            if not add_button:
+                logging.error("Add button not found")
+                return False
+            
+            # Scroll to button and click to add first item
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_button)
+            self.wait_for_element_stable(add_button)
+            
+            if self.safe_click(add_button, "js"):
+                logging.info(f"Added {item_name or 'first item'} to cart")
+                self.wait_for_network_idle()
+                return True
+            
+        except Exception as e:
+            logging.error(f"Failed to add item to cart: {e}")
+            return False
+    
+    def add_items_to_cart(self, items):
+        """Bring several (item name, quantity) pairs up to their quantity in the cart in one page pass; True if
+        every unit is confirmed. Units already in the cart are not added again, so a retry is safe."""
+        items = [(name, int(quantity)) for name, quantity in items]
+        # Worst case: the menu renders at the deadline and every click waits the full confirm timeout
+        timeout = CART_FIND_TIMEOUT + CART_CONFIRM_TIMEOUT * sum(quantity for _, quantity in items)
+        
+        try:
+            self.wait_for_page_settled()
+            with self.tracer.span(f"cart: {len(items)} item(s)", "click", method="batch") as span:
+                self.driver.set_script_timeout(timeout + 5)
+                outcome = self.driver.execute_async_script(
+                    CART_ADD_JS,
+                    [[name, quantity] for name, quantity in items],
+                    [[locator_type, locator_value] for locator_type, locator_value in ADD_CONTROL_LOCATORS],
+                    [[locator_type, locator_value] for locator_type, locator_value in INCREMENT_LOCATORS],
+                    [[locator_type, locator_value] for locator_type, locator_value in CART_COUNT_LOCATORS],
+                    [[locator_type, locator_value] for locator_type, locator_value in CUSTOMIZATION_CONFIRM_LOCATORS],
+                    int(CART_FIND_TIMEOUT * 1000),
+                    int(CART_CONFIRM_TIMEOUT * 1000)
+                )
+                span.ok = all(result["status"] == "ok" for result in outcome["results"])
+                span.attrs["cart_count"] = outcome["cartCount"]
+        except Exception as e:
+            logging.error(f"Failed to add items to cart: {e}")
+            return False
+        
+        for result in outcome["results"]:
+            customized = " (customized)" if result["customized"] else ""
+            present = f", {result['present']} already in cart" if result["present"] else ""
+            if result["status"] == "ok":
+                logging.info(f"Added {result['added']} x {result['name']} to cart{customized}{present}")
+            elif result["status"] == "not_found":
+                logging.error(f"'{result['name']}' is not on the menu")
+            else:
+                logging.error(f"Added only {result['added']}/{result['requested']} x {result['name']}{customized}"
+                              f"{present}: {result['status']}")
+        logging.info(f"Cart now shows {outcome['cartCount']} item(s)")
+        
+        if any(result["added"] for result in outcome["results"]):
+            self.wait_for_network_idle()
+        missing = [result["name"] for result in outcome["results"] if result["status"] == "not_found"]
+        if missing:
+            raise StepAborted(f"not on the menu: {', '.join(missing)}")
+        return span.ok
+    
+    def view_cart_and_select_address(self):
+        """View cart and select home address"""
+        # View cart
+        view_cart_locators = [
+            (By.XPATH, "//span[contains(text(),'View Cart')]"),
+            (By.XPATH, "//button[contains(text(),'View Cart')]"),
+            (By.CSS_SELECTOR, "[data-testid='view-cart-btn']"),
+            (By.XPATH, "//*[contains(@class, 'view-cart')]"),
+            (By.XPATH, "//div[contains(text(),'View Cart')]"),
+            (By.XPATH, "//a[contains(text(),'View Cart')]")
+        ]
+        
+        if not self.find_and_click(view_cart_locators, "view cart button"):
+            logging.error("Could not find view cart button")
+            return False
+        
+        self.wait_for_page_settled()
+        
+        # Select home address
+        if not self.select_home_address():
+            logging.error("Could not select home address")
+            return False
+        
+        logging.info("Successfully viewed cart and selected home address")
+        return True
+    
+    def select_home_address(self):
+        """Select home address from available addresses"""
+        try:
+            # Wait for address section to load
+            self.wait_for_spinner_gone()
+            
+            # Multiple possible home address locators
+            home_address_locators = [
+                (By.XPATH, "//div[contains(text(),'Home') or contains(text(),'HOME')]"),
+                (By.XPATH, "//span[contains(text(),'Home') or contains(text(),'HOME')]"),
+                (By.XPATH, "//*[contains(@class, 'address') and contains(text(), 'Home')]"),
+                (By.XPATH, "//label[contains(text(),'Home')]"),
+                (By.XPATH, "//div[contains(@class, 'address-type') and contains(text(), 'Home')]"),
+                (By.XPATH, "//button[contains(text(),'Home')]"),
+                (By.XPATH, "//*[contains(@data-testid, 'address') and contains(text(), 'Home')]")
+            ]
+            
+            # Try to find and click home address
+            # A miss falls through to the first address, so give the Home address the full timeout
+            home_address, locator = self.resolve_locators(home_address_locators, "home address",
+                                                          learned_timeout=False)
+            if home_address is not None:
+                try:
+                    # Scroll to address and click
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", home_address)
+                    self.wait_for_element_stable(home_address)
+                    
+                    if self.safe_click(home_address, "js"):
+                        logging.info("Selected home address")
+                        self.wait_for_network_idle()
+                        return True
+                        
+                except Exception as e:
+                    logging.warning(f"Error with home address locator {locator[1]}: {e}")
+            
+            # If no specific "Home" address found, try to select first address
+            logging.warning("Home address not found, trying to select first available address")
+            return self.select_first_address()
+            
+        except Exception as e:
+            logging.error(f"Failed to select home address: {e}")
+            return False
+    
+    def select_first_address(self):
+        """Select the first available address if home address not found"""
+        try:
+            # Generic address locators
+            address_locators = [
+                (By.XPATH, "//div[contains(@class, 'address-item')]"),
+                (By.XPATH, "//div[contains(@class, 'address-card')]"),
+                (By.XPATH, "//button[contains(@class, 'address')]"),
+                (By.XPATH, "//*[contains(@class, 'address') and contains(@class, 'selectable')]"),
+                (By.XPATH, "//label[contains(@class, 'address')]"),
+                (By.XPATH, "//div[contains(@class, 'delivery-address')]")
+            ]
+            
+            address_element, locator = self.resolve_locators(address_locators, "first address")
+            if address_element is not None:
+                try:
+                    # Scroll to address and click
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", address_element)
+                    self.wait_for_element_stable(address_element)
+                    
+                    if self.safe_click(address_element, "js"):
+                        logging.info("Selected first available address")
+                        self.wait_for_network_idle()
+                        return True
+                        
+                except Exception as e:
+                    logging.warning(f"Error with address locator {locator[1]}: {e}")
+            
+            logging.warning("No address could be selected automatically")
+            timeout = self.wait_timeouts["manual_address"]
+            print(f"📍 Please select your delivery address manually within {timeout} seconds...")
+            self.wait_until(lambda d: d.execute_script(ADDRESS_SELECTED_JS), "manual_address", "manual address selection")
+            return True
+            
+        except Exception as e:
+            logging.error(f"Failed to select address: {e}")
+            return False
+    
+    def workflow_steps(self, restaurant_name, item_name, items=None):
+        """The ordered (step id, step name, function) list that run_automation executes"""
+        if items:
+            add_step = ("add_item", "Adding items to cart", lambda: self.add_items_to_cart(items))
+        else:
+            add_step = ("add_item", "Adding item to cart", lambda: self.add_item_to_cart(item_name))
+        if self.api_mode:
+            return [
+                ("open", "Opening Swiggy", self.open_swiggy),
+                ("login", "Handling login", self.handle_login),
+                ("location", "Waiting for location handling", self.wait_for_location_handling),
+                ("select", "Opening restaurant via API", lambda: self.open_restaurant_via_api(restaurant_name, item_name)),
+                add_step,
+                ("cart", "Viewing cart and selecting address", self.view_cart_and_select_address)
+            ]
+        return [
+            ("open", "Opening Swiggy", self.open_swiggy),
+            ("login", "Handling login", self.handle_login),
+            ("location", "Waiting for location handling", self.wait_for_location_handling),
+            ("search_page", "Navigating to search page", self.navigate_to_search_page),
+            ("search", "Searching restaurant", lambda: self.search_restaurant(restaurant_name)),
+            ("select", "Selecting restaurant", lambda: self.select_restaurant(restaurant_name)),
+            add_step,
+            ("cart", "Viewing cart and selecting address", self.view_cart_and_select_address)
+        ]
+    
+    def resume_checkpoint(self, checkpoint, resume_from, step_ids):
+        """Put the browser back where the step before resume_from left it"""
+        index = step_ids.index(resume_from)
+        if index == 0:
+            return
+        
+        # The checkpoint's session is the one the completed steps left behind, newer than any session file
+        if checkpoint.get("session"):
+            apply_session(self.driver, checkpoint["session"], self.base_url)
+            logging.info("Restored browser session from checkpoint")
+        
+        url = checkpoint["urls"].get(step_ids[index - 1])
+        if url:
+            self.driver.get(url)
+            self.wait_for_page_settled()
+            logging.info(f"Resuming at {url}")
+        else:
+            logging.warning(f"Checkpoint has no URL for step '{step_ids[index - 1]}', resuming from the current page")
+    
+    def run_step(self, step_id, step_name, step_function, start_url):
+        """Run one step, retrying non-manual steps with exponential backoff from start_url"""
+        retries = 0 if step_id in MANUAL_STEPS else self.step_retries
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = STEP_RETRY_BACKOFF * 2 ** (attempt - 1)
+                logging.info(f"Retrying: {step_name} in {delay:.1f}s (attempt {attempt + 1}/{retries + 1})")
+                time.sleep(delay)
+                # Start the retry from the page the step originally started on
+                if start_url and self.driver.current_url != start_url:
+                    self.driver.get(start_url)
+                    self.wait_for_page_settled()
+            
+            with self.tracer.span(f"{step_name} (attempt {attempt + 1})", "attempt") as attempt_span:
+                try:
+                    attempt_span.ok = bool(step_function())
+                except StepAborted as e:
+                    logging.error(f"{step_name} cannot succeed: {e}")
+                    attempt_span.ok = False
+                    break
+                except Exception as e:
+                    logging.warning(f"{step_name} raised: {e}")
+                    attempt_span.ok = False
+            if attempt_span.ok:
+                return True
+        # Only a step that failed for good is worth the synchronous screenshot and DOM read
+        self.capture_failure(f"step: {step_name}")
+        return False
+    
+    def run_automation(self, restaurant_name="Chandrika Grand", item_name=None, resume_from=None, items=None):
+        """Run complete automation workflow, optionally resuming from a named step; items is a list
+        of (item name, quantity) pairs to add instead of the single item_name"""
+        steps = self.workflow_steps(restaurant_name, item_name, items)
+        step_ids = [step_id for step_id, _, _ in steps]
+        if resume_from and resume_from not in step_ids:
+            raise ValueError(f"Unknown step '{resume_from}', expected one of: {', '.join(step_ids)}")
+        if resume_from and step_ids.index(resume_from) and not (self.checkpoint_store and self.checkpoint_store.load()):
+            raise ValueError(f"No checkpoint to resume from at '{resume_from}'; run the workflow from the start")
+        
+        self.tracer.reset()
+        self.resolved_restaurant = None
+        self.resolved_items = None
+        self.reported_timeouts.clear()
+        self.recording = {}
+        if self.profiler:
+            self.profiler.reset()
+        set_log_context(run_id=self.tracer.run_id)
+        try:
+            with self.tracer.span("run_automation", "run", restaurant=restaurant_name, item=item_name) as run_span:
+                checkpoint = None
+                if self.checkpoint_store:
+                    checkpoint = self.checkpoint_store.load() if resume_from else None
+                    if checkpoint is None:
+                        checkpoint = self.checkpoint_store.start(restaurant_name, item_name)
+                
+                start_index = 0
+                if resume_from:
+                    start_index = step_ids.index(resume_from)
+                    logging.info(f"Resuming workflow from step '{resume_from}'")
+                    if checkpoint:
+                        self.resume_checkpoint(checkpoint, resume_from, step_ids)
+                
+                logged_in = False
+                restaurant_cached = None
+                for step_id, step_name, step_function in steps[start_index:]:
+                    if logged_in and step_id in SESSION_SKIPPABLE_STEPS:
+                        logging.info(f"Skipping: {step_name} (already logged in)")
+                        if checkpoint:
+                            # Otherwise --resume would send a logged-in browser back to the login step
+                            self.checkpoint_store.record_step(checkpoint, step_id, self.driver)
+                        continue
+                    
+                    self.current_step = step_id
+                    set_log_context(step=step_id)
+                    if self.restaurant_cache and step_id in RESTAURANT_STEPS:
+                        if restaurant_cached is None:
+                            with self.tracer.span("Opening cached restaurant", "step") as cache_span:
+                                restaurant_cached = self.open_cached_restaurant(restaurant_name, item_name)
+                                cache_span.attrs["hit"] = restaurant_cached
+                        if restaurant_cached:
+                            logging.info(f"Skipping: {step_name} (restaurant cached)")
+                            if checkpoint:
+                                self.checkpoint_store.record_step(checkpoint, step_id, self.driver)
+                            continue
+                    
+                    logging.info(f"Starting: {step_name}")
+                    start_url = self.driver.current_url
+                    if self.profiler:
+                        self.profiler.start_step(step_id)
+                    with self.tracer.span(step_name, "step") as step_span:
+                        step_span.ok = self.run_step(step_id, step_name, step_function, start_url)
+                    if self.profiler:
+                        self.profiler.end_step()
+                    if not step_span.ok:
+                        logging.error(f"Failed: {step_name} ({step_span.duration:.2f}s)",
+                                      extra={"duration": round(step_span.duration, 4)})
+                        if restaurant_cached and step_id == "add_item":
+                            # The cached page may be another restaurant or an outdated menu
+                            location = self.driver.execute_script(USER_LOCATION_JS)
+                            self.restaurant_cache.invalidate(location, restaurant_name, "adding the item failed")
+                        if checkpoint:
+                            print(f"💾 Progress saved. Resume with: python swiggy_automation.py run --resume-from {step_id}")
+                        run_span.ok = False
+                        return False
+                    logging.info(f"Completed: {step_name} ({step_span.duration:.2f}s)",
+                                 extra={"duration": round(step_span.duration, 4)})
+                    if checkpoint:
+                        self.checkpoint_store.record_step(checkpoint, step_id, self.driver)
+                    
+                    if step_id == "open":
+                        logged_in = self.is_logged_in()
+                        if logged_in:
+                            logging.info("Existing session is logged in")
+                        elif self.session_restored:
+                            logging.info("Restored session is no longer logged in")
+                            self.session_store.clear()
+                    elif step_id == "location":
+                        self.save_session()
+                    elif step_id == "select" and self.restaurant_cache:
+                        self.cache_restaurant(restaurant_name)
+                
+                # Refresh the saved cookies so their expiry keeps moving forward
+                self.save_session()
+                if self.replay_store:
+                    # Only a run that got all the way through is worth replaying
+                    self.replay_store.commit(self.recording)
+                if self.checkpoint_store:
+                    self.checkpoint_store.clear()
+            
+            clear_log_context("step")
+            logging.info(f"✅ Automation completed successfully in {run_span.duration:.2f}s!",
+                         extra={"duration": round(run_span.duration, 4)})
+            print("🎉 Automation complete! The item has been added to cart and home address selected.")
+            print("📋 You can now review the order and proceed with payment manually.")
+            return True
+            
+        except Exception as e:
+            logging.error(f"Automation failed with error: {e}")
+            return False
+        
+        finally:
+            self.current_step = None
+            clear_log_context("run_id", "step")
+            self.locator_store.save()
+            self.timeout_store.save()
+            if self.replay_store:
+                self.replay_store.save()
+            if self.restaurant_cache:
+                self.restaurant_cache.save()
+            if self.trace_dir:
+                self.tracer.export(self.trace_dir)
+            if self.profiler:
+                self.profiler.end_step()
+                self.profiler.export(self.profile_dir, self.tracer.run_id)
+    
+    def start_new_session(self, phone_number, session_file=None):
+        """Wipe cookies and storage so the next run is isolated, then restore the account's session"""
+        self.phone_number = phone_number
+        self.driver.get(f"{self.base_url}{SESSION_RESTORE_PATH}")
+        self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        self.driver.delete_all_cookies()
+        
+        self.session_store = SessionStore(session_file) if session_file else None
+        self.session_restored = bool(self.session_store) and self.session_store.restore(self.driver, self.base_url)
+    
+    def is_alive(self):
+        """Whether the browser is still responding to WebDriver commands"""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+    
+    def quit(self):
+        """Close the browser and end the WebDriver session"""
+        if self.artifacts:
+            self.artifacts.flush()
+        if self.api_client:
+            self.api_client.close()
+            self.api_client = None
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                logging.warning(f"Error while quitting browser: {e}")
+            self.driver = None
+    
+    def cleanup(self):
+        """Clean up resources"""
+        if self.driver:
+            logging.info("Closing browser...")
+            # Don't quit immediately, let user review
+            # self.driver.quit()
+
+
+def workflow_step_ids(api_mode=False):
+    """The step IDs run_automation executes in the given mode, in order"""
+    return list(API_WORKFLOW_STEP_IDS if api_mode else WORKFLOW_STEP_IDS)
+
+
+def parse_item_spec(spec):
+    """'Masala Dosa:2' -> ('Masala Dosa', 2); a spec without a quantity means one"""
+    name, separator, quantity = spec.rpartition(":")
+    if separator and quantity.strip().isdigit():
+        return name.strip(), int(quantity)
+    return spec.strip(), 1
+
+
+def add_browser_arguments(parser, capture_failures=True):
+    """Add the browser and tracing options shared by every browser-driving command; capture_failures=False
+    makes failure artifacts opt-in (for benchmarks and load tests)"""
+    parser.add_argument("--block", default="",
+                        help=f"Comma-separated resource categories to block ({', '.join(BLOCKABLE_RESOURCES)})")
+    parser.add_argument("--block-url", action="append", default=[],
+                        help="Extra URL pattern to block, e.g. '*ads.example.com*' (repeatable)")
+    parser.add_argument("--page-load-strategy", choices=list(PAGE_READY_STATES), default="normal",
+                        help="Chrome page-load strategy; eager/none return before subresources finish")
+    parser.add_argument("--trace-dir", help="Write per-step timing spans (JSON lines + Chrome trace) here")
+    parser.add_argument("--api", action="store_true",
+                        help="Find the restaurant through the site's search API instead of the search page")
+    parser.add_argument("--profile-dir",
+                        help="Record per-step network and page performance; write a HAR and summary per run here")
+    parser.add_argument("--record", action="store_true",
+                        help="Record the locator, fingerprint and click method each successful run used")
+    parser.add_argument("--replay", action="store_true",
+                        help="Reuse the recorded elements instead of searching, re-recording any that changed")
+    parser.add_argument("--replay-file", default=REPLAY_FILE, help="Where the recorded flow is kept")
+    parser.add_argument("--no-adaptive-timeouts", dest="adaptive_timeouts", action="store_false",
+                        help="Always wait the full configured timeout instead of the learned one")
+    if capture_failures:
+        parser.add_argument("--artifact-dir", default=ARTIFACTS_DIR,
+                            help="Where to keep screenshot, DOM, console log and URL of each failed step")
+        parser.add_argument("--no-artifacts", dest="artifact_dir", action="store_const", const=None,
+                            help="Don't capture failure artifacts")
+    else:
+        parser.add_argument("--artifact-dir",
+                            help="Capture screenshot, DOM, console log and URL of each failed step here (off by default)")
+    parser.add_argument("--artifact-max-count", type=int, default=ARTIFACT_MAX_COUNT,
+                        help="Failure archives to keep before deleting the oldest")
+    parser.add_argument("--artifact-max-mb", type=float, default=ARTIFACT_MAX_MB,
+                        help="Total size of failure archives to keep before deleting the oldest")
+
+
+def browser_options(args):
+    """SwiggyAutomation keyword arguments for the browser options on the command line"""
+    return {
+        "block_resources": [category.strip() for category in args.block.split(",") if category.strip()],
+        "block_url_patterns": args.block_url,
+        "page_load_strategy": args.page_load_strategy,
+        "trace_dir": args.trace_dir,
+        "api_mode": args.api,
+        "adaptive_timeouts": args.adaptive_timeouts,
+        "profile_dir": args.profile_dir,
+        "replay_file": args.replay_file if args.record or args.replay else None,
+        "replay": args.replay,
+        "artifact_dir": args.artifact_dir,
+        "artifact_max_count": args.artifact_max_count,
+        "artifact_max_mb": args.artifact_max_mb,
+    }
+
+
+def add_cache_arguments(parser):
+    """Add the restaurant cache options shared by run and batch"""
+    parser.add_argument("--restaurant-cache", default=RESTAURANT_CACHE_FILE,
+                        help="Where to cache resolved restaurant URLs and menus")
+    parser.add_argument("--no-restaurant-cache", dest="restaurant_cache", action="store_const", const=None,
+                        help="Always search for the restaurant")
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Swiggy ordering automation")
+    parser.add_argument("--log-file", default=LOG_FILE, help="JSON-lines log file ('' for console only)")
+    parser.add_argument("--log-max-mb", type=float, default=LOG_MAX_BYTES / (1024 * 1024),
+                        help="Rotate the log file once it reaches this size")
+    parser.add_argument("--log-rotate-when", metavar="WHEN",
+                        help="Rotate on a schedule instead of by size, e.g. 'midnight' or 'H' (hourly)")
+    parser.add_argument("--log-backups", type=int, default=LOG_BACKUP_COUNT, help="Rotated log files to keep")
+    parser.add_argument("--debug", action="store_true", help="Also write DEBUG records to the log file")
+    parser.add_argument("--debug-sample-rate", type=float, default=1.0, metavar="RATE",
+                        help="With --debug, keep only this random fraction of DEBUG records (e.g. 0.1)")
+    parser.set_defaults(session_file=SESSION_FILE, user_data_dir=None, block="", block_url=[],
+                        page_load_strategy="normal", trace_dir=None, profile_dir=None, api=False,
+                        adaptive_timeouts=True, checkpoint_file=CHECKPOINT_FILE, resume=False, resume_from=None,
+                        step_retries=DEFAULT_STEP_RETRIES, restaurant_cache=RESTAURANT_CACHE_FILE, items=[],
+                        record=False, replay=False, replay_file=REPLAY_FILE, artifact_dir=ARTIFACTS_DIR,
+                        artifact_max_count=ARTIFACT_MAX_COUNT, artifact_max_mb=ARTIFACT_MAX_MB)
+    subparsers = parser.add_subparsers(dest="command")
+    
+    run_parser = subparsers.add_parser("run", help="Run the ordering workflow (default)")
+    run_parser.add_argument("--session-file", default=SESSION_FILE,
+                            help="Where to save/restore the login session")
+    run_parser.add_argument("--no-session", dest="session_file", action="store_const", const=None,
+                            help="Do not save or restore the login session")
+    run_parser.add_argument("--user-data-dir", help="Use a persistent Chrome profile directory")
+    run_parser.add_argument("--checkpoint-file", default=CHECKPOINT_FILE, help="Where to record completed steps")
+    run_parser.add_argument("--resume", action="store_true", help="Continue after the last completed step")
+    run_parser.add_argument("--resume-from", choices=WORKFLOW_STEP_IDS,
+                            help="Continue from this step (needs the checkpoint of an earlier run)")
+    run_parser.add_argument("--item", dest="items", action="append", type=parse_item_spec, default=[],
+                            help="Menu item to add as NAME or NAME:QUANTITY (repeatable; default: first item)")
+    run_parser.add_argument("--step-retries", type=int, default=DEFAULT_STEP_RETRIES,
+                            help="Automatic retries for a failed (non-manual) step")
+    add_cache_arguments(run_parser)
+    add_browser_arguments(run_parser)
+    
+    compare_parser = subparsers.add_parser("compare", help="Compare restaurants' ETA and item price in tabs of one browser")
+    compare_parser.add_argument("restaurants", nargs="+", help="Restaurant names to compare")
+    compare_parser.add_argument("--item", dest="compare_item", help="Compare the price of this menu item")
+    compare_parser.add_argument("--session-file", default=SESSION_FILE, help="Where to save/restore the login session")
+    compare_parser.add_argument("--no-session", dest="session_file", action="store_const", const=None,
+                                help="Do not save or restore the login session")
+    compare_parser.add_argument("--report", help="Also write the ranked comparison to this JSON file")
+    add_cache_arguments(compare_parser)
+    add_browser_arguments(compare_parser)
+    
+    batch_parser = subparsers.add_parser("batch", help="Run many orders concurrently from a job file")
+    batch_parser.add_argument("jobs", help="CSV or JSON-lines file of account,restaurant,item jobs")
+    batch_parser.add_argument("--workers", type=int, help="Maximum number of browsers (default: based on cores and memory)")
+    batch_parser.add_argument("--retries", type=int, default=2, help="Retries per job after a browser crash")
+    batch_parser.add_argument("--sessions-dir", default="sessions", help="Directory of per-account session files")
+    batch_parser.add_argument("--report", default="batch_report.json", help="Where to write the JSON report")
+    batch_parser.add_argument("--show-browser", action="store_true", help="Run the browsers with a visible window")
+    add_cache_arguments(batch_parser)
+    add_browser_arguments(batch_parser)
+    
+    # Imported here: daemon imports batch_runner, which imports this module
+    from daemon import DEFAULT_DAEMON_PORT, RECYCLE_AFTER_JOBS, RECYCLE_MEMORY_GROWTH_MB
+    daemon_parser = subparsers.add_parser("daemon", help="Keep warm browsers running and accept jobs over HTTP")
+    daemon_parser.add_argument("--workers", type=int, default=1, help="Number of warm browsers")
+    daemon_parser.add_argument("--port", type=int, default=DEFAULT_DAEMON_PORT, help="Local TCP port for the HTTP API")
+    daemon_parser.add_argument("--socket", help="Serve the HTTP API on this Unix socket instead of a TCP port")
+    daemon_parser.add_argument("--retries", type=int, default=2, help="Retries per job after a browser crash")
+    daemon_parser.add_argument("--sessions-dir", default="sessions", help="Directory of per-account session files")
+    daemon_parser.add_argument("--recycle-after", type=int, default=RECYCLE_AFTER_JOBS,
+                               help="Restart a browser after this many jobs")
+    daemon_parser.add_argument("--recycle-memory-mb", type=int, default=RECYCLE_MEMORY_GROWTH_MB,
+                               help="Restart a browser once its memory grew this much past its warm size")
+    daemon_parser.add_argument("--show-browser", action="store_true", help="Run the browsers with a visible window")
+    add_cache_arguments(daemon_parser)
+    add_browser_arguments(daemon_parser)
+    
+    bench_parser = subparsers.add_parser("bench", help="Benchmark the full flow against a local mock site")
+    bench_parser.add_argument("--iterations", type=int, default=5, help="Number of headless runs")
+    bench_parser.add_argument("--restaurant", default="Chandrika Grand", help="Restaurant to order from")
+    bench_parser.add_argument("--item", help="Menu item to add (default: first item)")
+    bench_parser.add_argument("--page-latency", type=float, default=0.0, help="Seconds added to every page load")
+    bench_parser.add_argument("--api-latency", type=float, default=0.0, help="Seconds added to every API call")
+    bench_parser.add_argument("--render-delay", type=int, default=0, help="Milliseconds before fetched content renders")
+    bench_parser.add_argument("--report", default="benchmark_report.json", help="Where to write the JSON report")
+    bench_parser.add_argument("--baseline", help="Fail if p50 timings regress against this earlier report")
+    bench_parser.add_argument("--max-regression", type=float, default=0.2,
+                              help="Allowed p50 slowdown against the baseline (0.2 = 20%%)")
+    add_browser_arguments(bench_parser, capture_failures=False)
+    
+    load_parser = subparsers.add_parser("load", help="Load-test the full flow with a ramped number of virtual users")
+    load_parser.add_argument("--users", type=int, default=5, help="Peak number of virtual users (one browser each)")
+    load_parser.add_argument("--ramp-up", type=float, default=30.0, help="Seconds to ramp from one user to the peak")
+    load_parser.add_argument("--steady", type=float, default=60.0, help="Seconds to hold the peak")
+    load_parser.add_argument("--ramp-down", type=float, default=30.0, help="Seconds to ramp back down")
+    load_parser.add_argument("--think-time", default="constant:1",
+                             help="Pause between a user's iterations: SECONDS, constant:S, uniform:MIN-MAX or "
+                                  "exponential:MEAN")
+    load_parser.add_argument("--base-url",
+                             help="Site to load (default: start a local mock site); other than a local site, "
+                                  "needs --session-file")
+    load_parser.add_argument("--session-file",
+                             help="Logged-in session every iteration starts from, so no user requests an OTP")
+    load_parser.add_argument("--restaurant", default="Chandrika Grand", help="Restaurant to order from")
+    load_parser.add_argument("--item", help="Menu item to add (default: first item)")
+    load_parser.add_argument("--page-latency", type=float, default=0.0, help="Mock site: seconds added to every page load")
+    load_parser.add_argument("--api-latency", type=float, default=0.0, help="Mock site: seconds added to every API call")
+    load_parser.add_argument("--render-delay", type=int, default=0,
+                             help="Mock site: milliseconds before fetched content renders")
+    load_parser.add_argument("--report", default="load_report.json", help="Where to write the JSON report")
+    load_parser.add_argument("--csv", default="load_report.csv", help="Where to write per-step statistics as CSV")
+    add_browser_arguments(load_parser, capture_failures=False)
+    
+    trace_parser = subparsers.add_parser("trace-summary", help="Show p50/p95 timings from recorded spans")
+    trace_parser.add_argument("files", nargs="*", default=[f"traces/{SPANS_FILE}"], help="Span JSON-lines files")
+    trace_parser.add_argument("--category", default="step",
+                              choices=["run", "step", "attempt", "locator", "click", "wait", "api", "capture"],
+                              help="Which kind of span to summarize")
+    
+    stats_parser = subparsers.add_parser("locator-stats", help="Show per-step locator hit rates and match times")
+    stats_parser.add_argument("--file", default=LOCATOR_STATS_FILE, help="Locator statistics file")
+    stats_parser.add_argument("--step", help="Only show lookups in this workflow step (e.g. add_item) or one 'step/label'")
+    
+    cache_parser = subparsers.add_parser("cache-stats", help="Show restaurant cache entries and hit rates")
+    cache_parser.add_argument("--file", default=RESTAURANT_CACHE_FILE, help="Restaurant cache file")
+    
+    profile_parser = subparsers.add_parser("profile-summary", help="Show a per-step network/performance profile")
+    profile_parser.add_argument("file", help="profile-<run id>.json written with --profile-dir")
+    
+    replay_parser = subparsers.add_parser("replay-stats", help="Show the recorded flow and how often it replayed")
+    replay_parser.add_argument("--file", default=REPLAY_FILE, help="Replay recording file")
+    
+    timeouts_parser = subparsers.add_parser("timeout-stats", help="Show learned wait timeouts per step")
+    timeouts_parser.add_argument("--file", default=TIMEOUTS_FILE, help="Learned timeouts file")
+    
+    failures_parser = subparsers.add_parser("failures", help="List captured failure artifacts, newest first")
+    failures_parser.add_argument("--dir", default=ARTIFACTS_DIR, help="Failure artifact directory")
+    
+    args = parser.parse_args()
+    if args.resume_from:
+        step_ids = workflow_step_ids(args.api)
+        if args.resume_from not in step_ids:
+            mode = "with --api" if args.api else "without --api"
+            parser.error(f"argument --resume-from: '{args.resume_from}' is not a step {mode} "
+                         f"(choose from {', '.join(step_ids)})")
+        has_checkpoint = args.checkpoint_file and CheckpointStore(args.checkpoint_file).load()
+        if step_ids.index(args.resume_from) and not has_checkpoint:
+            parser.error(f"argument --resume-from: no checkpoint in {args.checkpoint_file or '(no checkpoint file)'} "
+                         f"to resume from; run the workflow from the start")
+    return args
+
+
+def main():
+    """Main execution function"""
+    args = parse_args()
+    configure_logging(
+        log_file=args.log_file,
+        max_bytes=int(args.log_max_mb * 1024 * 1024),
+        backup_count=args.log_backups,
+        rotate_when=args.log_rotate_when,
+        debug_sample_rate=args.debug_sample_rate if args.debug else 0.0
+    )
+    
+    if args.command == "locator-stats":
+        print(LocatorStore(args.file).format_stats(args.step))
+        return
+    
+    if args.command == "cache-stats":
+        print(RestaurantCache(args.file).format_stats())
+        return
+    
+    if args.command == "profile-summary":
+        with open(args.file, encoding="utf-8") as f:
+            print(format_profile(json.load(f)["steps"]))
+        return
+    
+    if args.command == "replay-stats":
+        print(ReplayStore(args.file).format_stats())
+        return
+    
+    if args.command == "timeout-stats":
+        print(TimeoutStore(args.file).format_stats())
+        return
+    
+    if args.command == "failures":
+        print(format_artifacts(args.dir))
+        return
+    
+    if args.command == "trace-summary":
+        print(format_summary(summarize(load_spans(args.files), args.category)))
+        return
+    
+    if args.command == "bench":
+        import benchmark
+        report = benchmark.run_benchmark(
+            iterations=args.iterations,
+            restaurant=args.restaurant,
+            item=args.item,
+            page_latency=args.page_latency,
+            api_latency=args.api_latency,
+            render_delay_ms=args.render_delay,
+            browser_options=browser_options(args)
+        )
+        benchmark.save_report(report, args.report)
+        print(benchmark.format_report(report))
+        if args.baseline:
+            regressions = benchmark.check_regression(report, args.baseline, args.max_regression)
+            for regression in regressions:
+                print(f"❌ Regression: {regression}")
+            if regressions:
+                sys.exit(1)
+            print("✅ No performance regression against baseline")
+        return
+    
+    if args.command == "load":
+        import load_test
+        try:
+            report = load_test.run_load_test(
+                load_test.LoadProfile(args.users, args.ramp_up, args.steady, args.ramp_down),
+                think_time=args.think_time,
+                base_url=args.base_url,
+                restaurant=args.restaurant,
+                item=args.item,
+                page_latency=args.page_latency,
+                api_latency=args.api_latency,
+                render_delay_ms=args.render_delay,
+                browser_options=browser_options(args),
+                session_file=args.session_file
+            )
+        except ValueError as e:
+            sys.exit(f"❌ {e}")
+        load_test.save_report(report, args.report, args.csv)
+        print(load_test.format_report(report))
+        return
+    
+    if args.command == "daemon":
+        import daemon
+        automation_daemon = daemon.AutomationDaemon(
+            workers=args.workers,
+            retries=args.retries,
+            headless=not args.show_browser,
+            sessions_dir=args.sessions_dir,
+            restaurant_cache_file=args.restaurant_cache,
+            recycle_after_jobs=args.recycle_after,
+            recycle_memory_growth_mb=args.recycle_memory_mb,
+            browser_options=browser_options(args)
+        )
+        daemon.serve(automation_daemon, port=args.port, socket_path=args.socket)
+        return
+    
+    if args.command == "batch":
+        import batch_runner
+        report = batch_runner.run_batch(
+            batch_runner.load_jobs(args.jobs),
+            concurrency=args.workers,
+            retries=args.retries,
+            headless=not args.show_browser,
+            sessions_dir=args.sessions_dir,
+            restaurant_cache_file=args.restaurant_cache,
+            browser_options=browser_options(args)
+        )
+        batch_runner.save_report(report, args.report)
+        print(batch_runner.format_report(report))
+        return
+    
+    # Configuration
+    PHONE_NUMBER = "9XXXXXXXXX"  # Change this to your phone number
+    RESTAURANT_NAME = "Chandrika Grand"  # Change this to your preferred restaurant
+    
+    if args.command == "compare":
+        import comparison
+        automation = SwiggyAutomation(
+            phone_number=PHONE_NUMBER,
+            session_file=args.session_file,
+            checkpoint_file=None,
+            restaurant_cache=RestaurantCache(args.restaurant_cache) if args.restaurant_cache else None,
+            **browser_options(args)
+        )
+        try:
+            records = comparison.run_comparison(automation, args.restaurants, args.compare_item)
+            print(comparison.format_comparison(records, args.compare_item))
+            if args.report:
+                comparison.save_report(records, args.report)
+        except Exception as e:
+            logging.error(f"Comparison failed: {e}")
+        finally:
+            automation.quit()
+        return
+    
+    automation = SwiggyAutomation(
+        phone_number=PHONE_NUMBER,
+        session_file=args.session_file,
+        user_data_dir=args.user_data_dir,
+        checkpoint_file=args.checkpoint_file,
+        step_retries=args.step_retries,
+        restaurant_cache=RestaurantCache(args.restaurant_cache) if args.restaurant_cache else None,
+        **browser_options(args)
+    )
+    
+    resume_from = args.resume_from
+    if args.resume and not resume_from and args.checkpoint_file:
+        # API mode has fewer steps, so ask this run's workflow which one comes next
+        resume_from = CheckpointStore(args.checkpoint_file).next_step(workflow_step_ids(args.api))
+        if resume_from is None:
+            logging.info("No checkpoint to resume from, starting from the beginning")
+    
+    try:
+        success = automation.run_automation(restaurant_name=RESTAURANT_NAME, resume_from=resume_from,
+                                            items=args.items or None)
+        if success:
+            print("✅ Automation completed successfully!")
+        else:
+            print("❌ Automation failed. Check logs for details.")
+    
+    except KeyboardInterrupt:
+        logging.info("Automation interrupted by user")
+    except Exception as e:
+        logging.error(f"Unexpected error: {e}")
+    finally:
+        # Keep browser open for manual review
+        input("Press Enter to close the browser...")
+        automation.cleanup()
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,41 @@
+import pytest
+
+from locator_store import LocatorStore
+from swiggy_automation import DEFAULT_WAIT_TIMEOUTS, SwiggyAutomation
+from timeout_store import TimeoutStore
+from tracing import Tracer
+
+
+class FakePage:
+    """Stands in for the WebDriver: answers locator races from a {locator: fingerprint} map"""
+
+    def __init__(self, elements=None):
+        self.elements = dict(elements or {})
+        self.races = 0
+
+    def execute_script(self, script, locators=None, condition=None):
+        self.races += 1
+        for index, locator in enumerate(locators or []):
+            fingerprint = self.elements.get(tuple(locator))
+            if fingerprint is not None:
+                return {"index": index, "element": f"element:{locator[1]}", "fingerprint": fingerprint}
+        return None
+
+
+@pytest.fixture
+def automation(tmp_path):
+    """A SwiggyAutomation without a browser, with its stores in tmp_path; tests attach a fake driver"""
+    automation = SwiggyAutomation.__new__(SwiggyAutomation)
+    automation.driver = FakePage()
+    automation.wait_timeouts = dict(DEFAULT_WAIT_TIMEOUTS)
+    automation.timeout_store = TimeoutStore(str(tmp_path / "learned_timeouts.json"))
+    automation.adaptive_timeouts = True
+    automation.current_step = None
+    automation.reported_timeouts = set()
+    automation.locator_store = LocatorStore(str(tmp_path / "locator_stats.json"))
+    automation.tracer = Tracer()
+    automation.replay_store = None
+    automation.replay = False
+    automation.recording = {}
+    automation.artifacts = None
+    return automation
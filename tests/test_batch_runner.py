@@ -0,0 +1,111 @@
+import os
+
+import pytest
+
+import batch_runner
+from batch_runner import MEMORY_PER_BROWSER_MB, default_concurrency, load_jobs, parse_items, run_job
+
+
+def test_csv_items_column_is_split_into_entries(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("account,restaurant,item,items\n"
+                    "9000000001,Chandrika Grand,,Masala Dosa:2;Filter Coffee\n"
+                    "9000000002,Meghana Foods,Chicken Biryani,\n", encoding="utf-8")
+    jobs = load_jobs(str(path))
+    assert jobs[0]["items"] == [("Masala Dosa", 2), ("Filter Coffee", 1)]
+    assert jobs[1]["item"] == "Chicken Biryani" and jobs[1]["items"] is None
+
+
+def test_jsonl_jobs_skip_comments_and_need_a_restaurant(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_text('# morning orders\n'
+                    '{"account": 9000000001, "restaurant": " Meghana Foods ", "items": ["Veg Biryani:2"]}\n'
+                    '\n', encoding="utf-8")
+    jobs = load_jobs(str(path))
+    assert [(job["job_id"], job["restaurant"], job["items"]) for job in jobs] == [(1, "Meghana Foods", [("Veg Biryani", 2)])]
+
+    path.write_text('{"account": "9000000001"}\n', encoding="utf-8")
+    with pytest.raises(ValueError, match="needs at least"):
+        load_jobs(str(path))
+
+
+def test_items_accept_lists_and_strings_but_nothing_else():
+    assert parse_items(["Masala Dosa:2", ["Filter Coffee", 3]]) == [("Masala Dosa", 2), ("Filter Coffee", 3)]
+    assert parse_items("Masala Dosa:2") == [("Masala Dosa", 2)]
+    with pytest.raises(ValueError):
+        parse_items({"Masala Dosa": 2})
+
+
+class FakeAutomation:
+    def __init__(self, outcome, alive=True):
+        self.outcome = outcome
+        self.alive = alive
+        self.sessions = []
+
+    def start_new_session(self, account, session_file):
+        self.sessions.append(session_file)
+
+    def run_automation(self, **kwargs):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def is_alive(self):
+        return self.alive
+
+
+class FakePool:
+    """Hands out the given browsers in turn; discard() moves on to the next one"""
+
+    def __init__(self, *browsers):
+        self.browsers = list(browsers)
+        self.discarded = []
+
+    def get(self):
+        return self.browsers[0]
+
+    def discard(self):
+        self.discarded.append(self.browsers.pop(0))
+
+
+JOB = {"job_id": 1, "account": "9000000001", "restaurant": "Chandrika Grand", "item": None, "items": None}
+
+
+def test_crashed_browser_is_discarded_and_the_job_retried(tmp_path):
+    crashed = FakeAutomation(RuntimeError("chrome not reachable"))
+    dead = FakeAutomation(False, alive=False)
+    healthy = FakeAutomation(True)
+    pool = FakePool(crashed, dead, healthy)
+
+    result = run_job(pool, JOB, retries=2, sessions_dir=str(tmp_path))
+
+    assert result["success"] and result["attempts"] == 3 and result["error"] is None
+    assert pool.discarded == [crashed, dead]
+    assert healthy.sessions == [os.path.join(str(tmp_path), "9000000001.json")]
+
+
+def test_failed_step_on_a_live_browser_is_not_retried(tmp_path):
+    browser = FakeAutomation(False)
+    pool = FakePool(browser)
+
+    result = run_job(pool, JOB, retries=2, sessions_dir=str(tmp_path))
+
+    assert not result["success"] and result["attempts"] == 1
+    assert result["error"] == "automation step failed"
+    assert pool.discarded == []
+
+
+def test_retries_stop_after_the_limit(tmp_path):
+    pool = FakePool(*[FakeAutomation(RuntimeError("crash")) for _ in range(3)])
+    result = run_job(pool, JOB, retries=1, sessions_dir=str(tmp_path))
+    assert not result["success"] and result["attempts"] == 2 and result["error"] == "crash"
+
+
+def test_default_concurrency_is_bounded_by_memory(monkeypatch):
+    monkeypatch.setattr(batch_runner.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(batch_runner, "available_memory_mb", lambda: 3 * MEMORY_PER_BROWSER_MB + 10)
+    assert default_concurrency() == 3
+    monkeypatch.setattr(batch_runner, "available_memory_mb", lambda: 100)
+    assert default_concurrency() == 1
+    monkeypatch.setattr(batch_runner, "available_memory_mb", lambda: None)
+    assert default_concurrency() == 8
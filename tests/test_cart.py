@@ -0,0 +1,58 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from locator_store import LocatorStore
+from mock_swiggy import MockSwiggyServer
+from swiggy_automation import StepAborted, SwiggyAutomation
+from timeout_store import TimeoutStore
+
+
+def test_aborted_step_is_not_retried(automation):
+    automation.step_retries = 2
+    automation.driver.current_url = "http://127.0.0.1/"
+    calls = []
+
+    def add_items():
+        calls.append(1)
+        raise StepAborted("not on the menu: Idli")
+
+    assert automation.run_step("add_item", "Adding items to cart", add_items, None) is False
+    assert calls == [1]
+
+
+@pytest.fixture
+def menu_browser(tmp_path):
+    """A headless browser on the mock Chandrika Grand menu; skipped where Chrome cannot start"""
+    server = MockSwiggyServer()
+    base_url = server.start()
+    try:
+        automation = SwiggyAutomation(headless=True, session_file=None, checkpoint_file=None, base_url=base_url,
+                                      locator_store=LocatorStore(str(tmp_path / "locator_stats.json")),
+                                      timeout_store=TimeoutStore(str(tmp_path / "learned_timeouts.json")),
+                                      artifact_dir=None)
+    except WebDriverException as e:
+        server.stop()
+        pytest.skip(f"Chrome is not available: {e}")
+    try:
+        automation.driver.get(f"{base_url}/restaurants/chandrika-grand-10001")
+        yield automation
+    finally:
+        automation.quit()
+        server.stop()
+
+
+def cart_quantities(automation):
+    cart = automation.driver.execute_script("return JSON.parse(localStorage.getItem('mockCart') || '{}');")
+    return {entry["name"]: entry["quantity"] for entry in cart.values()}
+
+
+def test_repeated_batch_add_tops_up_instead_of_adding_again(menu_browser):
+    assert menu_browser.add_items_to_cart([("Masala Dosa", 2)])
+    assert menu_browser.add_items_to_cart([("Masala Dosa", 2), ("Filter Coffee", 1)])
+    assert cart_quantities(menu_browser) == {"Masala Dosa": 2, "Filter Coffee": 1}
+
+
+def test_missing_item_aborts_after_adding_the_rest_once(menu_browser):
+    with pytest.raises(StepAborted):
+        menu_browser.add_items_to_cart([("Masala Dosa", 2), ("Unicorn Curry", 1)])
+    assert cart_quantities(menu_browser) == {"Masala Dosa": 2}
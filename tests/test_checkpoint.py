@@ -0,0 +1,98 @@
+import sys
+
+import pytest
+
+import swiggy_automation
+from checkpoint import CheckpointStore
+from swiggy_automation import parse_args, workflow_step_ids
+
+
+@pytest.mark.parametrize("api_mode", [False, True])
+def test_step_ids_match_the_workflow(automation, api_mode):
+    automation.api_mode = api_mode
+    steps = automation.workflow_steps("Chandrika Grand", None)
+    assert [step_id for step_id, _, _ in steps] == workflow_step_ids(api_mode)
+
+
+def run_args(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["swiggy_automation.py", "run", *argv])
+    return parse_args()
+
+
+@pytest.fixture
+def checkpoint_file(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+    CheckpointStore(path).start("Chandrika Grand", None)
+    return path
+
+
+def test_resume_from_search_step_rejected_in_api_mode(monkeypatch, checkpoint_file, capsys):
+    assert run_args(monkeypatch, "--resume-from", "search", "--checkpoint-file", checkpoint_file).resume_from == "search"
+    with pytest.raises(SystemExit):
+        run_args(monkeypatch, "--api", "--resume-from", "search", "--checkpoint-file", checkpoint_file)
+    assert "not a step with --api" in capsys.readouterr().err
+
+
+def test_resume_from_needs_a_checkpoint(monkeypatch, tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        run_args(monkeypatch, "--resume-from", "add_item", "--checkpoint-file", str(tmp_path / "missing.json"))
+    assert "no checkpoint" in capsys.readouterr().err
+    # The first step needs nothing to resume from
+    assert run_args(monkeypatch, "--resume-from", "open", "--checkpoint-file", str(tmp_path / "missing.json"))
+
+
+def test_run_automation_refuses_to_resume_without_checkpoint(automation):
+    automation.api_mode = False
+    automation.checkpoint_store = None
+    with pytest.raises(ValueError, match="No checkpoint"):
+        automation.run_automation(resume_from="select")
+
+
+class RecordingDriver:
+    def __init__(self, url):
+        self.current_url = url
+        self.visited = []
+        self.cookies = []
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie["name"])
+
+    def execute_script(self, script, *args):
+        return "complete"
+
+
+def test_checkpoint_session_applied_even_on_the_site(automation, monkeypatch):
+    automation.base_url = "http://127.0.0.1:8000"
+    # A session file was already restored on robots.txt
+    automation.driver = RecordingDriver("http://127.0.0.1:8000/robots.txt")
+    monkeypatch.setattr(automation, "wait_for_page_settled", lambda: True, raising=False)
+    checkpoint = {
+        "session": {"cookies": [{"name": "_session_tid", "value": "abc"}], "local_storage": {}},
+        "urls": {"select": "http://127.0.0.1:8000/restaurants/chandrika-grand-10001"},
+    }
+    automation.resume_checkpoint(checkpoint, "add_item", swiggy_automation.WORKFLOW_STEP_IDS)
+    assert automation.driver.cookies == ["_session_tid"]
+    assert automation.driver.visited[-1] == checkpoint["urls"]["select"]
+
+
+def test_resume_after_a_session_skipped_run_continues_at_the_failed_step(automation, monkeypatch, tmp_path):
+    automation.driver = RecordingDriver("http://127.0.0.1:8000/")
+    automation.checkpoint_store = CheckpointStore(str(tmp_path / "checkpoint.json"))
+    automation.restaurant_cache = None
+    automation.profiler = None
+    automation.session_store = None
+    automation.session_restored = True
+    automation.trace_dir = None
+    automation.step_retries = 0
+    step_ids = swiggy_automation.WORKFLOW_STEP_IDS
+    # Every step succeeds except add_item; login and location are skipped for the restored session
+    steps = [(step_id, step_id, lambda step_id=step_id: step_id != "add_item") for step_id in step_ids]
+    monkeypatch.setattr(automation, "workflow_steps", lambda *args: steps)
+    monkeypatch.setattr(automation, "is_logged_in", lambda: True)
+
+    assert automation.run_automation() is False
+    assert automation.checkpoint_store.next_step(step_ids) == "add_item"
@@ -0,0 +1,68 @@
+from selenium.common.exceptions import NoSuchWindowException
+
+from comparison import rank_restaurants
+from restaurant_cache import RestaurantCache
+from swiggy_automation import USER_LOCATION_JS
+
+
+class FakeTabs:
+    """Stands in for the WebDriver across tabs; switching to a handle in `gone` fails like a crashed tab"""
+
+    def __init__(self, gone=(), statuses=None):
+        self.statuses = dict(statuses or {})
+        self.current_window_handle = "main"
+        self.handles = ["main"]
+        self.gone = set(gone)
+        self.closed = []
+        self.switch_to = self
+
+    def new_window(self, kind):
+        handle = f"tab-{len(self.handles)}"
+        self.handles.append(handle)
+        self.current_window_handle = handle
+
+    def window(self, handle):
+        if handle in self.gone:
+            raise NoSuchWindowException(f"no such window: {handle}")
+        self.current_window_handle = handle
+
+    def close(self):
+        self.closed.append(self.current_window_handle)
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.location.href") or script == USER_LOCATION_JS:
+            return None
+        return {"status": self.statuses.get(self.current_window_handle, "ready"), "name": self.current_window_handle, "rating": "4.0", "eta": "30-35 mins",
+                "items": [], "item": None}
+
+
+def test_closed_tab_is_unavailable_and_others_are_compared(automation, monkeypatch):
+    automation.driver = FakeTabs(gone={"tab-2"})
+    automation.restaurant_cache = None
+    monkeypatch.setattr(automation, "resolve_restaurant_url", lambda name: f"http://127.0.0.1/menu/{name}")
+    monkeypatch.setattr(automation, "apply_resource_policy", lambda: None)
+
+    records = automation.compare_restaurants(["A", "B", "C"])
+
+    assert [record["status"] for record in records] == ["ready", "unavailable", "ready"]
+    assert automation.driver.closed == ["tab-1", "tab-3"]
+    assert automation.driver.current_window_handle == "main"
+    ranked = rank_restaurants(records)
+    assert [record["rank"] for record in ranked] == [1, 2, None]
+
+
+def test_cached_url_that_is_not_found_is_evicted(automation, monkeypatch, tmp_path):
+    cache = RestaurantCache(str(tmp_path / "cache.json"))
+    cache.put(None, "A", "http://127.0.0.1/menu/a")
+    cache.put(None, "B", "http://127.0.0.1/menu/b-moved")
+    automation.restaurant_cache = cache
+    automation.driver = FakeTabs(statuses={"tab-2": "not_found"})
+    monkeypatch.setattr(automation, "resolve_restaurant_url", lambda name: cache.get(None, name)["url"])
+    monkeypatch.setattr(automation, "apply_resource_policy", lambda: None)
+
+    records = automation.compare_restaurants(["A", "B"])
+
+    assert [record["status"] for record in records] == ["ready", "not_found"]
+    assert cache.get(None, "B") is None
+    assert cache.get(None, "A")["restaurant"]["name"] == "tab-1"
+    assert cache.stats["invalidations"] == 1
@@ -0,0 +1,23 @@
+import threading
+
+from daemon import AutomationDaemon, MAX_QUEUED_JOBS
+
+
+def test_stop_with_a_full_queue_cancels_queued_jobs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    daemon = AutomationDaemon(workers=1, sessions_dir=str(tmp_path / "sessions"))
+    # The worker is busy warming up its browser until released
+    released = threading.Event()
+    monkeypatch.setattr(daemon, "warm_up", lambda: released.wait() and object())
+    daemon.start()
+    records = [daemon.submit({"account": "9000000000", "restaurant": "Chandrika Grand"})
+               for _ in range(MAX_QUEUED_JOBS)]
+
+    stopper = threading.Thread(target=daemon.stop)
+    stopper.start()
+    released.set()
+    stopper.join(timeout=5)
+
+    assert not stopper.is_alive()
+    assert all(record["status"] == "cancelled" and record["done"].is_set() for record in records)
+    assert daemon.browsers["browser-1"]["state"] == "stopped"
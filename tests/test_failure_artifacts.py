@@ -0,0 +1,104 @@
+import base64
+import json
+import os
+import time
+import zipfile
+
+import failure_artifacts
+import swiggy_automation
+from failure_artifacts import FailureArtifacts, format_artifacts
+
+
+class FakeBrowser:
+    current_url = "http://127.0.0.1/restaurants/chandrika-grand-10001"
+    title = "Menu | Swiggy"
+    page_source = "<html><body>" + "menu " * 2000 + "</body></html>"
+
+    def __init__(self, screenshot_bytes=1000):
+        self.screenshot = base64.b64encode(os.urandom(screenshot_bytes)).decode()
+
+    def get_screenshot_as_base64(self):
+        return self.screenshot
+
+    def get_log(self, kind):
+        return [{"level": "SEVERE", "message": "menu.js: boom"}]
+
+
+def archives(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_capture_is_written_as_one_compressed_zip(tmp_path):
+    artifacts = FailureArtifacts(str(tmp_path))
+    browser = FakeBrowser()
+    assert artifacts.capture(browser, "step: Adding item", "add_item", "run1")
+    artifacts.flush()
+    [name] = archives(tmp_path)
+    assert name.endswith("-run1-add-item-1.zip")
+    with zipfile.ZipFile(tmp_path / name) as archive:
+        meta = json.loads(archive.read("meta.json"))
+        assert meta["url"] == FakeBrowser.current_url and meta["reason"] == "step: Adding item"
+        assert archive.read("screenshot.png") == base64.b64decode(browser.screenshot)
+        assert json.loads(archive.read("console.json"))[0]["message"] == "menu.js: boom"
+        dom = archive.getinfo("dom.html")
+        assert dom.compress_size < dom.file_size / 10
+    assert "step: Adding item" in format_artifacts(str(tmp_path))
+
+
+def test_unreadable_parts_are_noted_not_fatal(tmp_path):
+    class DeadBrowser(FakeBrowser):
+        def get_screenshot_as_base64(self):
+            raise RuntimeError("tab crashed")
+
+    artifacts = FailureArtifacts(str(tmp_path))
+    artifacts.capture(DeadBrowser(), "step: Opening Swiggy", "open", "run1")
+    artifacts.flush()
+    with zipfile.ZipFile(tmp_path / archives(tmp_path)[0]) as archive:
+        assert "screenshot.png" not in archive.namelist()
+        assert json.loads(archive.read("meta.json"))["errors"] == {"screenshot": "tab crashed"}
+
+
+def test_retention_by_count_keeps_newest(tmp_path):
+    artifacts = FailureArtifacts(str(tmp_path), max_count=3)
+    for index in range(6):
+        artifacts.capture(FakeBrowser(), f"step: {index}", "select", f"run{index}")
+        artifacts.flush()
+        # Distinct modification times, so "newest" is well defined
+        time.sleep(0.01)
+    assert [name.split("-")[2] for name in archives(tmp_path)] == ["run3", "run4", "run5"]
+
+
+def test_retention_by_size_always_keeps_newest(tmp_path):
+    artifacts = FailureArtifacts(str(tmp_path), max_count=50, max_mb=0.25)
+    for index in range(4):
+        artifacts.capture(FakeBrowser(screenshot_bytes=100_000), f"step: {index}", "select", f"run{index}")
+        artifacts.flush()
+        time.sleep(0.01)
+    assert [name.split("-")[2] for name in archives(tmp_path)] == ["run2", "run3"]
+
+    artifacts.max_bytes = 1
+    artifacts.capture(FakeBrowser(screenshot_bytes=100_000), "step: 4", "select", "run4")
+    artifacts.flush()
+    assert [name.split("-")[2] for name in archives(tmp_path)] == ["run4"]
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path, monkeypatch):
+    artifacts = FailureArtifacts(str(tmp_path))
+    monkeypatch.setattr(artifacts, "write", lambda capture: time.sleep(0.3))
+    start = time.perf_counter()
+    results = [artifacts.capture(FakeBrowser(), "step", "open", "run") for _ in range(
+        failure_artifacts.ARTIFACT_QUEUE_SIZE + 5)]
+    assert time.perf_counter() - start < 0.3
+    assert results.count(False) >= 4
+
+
+def test_only_a_step_that_exhausted_its_retries_is_captured(automation, monkeypatch):
+    captured = []
+    monkeypatch.setattr(swiggy_automation, "STEP_RETRY_BACKOFF", 0)
+    automation.step_retries = 2
+    automation.capture_failure = captured.append
+    outcomes = iter([False, True])
+    assert automation.run_step("add_item", "Adding item", lambda: next(outcomes), None)
+    assert captured == []
+    assert not automation.run_step("add_item", "Adding item", lambda: False, None)
+    assert captured == ["step: Adding item"]
@@ -0,0 +1,105 @@
+import csv
+import random
+
+import pytest
+
+import load_test
+from benchmark import timing_stats
+from load_test import LoadProfile, check_target, load_stats, parse_think_time
+from tracing import Tracer
+
+
+def test_profile_ramps_up_holds_and_ramps_down():
+    profile = LoadProfile(4, ramp_up=4, steady=2, ramp_down=4)
+    assert profile.duration == 10
+    assert [profile.users_at(t) for t in (0, 1, 2, 3, 3.9)] == [1, 2, 3, 4, 4]
+    assert [profile.users_at(t) for t in (4, 5.9)] == [4, 4]
+    assert [profile.users_at(t) for t in (6, 7, 8, 9, 9.9)] == [4, 3, 2, 1, 1]
+    assert profile.users_at(10) == 0
+    with pytest.raises(ValueError):
+        LoadProfile(0)
+
+
+def test_think_time_models():
+    assert parse_think_time("2")() == 2.0
+    assert parse_think_time("constant:0.5")() == 0.5
+    random.seed(1)
+    assert all(1 <= parse_think_time("uniform:1-3")() <= 3 for _ in range(100))
+    samples = [parse_think_time("exponential:2")() for _ in range(5000)]
+    assert sum(samples) / len(samples) == pytest.approx(2, rel=0.1)
+    for spec in ("gauss:1", "uniform:a-b", "exponential:"):
+        with pytest.raises(ValueError):
+            parse_think_time(spec)
+
+
+def test_latency_percentiles_and_error_rate():
+    durations = [float(value) for value in range(1, 101)]
+    stats = load_stats(durations, attempts=125)
+    assert (stats["p50"], stats["p95"], stats["p99"]) == (50.5, 95.05, 99.01)
+    assert stats["errors"] == 25 and stats["error_rate"] == 0.2
+    assert load_stats([], 0)["error_rate"] is None
+    assert timing_stats([]) == {"count": 0, "mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+
+
+def test_only_local_sites_without_a_session():
+    check_target(None)
+    check_target("http://127.0.0.1:8000")
+    check_target("http://localhost:8000/")
+    check_target("https://www.swiggy.com", session_file="swiggy_session.json")
+    with pytest.raises(ValueError, match="not a local mock site"):
+        check_target("https://www.swiggy.com")
+
+
+class FakeUser:
+    """One virtual user's automation: the open step always passes, the search step fails every third run"""
+
+    instances = []
+
+    def __init__(self, phone_number, base_url, replay_store=None, session_file=None, **kwargs):
+        self.phone_number = phone_number
+        self.replay_store = replay_store
+        self.tracer = Tracer()
+        self.sessions = []
+        self.runs = 0
+        FakeUser.instances.append(self)
+
+    def start_new_session(self, phone_number, session_file=None):
+        self.sessions.append(session_file)
+        self.tracer.reset()
+
+    def run_automation(self, restaurant_name, item_name):
+        self.runs += 1
+        with self.tracer.span("Opening Swiggy", "step"):
+            pass
+        with self.tracer.span("Searching restaurant", "step") as span:
+            span.ok = self.runs % 3 != 0
+        return span.ok
+
+    def quit(self):
+        pass
+
+
+def test_load_run_shares_stores_and_reports_per_step(monkeypatch, tmp_path):
+    FakeUser.instances = []
+    monkeypatch.setattr(load_test, "SwiggyAutomation", FakeUser)
+    monkeypatch.setattr(load_test, "CONTROL_INTERVAL", 0.05)
+    report = load_test.run_load_test(
+        LoadProfile(3, ramp_up=0.3, steady=0.4, ramp_down=0.3), think_time="0.02", base_url="http://127.0.0.1:9",
+        browser_options={"replay_file": str(tmp_path / "replay.json"), "replay": True},
+        session_file="swiggy_session.json"
+    )
+    assert len(FakeUser.instances) == 3 == report["users_started"]
+    assert len({id(user.replay_store) for user in FakeUser.instances}) == 1
+    assert all(set(user.sessions) == {"swiggy_session.json"} for user in FakeUser.instances)
+
+    assert report["iterations"] == sum(user.runs for user in FakeUser.instances)
+    search = report["steps"]["Searching restaurant"]
+    assert search["count"] + search["errors"] == report["iterations"]
+    assert report["steps"]["Opening Swiggy"]["errors"] == 0
+    assert report["failures"] == search["errors"] == report["end_to_end"]["errors"]
+
+    load_test.save_report(report, str(tmp_path / "load.json"), str(tmp_path / "load.csv"))
+    with open(tmp_path / "load.csv", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["name"] for row in rows] == ["Opening Swiggy", "Searching restaurant", "end_to_end"]
+    assert "iterations succeeded" in load_test.format_report(report)
@@ -0,0 +1,80 @@
+import pytest
+
+from locator_store import STALE_AFTER_MISSES, LocatorStore
+
+TESTID = ("css selector", "[data-testid='add']")
+XPATH = ("xpath", "//button[text()='ADD']")
+CLASS = ("css selector", ".add-btn")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocatorStore(str(tmp_path / "locator_stats.json"))
+
+
+def stats(store, key, locator):
+    return store.steps[key][f"{locator[0]}={locator[1]}"]
+
+
+def test_unproven_locators_keep_their_order(store):
+    assert store.rank("add_item/add button", [TESTID, XPATH, CLASS]) == [TESTID, XPATH, CLASS]
+
+
+def test_locators_after_the_winner_are_not_missed(store):
+    for _ in range(STALE_AFTER_MISSES + 2):
+        store.record("add_item/add button", TESTID, 0.3, missed=[])
+    # XPATH would have matched too, but the race never got to it
+    assert "xpath=//button[text()='ADD']" not in store.steps["add_item/add button"]
+
+    store.record("add_item/add button", XPATH, 0.3, missed=[TESTID])
+    assert stats(store, "add_item/add button", TESTID)["misses"] == 1
+    assert stats(store, "add_item/add button", XPATH)["hits"] == 1
+
+
+def test_rank_prefers_hit_rate_over_match_time(store):
+    key = "add_item/add button"
+    for _ in range(4):
+        store.record(key, XPATH, 2.0, missed=[])
+    store.record(key, TESTID, 0.1, missed=[])
+    store.record(key, XPATH, 2.0, missed=[TESTID])
+    assert store.rank(key, [TESTID, XPATH, CLASS]) == [XPATH, TESTID, CLASS]
+
+
+def test_checked_misses_make_a_locator_stale(store):
+    key = "cart/view cart button"
+    store.record(key, TESTID, 0.2)
+    for _ in range(STALE_AFTER_MISSES):
+        store.record(key, XPATH, 0.2, missed=[TESTID])
+    assert store.is_stale(stats(store, key, TESTID))
+    assert store.rank(key, [TESTID, XPATH, CLASS]) == [XPATH, CLASS, TESTID]
+
+    store.record(key, TESTID, 0.2)
+    assert not store.is_stale(stats(store, key, TESTID))
+
+
+def test_failed_lookup_misses_every_checked_locator(store):
+    store.record("login/login button", None, 10.0, missed=[TESTID, XPATH])
+    assert stats(store, "login/login button", TESTID)["misses"] == 1
+    assert stats(store, "login/login button", XPATH)["misses"] == 1
+
+
+def test_stats_are_per_step_and_survive_a_reload(store):
+    store.record("select/restaurant", TESTID, 0.5)
+    store.record("search/restaurant", XPATH, 0.5)
+    store.save()
+    reloaded = LocatorStore(store.path)
+    assert reloaded.rank("select/restaurant", [XPATH, TESTID]) == [TESTID, XPATH]
+    assert reloaded.rank("search/restaurant", [TESTID, XPATH]) == [XPATH, TESTID]
+    table = reloaded.format_stats("select")
+    assert "select/restaurant" in table and "search/restaurant" not in table
+
+
+def test_resolve_records_only_checked_locators(automation):
+    automation.current_step = "add_item"
+    automation.driver.elements = {XPATH: {"tag": "button"}, CLASS: {"tag": "button"}}
+    element, locator = automation.resolve_locators([TESTID, XPATH, CLASS], "add button", timeout=1)
+    assert locator == XPATH
+    key = "add_item/add button"
+    assert stats(automation.locator_store, key, TESTID)["misses"] == 1
+    assert stats(automation.locator_store, key, XPATH)["hits"] == 1
+    assert "css selector=.add-btn" not in automation.locator_store.steps[key]
@@ -0,0 +1,70 @@
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from mock_swiggy import MOCK_RESTAURANTS, MockSwiggyServer
+from swiggy_api import ApiError, SwiggyApiClient
+
+
+@pytest.fixture
+def mock_site():
+    server = MockSwiggyServer(api_latency=0.05)
+    base_url = server.start()
+    yield base_url
+    server.stop()
+
+
+def fetch(url, data=None, cookie=None):
+    request = urllib.request.Request(url, data=json.dumps(data).encode() if data is not None else None)
+    if cookie:
+        request.add_header("Cookie", cookie)
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers, response.read().decode()
+
+
+def test_pages_show_sign_in_until_otp_verified(mock_site):
+    _, home = fetch(f"{mock_site}/")
+    assert 'id="sign-in"' in home and 'id="mobile"' in home
+
+    _, rejected = fetch(f"{mock_site}/dapi/auth/verify-otp", {"otp": "000000"})
+    assert json.loads(rejected) == {"ok": False}
+    headers, accepted = fetch(f"{mock_site}/dapi/auth/verify-otp", {"otp": "123456"})
+    assert json.loads(accepted) == {"ok": True}
+    cookie = headers["Set-Cookie"].split(";")[0]
+
+    _, logged_in = fetch(f"{mock_site}/", cookie=cookie)
+    assert 'id="account"' in logged_in and 'id="sign-in"' not in logged_in
+
+
+def test_menu_page_served_for_known_restaurants_only(mock_site):
+    _, menu = fetch(f"{mock_site}/restaurants/chandrika-grand-10001")
+    assert "Menu | Swiggy" in menu
+    with pytest.raises(urllib.error.HTTPError) as error:
+        fetch(f"{mock_site}/restaurants/nowhere-99999")
+    assert error.value.code == 404
+
+
+def test_api_client_searches_and_fetches_menu(mock_site):
+    client = SwiggyApiClient(mock_site)
+    try:
+        start = time.perf_counter()
+        restaurants = client.search_restaurants("chandrika")
+        assert time.perf_counter() - start >= 0.05
+        assert [r["name"] for r in restaurants] == ["Chandrika Grand", "Chandrika Grand Express"]
+        assert restaurants[0]["url"] == f"{mock_site}/restaurants/chandrika-grand-10001"
+
+        menu = client.fetch_menu(restaurants[0]["id"])
+        assert menu["restaurant"]["name"] == "Chandrika Grand"
+        expected = [item["name"] for item in MOCK_RESTAURANTS[0]["menu"]]
+        assert [item["name"] for item in menu["items"]] == expected
+        assert menu["items"][2]["customizable"]
+
+        with pytest.raises(ApiError) as error:
+            client.fetch_menu("99999")
+        assert error.value.status == 404
+        assert client.requests == 3
+    finally:
+        client.close()
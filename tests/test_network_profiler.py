@@ -0,0 +1,130 @@
+import json
+
+from network_profiler import UNATTRIBUTED_STEP, NetworkProfiler
+
+
+class PerfLogDriver:
+    """Stands in for the WebDriver: serves queued performance-log events, long tasks and page metrics"""
+
+    def __init__(self):
+        self.events = []
+        self.long_tasks = []
+        self.metrics = {}
+
+    def get_log(self, kind):
+        events, self.events = self.events, []
+        return [{"message": json.dumps({"message": {"method": method, "params": params}})}
+                for method, params in events]
+
+    def execute_script(self, script):
+        tasks, self.long_tasks = self.long_tasks, []
+        return tasks
+
+    def execute_cdp_cmd(self, command, params):
+        return {"metrics": [{"name": name, "value": value} for name, value in self.metrics.items()]}
+
+
+def sent(request_id, url, timestamp, kind="XHR", redirect=False):
+    params = {"requestId": request_id, "request": {"url": url, "method": "GET", "headers": {}},
+              "type": kind, "timestamp": timestamp, "wallTime": 1700000000 + timestamp}
+    if redirect:
+        params["redirectResponse"] = {"status": 302}
+    return "Network.requestWillBeSent", params
+
+
+def finished(request_id, timestamp, size):
+    return "Network.loadingFinished", {"requestId": request_id, "timestamp": timestamp, "encodedDataLength": size}
+
+
+def received(request_id, status):
+    return "Network.responseReceived", {"requestId": request_id, "response": {"status": status, "mimeType": "text/html"}}
+
+
+def profiler_with(driver):
+    profiler = NetworkProfiler()
+    profiler.driver = driver
+    return profiler
+
+
+def step_records(profiler):
+    return {record["step"]: record for record in profiler.summary()}
+
+
+def test_requests_are_attributed_to_the_step_they_started_in():
+    driver = PerfLogDriver()
+    profiler = profiler_with(driver)
+    driver.events = [sent("0", "https://www.swiggy.com/", 0.0, "Document")]
+    profiler.start_step("open")
+    # Sent during "open" but finished after it ended: the bytes still belong to "open"
+    driver.events = [sent("1", "https://www.swiggy.com/dapi/menu", 1.0)]
+    profiler.end_step()
+    profiler.start_step("select")
+    driver.events = [finished("1", 1.5, 2048), sent("2", "https://media.swiggy.com/a.png", 2.0, "Image"),
+                     finished("2", 2.1, 1024)]
+    profiler.end_step()
+
+    steps = step_records(profiler)
+    assert steps[UNATTRIBUTED_STEP]["requests"] == 1
+    assert (steps["open"]["requests"], steps["open"]["bytes"]) == (1, 2048)
+    assert steps["open"]["by_type"] == {"XHR": {"requests": 1, "bytes": 2048}}
+    assert (steps["select"]["requests"], steps["select"]["bytes"]) == (1, 1024)
+    assert steps["select"]["top_hosts"] == [("media.swiggy.com", 1024)]
+
+
+def test_blocked_and_failed_requests_are_counted_apart():
+    driver = PerfLogDriver()
+    profiler = profiler_with(driver)
+    profiler.start_step("open")
+    driver.events = [
+        sent("1", "https://www.google-analytics.com/collect", 0.0, "Ping"),
+        ("Network.loadingFailed", {"requestId": "1", "timestamp": 0.1, "blockedReason": "inspector"}),
+        sent("2", "https://www.swiggy.com/dapi/cart", 0.2),
+        ("Network.loadingFailed", {"requestId": "2", "timestamp": 0.3, "errorText": "net::ERR_CONNECTION_RESET"}),
+        # Events of requests sent before profiling started are ignored
+        finished("unknown", 0.4, 999),
+    ]
+    profiler.end_step()
+
+    record = step_records(profiler)["open"]
+    assert (record["requests"], record["blocked"], record["failed"], record["bytes"]) == (2, 1, 1, 0)
+    errors = [entry["_error"] for entry in profiler.har()["log"]["entries"]]
+    assert errors == ["inspector", "net::ERR_CONNECTION_RESET"]
+
+
+def test_redirect_hops_become_separate_har_entries():
+    driver = PerfLogDriver()
+    profiler = profiler_with(driver)
+    profiler.start_step("open")
+    driver.events = [
+        sent("1", "http://swiggy.com/", 0.0, "Document"),
+        sent("1", "https://www.swiggy.com/", 0.2, "Document", redirect=True),
+        received("1", 200),
+        finished("1", 0.5, 4096),
+    ]
+    profiler.end_step()
+
+    entries = profiler.har()["log"]["entries"]
+    assert [entry["request"]["url"] for entry in entries] == ["http://swiggy.com/", "https://www.swiggy.com/"]
+    assert [entry["response"]["status"] for entry in entries] == [0, 200]
+    assert entries[1]["time"] == 300.0 and entries[1]["pageref"] == "open"
+    assert step_records(profiler)["open"]["requests"] == 2
+
+
+def test_slowest_requests_come_first_and_long_tasks_and_metrics_add_up():
+    driver = PerfLogDriver()
+    profiler = profiler_with(driver)
+    driver.metrics = {"ScriptDuration": 0.5}
+    profiler.start_step("search")
+    driver.events = [sent("1", "https://www.swiggy.com/fast", 0.0), finished("1", 0.1, 10),
+                     sent("2", "https://www.swiggy.com/slow", 0.0), finished("2", 0.9, 10),
+                     sent("3", "https://www.swiggy.com/pending", 0.0)]
+    driver.long_tasks = [60.0, 120.0]
+    driver.metrics = {"ScriptDuration": 0.75, "JSHeapUsedSize": 20 * 1024 * 1024}
+    profiler.end_step()
+
+    record = step_records(profiler)["search"]
+    assert [request["url"].rsplit("/", 1)[1] for request in record["slowest"]] == ["slow", "fast"]
+    assert record["slowest"][0]["ms"] == 900.0
+    assert (record["long_tasks"], record["long_task_ms"]) == (2, 180.0)
+    assert record["metrics"]["script_ms"] == 250.0
+    assert record["js_heap_mb"] == 20.0
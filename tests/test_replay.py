@@ -0,0 +1,56 @@
+import pytest
+
+from replay_store import ReplayStore, fingerprint_matches
+
+BUTTON = {"tag": "button", "id": "add", "name": "", "testid": "add-item", "text": "ADD", "classes": "btn"}
+LOCATORS = [("css selector", "[data-testid='add-item']"), ("xpath", "//button[text()='ADD']"), ("id", "add")]
+
+
+def test_fingerprint_matches_tolerates_small_changes():
+    assert fingerprint_matches(BUTTON, dict(BUTTON, classes="btn btn-primary"))
+    assert not fingerprint_matches(BUTTON, dict(BUTTON, id="remove", text="REMOVE"))
+    assert not fingerprint_matches(BUTTON, dict(BUTTON, tag="a"))
+    assert not fingerprint_matches(None, BUTTON)
+
+
+@pytest.fixture
+def replaying(automation, tmp_path):
+    automation.replay_store = ReplayStore(str(tmp_path / "replay.json"))
+    automation.replay_store.commit({"add_item": {"add button": {
+        "locator": list(LOCATORS[2]), "fingerprint": BUTTON, "method": "js"}}})
+    automation.replay = True
+    automation.current_step = "add_item"
+    return automation
+
+
+def replay_counts(automation):
+    entry = automation.replay_store.get("add_item", "add button")
+    return entry["replays"], entry["mismatches"]
+
+
+def test_recorded_locator_leads_the_race(replaying):
+    replaying.driver.elements = {LOCATORS[0]: BUTTON, LOCATORS[2]: BUTTON}
+    element, locator = replaying.resolve_locators(LOCATORS, "add button", timeout=5)
+    assert locator == LOCATORS[2]
+    assert replaying.driver.races == 1
+    assert replay_counts(replaying) == (1, 0)
+    assert [span.category for span in replaying.tracer.spans].count("wait") == 1
+
+
+def test_missing_recorded_element_costs_no_extra_wait(replaying):
+    replaying.driver.elements = {LOCATORS[1]: BUTTON}
+    element, locator = replaying.resolve_locators(LOCATORS, "add button", timeout=5)
+    assert locator == LOCATORS[1]
+    assert replaying.driver.races == 1
+    assert replay_counts(replaying) == (0, 1)
+    # The lookup is timed once, under its usual wait key
+    assert [span.duration < 1 for span in replaying.tracer.spans if span.category == "wait"] == [True]
+
+
+def test_fingerprint_mismatch_prefers_another_locator(replaying):
+    changed = dict(BUTTON, id="remove", text="REMOVE", testid="remove-item")
+    replaying.driver.elements = {LOCATORS[0]: BUTTON, LOCATORS[2]: changed}
+    element, locator = replaying.resolve_locators(LOCATORS, "add button", timeout=5)
+    assert locator == LOCATORS[0]
+    assert replay_counts(replaying) == (0, 1)
+    assert replaying.recording["add_item"]["add button"]["locator"] == list(LOCATORS[0])
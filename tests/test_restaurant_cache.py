@@ -0,0 +1,70 @@
+from restaurant_cache import RestaurantCache
+
+BANGALORE = {"lat": 12.97194, "lng": 77.59369}
+
+
+def test_expired_entry_is_a_miss(tmp_path, monkeypatch):
+    cache = RestaurantCache(str(tmp_path / "cache.json"), ttl=60)
+    monkeypatch.setattr("restaurant_cache.time.time", lambda: 1000.0)
+    cache.put(BANGALORE, "Chandrika Grand", "/menu/chandrika-grand")
+    monkeypatch.setattr("restaurant_cache.time.time", lambda: 1059.0)
+    assert cache.get(BANGALORE, "chandrika  grand")["url"] == "/menu/chandrika-grand"
+    monkeypatch.setattr("restaurant_cache.time.time", lambda: 1061.0)
+    assert cache.get(BANGALORE, "Chandrika Grand") is None
+    assert cache.stats["expired"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = RestaurantCache(str(tmp_path / "cache.json"), max_entries=2)
+    cache.put(BANGALORE, "A2B", "/menu/a2b")
+    cache.put(BANGALORE, "Meghana Foods", "/menu/meghana")
+    # Reading A2B makes Meghana Foods the least recently used
+    cache.get(BANGALORE, "A2B")
+    cache.put(BANGALORE, "Truffles", "/menu/truffles")
+    assert cache.get(BANGALORE, "Meghana Foods") is None
+    assert cache.get(BANGALORE, "A2B") is not None
+    assert cache.get(BANGALORE, "Truffles") is not None
+    assert cache.stats["evictions"] == 1
+
+
+def test_hits_after_reload_are_cold_then_warm(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = RestaurantCache(path)
+    cache.put(BANGALORE, "A2B", "/menu/a2b")
+    cache.save()
+
+    reloaded = RestaurantCache(path)
+    # GPS jitter within ~100 m shares the entry
+    nearby = {"lat": 12.97211, "lng": 77.59352}
+    assert reloaded.get(nearby, "A2B")["url"] == "/menu/a2b"
+    assert reloaded.get(BANGALORE, "A2B") is not None
+    assert (reloaded.stats["cold_hits"], reloaded.stats["warm_hits"]) == (1, 1)
+    assert reloaded.hit_rate() == 1.0
+
+
+def test_lru_order_and_stats_survive_a_reload(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = RestaurantCache(path, max_entries=2)
+    cache.put(BANGALORE, "A2B", "/menu/a2b")
+    cache.put(BANGALORE, "Truffles", "/menu/truffles")
+    cache.get(BANGALORE, "A2B")
+    cache.save()
+
+    reloaded = RestaurantCache(path, max_entries=2)
+    assert reloaded.stats["cold_hits"] == 0 and reloaded.stats["warm_hits"] == 1
+    # Truffles is still the least recently used entry, although it sorts after A2B
+    reloaded.put(BANGALORE, "Meghana Foods", "/menu/meghana")
+    assert reloaded.get(BANGALORE, "Truffles") is None
+    assert reloaded.get(BANGALORE, "A2B") is not None
+
+
+def test_corrupt_file_starts_empty_and_failed_save_stays_dirty(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json", encoding="utf-8")
+    cache = RestaurantCache(str(path))
+    assert not cache.entries
+    cache.put(BANGALORE, "A2B", "/menu/a2b")
+    cache.path = str(tmp_path / "missing-dir" / "cache.json")
+    cache.save()
+    assert cache.dirty
@@ -0,0 +1,64 @@
+import json
+import os
+import stat
+
+import session_store
+from session_store import SESSION_RESTORE_PATH, SessionStore
+
+
+class BrowserStub:
+    """Keeps cookies and localStorage like a browser on one origin"""
+
+    def __init__(self, cookies=(), storage=None):
+        self.cookies = [dict(cookie) for cookie in cookies]
+        self.storage = dict(storage or {})
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self.cookies]
+
+    def add_cookie(self, cookie):
+        if not isinstance(cookie.get("expiry", 0), int):
+            raise ValueError("invalid expiry")
+        self.cookies.append(dict(cookie))
+
+    def execute_script(self, script, *args):
+        if args:
+            self.storage.update(args[0])
+            return None
+        return dict(self.storage)
+
+
+COOKIES = [{"name": "_session_tid", "value": "abc", "expiry": 1900000000.5}, {"name": "userLocation", "value": "x"}]
+
+
+def test_session_round_trips_through_a_private_file(tmp_path):
+    path = str(tmp_path / "session.json")
+    store = SessionStore(path)
+    assert store.save(BrowserStub(COOKIES, {"userLocation": '{"lat": 12.97}'}))
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+    browser = BrowserStub()
+    assert store.restore(browser, "http://127.0.0.1:8000/")
+    assert browser.visited == [f"http://127.0.0.1:8000{SESSION_RESTORE_PATH}"]
+    assert [cookie["name"] for cookie in browser.cookies] == ["_session_tid", "userLocation"]
+    assert browser.cookies[0]["expiry"] == 1900000000
+    assert browser.storage == {"userLocation": '{"lat": 12.97}'}
+
+
+def test_expired_or_corrupt_sessions_are_ignored(tmp_path, monkeypatch):
+    path = tmp_path / "session.json"
+    store = SessionStore(str(path), max_age=60)
+    store.save(BrowserStub(COOKIES))
+    now = json.loads(path.read_text())["saved_at"]
+    monkeypatch.setattr(session_store.time, "time", lambda: now + 61)
+    assert store.load() is None
+    assert not store.restore(BrowserStub(), "http://127.0.0.1:8000")
+
+    path.write_text("{not json")
+    assert store.load() is None
+    store.clear()
+    assert not path.exists()
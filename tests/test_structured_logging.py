@@ -0,0 +1,85 @@
+import json
+import logging
+import sys
+import threading
+
+import pytest
+
+import structured_logging
+from structured_logging import (DebugSampler, JsonFormatter, clear_log_context, configure_logging, set_log_context,
+                                shutdown_logging)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Route logging to a JSON-lines file for one test, then put the root logger back"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield tmp_path / "run.log"
+    shutdown_logging()
+    clear_log_context()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_json_formatter_includes_context_duration_and_exception():
+    record = logging.makeLogRecord({"name": "swiggy", "levelno": logging.ERROR, "levelname": "ERROR",
+                                    "msg": "Failed: %s", "args": ("select",), "threadName": "browser-1",
+                                    "run_id": "abc123", "step": "select", "job_id": None, "duration": 1.5})
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record.exc_info = sys.exc_info()
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "Failed: select"
+    assert (entry["run_id"], entry["step"], entry["duration"], entry["thread"]) == ("abc123", "select", 1.5, "browser-1")
+    assert "job_id" not in entry
+    assert "RuntimeError: boom" in entry["exception"]
+
+
+def test_debug_sampler_drops_only_debug_records(monkeypatch):
+    sampler = DebugSampler(0.25)
+    debug = logging.makeLogRecord({"levelno": logging.DEBUG})
+    info = logging.makeLogRecord({"levelno": logging.INFO})
+    monkeypatch.setattr(structured_logging.random, "random", lambda: 0.5)
+    assert not sampler.filter(debug)
+    assert sampler.filter(info)
+    monkeypatch.setattr(structured_logging.random, "random", lambda: 0.1)
+    assert sampler.filter(debug)
+
+
+def test_records_carry_the_logging_threads_context_and_are_flushed_on_shutdown(log_file):
+    configure_logging(str(log_file), console=False)
+    set_log_context(run_id="run-1", step="open")
+
+    def other_thread():
+        set_log_context(job_id=7)
+        logging.info("from a worker")
+
+    thread = threading.Thread(target=other_thread, name="browser-2")
+    thread.start()
+    thread.join()
+    logging.info("Completed: open", extra={"duration": 0.25})
+    logging.debug("not logged below INFO")
+    shutdown_logging()
+
+    worker, main = read_lines(log_file)
+    assert (worker["message"], worker["job_id"], worker["thread"]) == ("from a worker", 7, "browser-2")
+    assert "run_id" not in worker
+    assert (main["run_id"], main["step"], main["duration"]) == ("run-1", "open", 0.25)
+
+
+def test_debug_sample_rate_enables_sampled_debug_records(log_file, monkeypatch):
+    monkeypatch.setattr(structured_logging.random, "random", iter([0.05, 0.9]).__next__)
+    configure_logging(str(log_file), console=False, debug_sample_rate=0.1)
+    logging.debug("kept")
+    logging.debug("dropped")
+    shutdown_logging()
+    assert [entry["message"] for entry in read_lines(log_file)] == ["kept"]
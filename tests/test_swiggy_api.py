@@ -0,0 +1,47 @@
+import pytest
+
+from mock_swiggy import MOCK_RESTAURANTS
+from swiggy_api import match_score, normalize_name, pick_restaurant
+
+RESTAURANTS = [{"name": restaurant["name"], "id": restaurant["id"]} for restaurant in MOCK_RESTAURANTS]
+
+
+def test_normalize_name():
+    assert normalize_name("  Domino’s   PIZZA ") == "dominos pizza"
+    assert normalize_name("Café Coffee Day") == "cafe coffee day"
+    assert normalize_name("Fish & Chips") == "fish and chips"
+
+
+def test_exact_beats_containing_name():
+    assert match_score("Chandrika Grand", "chandrika grand") == 1.0
+    assert 0.8 < match_score("Chandrika Grand Express", "Chandrika Grand") < 1.0
+    assert pick_restaurant(RESTAURANTS, "Chandrika Grand")["id"] == "10001"
+    assert pick_restaurant(list(reversed(RESTAURANTS)), "Chandrika Grand")["id"] == "10001"
+    assert pick_restaurant(RESTAURANTS, "chandrika grand express")["id"] == "10002"
+
+
+def test_containment_must_be_on_word_boundaries():
+    assert match_score("Meghana Foods", "Meghana") > 0.8
+    # "grand" inside "grandeur" is not the name "Chandrika Grand"
+    assert match_score("Chandrika Grandeur", "Chandrika Grand") < 0.8
+
+
+def test_fuzzy_match_tolerates_typos():
+    assert pick_restaurant(RESTAURANTS, "Meghna Foods")["id"] == "10004"
+    assert pick_restaurant(RESTAURANTS, "Dominos")["id"] == "10003"
+    assert pick_restaurant(RESTAURANTS, "Truffles") is None
+
+
+def test_close_partial_matches_are_ambiguous(caplog):
+    assert pick_restaurant(RESTAURANTS, "Chandrika") is None
+    assert "matches several restaurants" in caplog.text
+
+
+def test_duplicate_exact_names_take_the_first_result():
+    branches = [{"name": "Meghana Foods", "id": "1"}, {"name": "Meghana Foods", "id": "2"}]
+    assert pick_restaurant(branches, "meghana foods")["id"] == "1"
+
+
+@pytest.mark.parametrize("restaurants", [[], [{"name": "", "id": "1"}]])
+def test_nothing_to_match(restaurants):
+    assert pick_restaurant(restaurants, "Chandrika Grand") is None
@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from timeout_store import MIN_LEARNED_TIMEOUT, MIN_SAMPLES, TimeoutStore
+from tracing import percentile
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TimeoutStore(str(tmp_path / "learned_timeouts.json"))
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile(list(range(101)), 95) == pytest.approx(95)
+
+
+def test_ceiling_until_enough_samples(store):
+    for _ in range(MIN_SAMPLES - 1):
+        store.record("search/element: search input", 0.5, timed_out=False)
+    assert store.timeout("search/element: search input", 10) == 10
+    store.record("search/element: search input", 0.5, timed_out=False)
+    assert store.timeout("search/element: search input", 10) == pytest.approx(0.5 * 2 + 0.5)
+
+
+def test_learned_timeout_is_p95_based_floored_and_capped(store):
+    for elapsed in [0.5] * 19 + [3.0]:
+        store.record("slow", elapsed, timed_out=False)
+    assert store.timeout("slow", 30) == pytest.approx(percentile([0.5] * 19 + [3.0], 95) * 2 + 0.5)
+    assert store.timeout("slow", 1.2) == 1.2
+
+    for _ in range(MIN_SAMPLES):
+        store.record("fast", 0.01, timed_out=False)
+    assert store.timeout("fast", 10) == MIN_LEARNED_TIMEOUT
+
+
+def test_timeout_falls_back_to_ceiling_until_next_success(store):
+    for _ in range(MIN_SAMPLES):
+        store.record("key", 0.5, timed_out=False)
+    store.record("key", 1.5, timed_out=True)
+    assert store.timeout("key", 10) == 10
+    store.record("key", 0.5, timed_out=False)
+    assert store.timeout("key", 10) == pytest.approx(1.5)
+
+
+def test_save_and_reload(store, tmp_path):
+    for _ in range(MIN_SAMPLES):
+        store.record("key", 0.5, timed_out=False)
+    store.save()
+    assert TimeoutStore(store.path).timeout("key", 10) == pytest.approx(1.5)
+
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / "learned_timeouts.json"
+    path.write_text("{not json")
+    assert TimeoutStore(str(path)).keys == {}
+
+
+def wait_timeout(automation, **kwargs):
+    automation.wait_until(lambda driver: True, "element", "target", timeout=10, **kwargs)
+    return automation.tracer.spans[-1].attrs["timeout"]
+
+
+@pytest.mark.parametrize("step, kwargs, expected", [
+    ("search", {}, MIN_LEARNED_TIMEOUT),
+    ("search", {"learned_timeout": False}, 10),
+    ("login", {}, 10),
+    ("location", {}, 10),
+])
+def test_wait_applies_learned_timeout_only_where_a_miss_is_retried(automation, step, kwargs, expected):
+    for _ in range(MIN_SAMPLES):
+        automation.timeout_store.record(f"{step}/element: target", 0.01, timed_out=False)
+    automation.current_step = step
+    assert wait_timeout(automation, **kwargs) == expected
+
+
+def test_store_file_is_json(store):
+    store.record("key", 0.5, timed_out=False)
+    store.save()
+    with open(store.path) as f:
+        assert json.load(f)["key"]["samples"] == [0.5]
@@ -0,0 +1,58 @@
+import json
+import threading
+
+import pytest
+
+from tracing import Tracer, format_summary, load_spans, summarize
+
+
+def test_spans_nest_per_thread_and_record_failures():
+    tracer = Tracer()
+    with tracer.span("Opening Swiggy", "step") as step:
+        with tracer.span("wait: document ready", "wait") as wait:
+            pass
+        with pytest.raises(RuntimeError):
+            with tracer.span("click: sign in", "click"):
+                raise RuntimeError("intercepted")
+
+        def worker():
+            with tracer.span("job", "step"):
+                pass
+
+        thread = threading.Thread(target=worker, name="browser-1")
+        thread.start()
+        thread.join()
+
+    spans = {span.name: span for span in tracer.spans}
+    assert (wait.parent, wait.depth) == (step, 1)
+    assert spans["click: sign in"].ok is False and step.ok is True
+    # Another thread's spans start their own tree
+    assert spans["job"].parent is None and spans["job"].thread == "browser-1"
+    assert [name for name, _ in tracer.step_durations()] == ["job", "Opening Swiggy"]
+
+
+def test_export_writes_chrome_trace_and_appends_spans(tmp_path):
+    tracer = Tracer()
+    for _ in range(2):
+        tracer.reset()
+        with tracer.span("Searching", "step", query="dosa"):
+            with tracer.span("wait: search results", "wait"):
+                pass
+        tracer.export(str(tmp_path))
+
+    trace = json.loads((tmp_path / f"trace-{tracer.run_id}.json").read_text())
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert [event["name"] for event in events] == ["wait: search results", "Searching"]
+    outer, inner = events[1], events[0]
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"] + 1
+    assert outer["args"] == {"query": "dosa", "ok": True}
+    assert any(event["ph"] == "M" and event["args"]["name"] == "MainThread" for event in trace["traceEvents"])
+
+    spans = load_spans([str(tmp_path / "spans.jsonl")])
+    assert len(spans) == 4 and len({span["run_id"] for span in spans}) == 2
+    parent_ids = {span["span_id"]: span["parent_id"] for span in spans}
+    waits = [span for span in spans if span["category"] == "wait"]
+    assert all(parent_ids[span["span_id"]] for span in waits)
+    summary = summarize(spans)
+    assert summary["Searching"]["count"] == 2
+    assert format_summary(summary).splitlines()[1].startswith("Searching")
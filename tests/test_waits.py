@@ -0,0 +1,97 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import swiggy_automation
+from swiggy_automation import NETWORK_HOOKS_JS, NETWORK_MONITOR_JS, POLL_INTERVAL
+
+
+class FakeClock:
+    """Replaces the time module for WebDriverWait and wait_until; sleeping only advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = 0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps += 1
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("selenium.webdriver.support.wait.time", clock)
+    monkeypatch.setattr(swiggy_automation, "time", clock)
+    return clock
+
+
+class ScriptedPage:
+    """Answers each execute_script call with the next scripted value, repeating the last one"""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        return self.answers.pop(0) if len(self.answers) > 1 else self.answers[0]
+
+
+class CdpDriver:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.commands = []
+
+    def execute_cdp_cmd(self, command, params):
+        if self.fail:
+            raise WebDriverException("CDP unavailable")
+        self.commands.append((command, params))
+
+
+def test_network_hooks_are_installed_on_new_documents(automation):
+    automation.driver = CdpDriver()
+    automation.install_network_monitor()
+    assert automation.driver.commands == [("Page.addScriptToEvaluateOnNewDocument", {"source": NETWORK_HOOKS_JS})]
+
+
+def test_network_monitor_falls_back_to_installing_on_first_poll(automation, clock):
+    automation.driver = CdpDriver(fail=True)
+    automation.install_network_monitor()
+    assert automation.driver.commands == []
+
+    busy = {"pending": 1, "idleFor": 0, "resources": 3, "sinceLastResource": 0}
+    idle = {"pending": 0, "idleFor": 600, "resources": 3, "sinceLastResource": 600}
+    automation.driver = ScriptedPage(busy, idle)
+    assert automation.wait_for_network_idle()
+    # Every poll carries the hooks, so the first one installs them on a page that lacks them
+    assert automation.driver.scripts == [NETWORK_MONITOR_JS] * 2
+
+
+def test_wait_until_polls_until_the_condition_holds(automation, clock):
+    automation.page_load_strategy = "normal"
+    automation.driver = ScriptedPage("loading", "interactive", "complete")
+    assert automation.wait_for_page_ready()
+    assert len(automation.driver.scripts) == 3
+    assert clock.sleeps == 2
+    assert clock.now == pytest.approx(1000.0 + 2 * POLL_INTERVAL)
+
+
+def test_wait_until_returns_the_first_truthy_result_without_sleeping(automation, clock):
+    automation.driver = ScriptedPage({"index": 0})
+    assert automation.wait_until(lambda d: d.execute_script("probe"), "element", "probe") == {"index": 0}
+    assert clock.sleeps == 0
+
+
+def test_wait_until_gives_up_at_the_timeout(automation, clock):
+    automation.driver = ScriptedPage(True)
+    assert automation.wait_for_spinner_gone(timeout=2) is False
+    assert clock.now - 1000.0 == pytest.approx(2 + POLL_INTERVAL, abs=POLL_INTERVAL)
+    # The timed-out wait is recorded for the learned timeout
+    stats = automation.timeout_store.keys["run/spinner: loading indicators to disappear"]
+    assert stats["timeouts"] == 1
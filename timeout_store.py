@@ -0,0 +1,77 @@
+from json_store import JsonStore
+from tracing import percentile
+
+# Default on-disk location of the learned timeouts
+TIMEOUTS_FILE = "learned_timeouts.json"
+
+# Latest successful wait durations kept per key
+TIMEOUT_WINDOW = 50
+
+# A learned timeout is this percentile of recent durations, times the margin, plus the padding
+TIMEOUT_PERCENTILE = 95
+TIMEOUT_MARGIN = 2.0
+TIMEOUT_PADDING = 0.5
+
+# Never learn a timeout shorter than this, nor from fewer samples than this
+MIN_LEARNED_TIMEOUT = 1.0
+MIN_SAMPLES = 5
+
+
+class TimeoutStore(JsonStore):
+    """Rolling per-key wait durations persisted between runs, used to derive tighter timeouts"""
+
+    description = "learned timeouts"
+
+    def __init__(self, path=TIMEOUTS_FILE):
+        super().__init__(path)
+
+    def restore(self, data):
+        self.keys = data or {}
+
+    def snapshot(self):
+        return self.keys
+
+    def _entry(self, key):
+        return self.keys.setdefault(key, {"samples": [], "timeouts": 0, "consecutive_timeouts": 0})
+
+    def _learned(self, entry):
+        if len(entry["samples"]) < MIN_SAMPLES or entry["consecutive_timeouts"]:
+            # Too little history, or the last wait ran out: the learned value cannot be trusted
+            return None
+        high = percentile(entry["samples"], TIMEOUT_PERCENTILE)
+        return max(MIN_LEARNED_TIMEOUT, high * TIMEOUT_MARGIN + TIMEOUT_PADDING)
+
+    def timeout(self, key, ceiling):
+        """The timeout to use for key: the learned value, capped at the configured ceiling"""
+        with self.lock:
+            entry = self.keys.get(key)
+            learned = self._learned(entry) if entry else None
+        return min(ceiling, learned) if learned is not None else ceiling
+
+    def record(self, key, elapsed, timed_out):
+        """Record one wait: how long it took, and whether it ran out of time"""
+        with self.lock:
+            entry = self._entry(key)
+            if timed_out:
+                entry["timeouts"] += 1
+                entry["consecutive_timeouts"] += 1
+            else:
+                entry["consecutive_timeouts"] = 0
+                entry["samples"] = (entry["samples"] + [round(elapsed, 4)])[-TIMEOUT_WINDOW:]
+            self.dirty = True
+
+    def format_stats(self):
+        """Render the learned timeouts as a text table"""
+        if not self.keys:
+            return f"No wait durations recorded in {self.path}"
+        lines = [f"{'WAIT':<60} {'SAMPLES':>7} {'P95':>8} {'LEARNED':>8} {'TIMEOUTS':>8}"]
+        with self.lock:
+            rows = [(key, dict(entry), self._learned(entry)) for key, entry in sorted(self.keys.items())]
+        for key, entry, learned in rows:
+            high = percentile(entry["samples"], TIMEOUT_PERCENTILE)
+            high_text = f"{high:.3f}s" if high is not None else "-"
+            learned_text = f"{learned:.2f}s" if learned is not None else "-"
+            lines.append(
+                f"{key[:60]:<60} {len(entry['samples']):>7} {high_text:>8} {learned_text:>8} {entry['timeouts']:>8}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,178 @@
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+# Spans from every run are appended here so percentiles can be computed across runs
+SPANS_FILE = "spans.jsonl"
+
+
+def percentile(values, pct):
+    """Linearly interpolated percentile (pct in 0-100) of a list of numbers"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class Span:
+    """One timed operation; attrs can be filled in while the span is open"""
+
+    def __init__(self, name, category, parent, depth, attrs):
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.depth = depth
+        self.attrs = attrs
+        self.span_id = uuid.uuid4().hex[:12]
+        self.thread = threading.current_thread().name
+        self.start = time.time()
+        self.duration = None
+        self.ok = True
+
+    def to_dict(self, run_id):
+        return {
+            "run_id": run_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "category": self.category,
+            "depth": self.depth,
+            "thread": self.thread,
+            "start": self.start,
+            "duration": self.duration,
+            "ok": self.ok,
+            "attrs": self.attrs,
+        }
+
+
+class Tracer:
+    """Collects nested timing spans for one automation run"""
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Start a new run: new run ID, no recorded spans"""
+        with self.lock:
+            self.run_id = uuid.uuid4().hex[:12]
+            self.spans = []
+
+    @contextmanager
+    def span(self, name, category, **attrs):
+        """Time the enclosed block as a child of the currently open span on this thread"""
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        parent = stack[-1] if stack else None
+        span = Span(name, category, parent, len(stack), attrs)
+        stack.append(span)
+        started = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            span.ok = False
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            stack.pop()
+            with self.lock:
+                self.spans.append(span)
+
+    def step_durations(self):
+        """Duration of every top-level step span recorded in this run"""
+        with self.lock:
+            return [(span.name, span.duration) for span in self.spans if span.category == "step"]
+
+    def step_results(self):
+        """Duration and outcome of every top-level step span recorded in this run"""
+        with self.lock:
+            return [(span.name, span.duration, span.ok) for span in self.spans if span.category == "step"]
+
+    def export_jsonl(self, path):
+        """Append this run's spans to a JSON-lines file"""
+        with self.lock:
+            records = [span.to_dict(self.run_id) for span in self.spans]
+        with open(path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+    def export_chrome_trace(self, path):
+        """Write this run's spans in Chrome trace-event format (open in chrome://tracing or Perfetto)"""
+        with self.lock:
+            spans = list(self.spans)
+        thread_ids = {}
+        events = []
+        for span in spans:
+            tid = thread_ids.setdefault(span.thread, len(thread_ids) + 1)
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": int(span.start * 1e6),
+                "dur": int(span.duration * 1e6),
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": dict(span.attrs, ok=span.ok),
+            })
+        for thread, tid in thread_ids.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": thread}})
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"run_id": self.run_id}}, f)
+
+    def export(self, trace_dir):
+        """Append spans to trace_dir/spans.jsonl and write a Chrome trace for this run"""
+        try:
+            os.makedirs(trace_dir, exist_ok=True)
+            self.export_jsonl(os.path.join(trace_dir, SPANS_FILE))
+            trace_path = os.path.join(trace_dir, f"trace-{self.run_id}.json")
+            self.export_chrome_trace(trace_path)
+            logging.info(f"Trace written to {trace_path}")
+        except OSError as e:
+            logging.warning(f"Could not export trace to {trace_dir}: {e}")
+
+
+def load_spans(paths):
+    """Read span records from one or more JSON-lines files"""
+    spans = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            spans.extend(json.loads(line) for line in f if line.strip())
+    return spans
+
+
+def summarize(spans, category="step"):
+    """Per-name count, p50, p95 and total time for spans of one category across runs"""
+    durations = {}
+    for span in spans:
+        if span["category"] == category:
+            durations.setdefault(span["name"], []).append(span["duration"])
+    return {
+        name: {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "total": sum(values),
+        }
+        for name, values in durations.items()
+    }
+
+
+def format_summary(summary):
+    """Render a summarize() result as a text table, most expensive first"""
+    if not summary:
+        return "No spans recorded"
+    lines = [f"{'NAME':<40} {'COUNT':>6} {'P50':>9} {'P95':>9} {'TOTAL':>10}"]
+    for name, stats in sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True):
+        lines.append(
+            f"{name[:40]:<40} {stats['count']:>6} {stats['p50']:>8.3f}s {stats['p95']:>8.3f}s {stats['total']:>9.2f}s"
+        )
+    return "\n".join(lines)